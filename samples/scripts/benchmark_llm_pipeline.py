@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+LLM 파이프라인 오프라인 벤치마크 스크립트
+기록된 LLM 픽스처(samples/data/llm_fixtures)를 재생 모드로 사용하고 Supabase 대신 메모리 DB를 주입하여
+실제 파이프라인 진입점(AI 분석 실행 → 캠페인 분석 → 인플루언서 매칭 → 제안서 생성)을 그대로 실행합니다.
+측정 시간에는 입력 전처리, 응답 파싱/변환, DB 저장(메모리)이 모두 포함됩니다.
+
+기록되지 않은 입력은 재생 모드에서 실패한 LLM 호출로 처리되므로 단계별 '미기록' 수로 따로 표시합니다.
+(--strict 지정 시 미기록 입력에서 바로 오류 발생)
+
+사용 예:
+    # 1) 실제 호출을 기록 (앱 실행 시 환경 변수 설정)
+    LLM_REPLAY_MODE=record streamlit run app.py
+
+    # 2) 기록된 픽스처로 파이프라인 전체 실행
+    python samples/scripts/benchmark_llm_pipeline.py --latency-scale 0
+
+    # 크롤링 원본 데이터(JSON 배열)로 메모리 DB를 채우려면
+    python samples/scripts/benchmark_llm_pipeline.py --crawling-data samples/data/crawling_rows.json
+"""
+
+import argparse
+import copy
+import json
+import logging
+import os
+import sys
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, PROJECT_ROOT)
+
+# 재생 모드는 대상 모듈 import 전에 설정
+os.environ["LLM_REPLAY_MODE"] = "replay"
+
+
+class InMemoryResponse:
+    """Supabase 응답 (data, count)"""
+
+    def __init__(self, data: List[Dict[str, Any]], count: Optional[int] = None):
+        self.data = data
+        self.count = count
+
+
+class InMemoryQuery:
+    """파이프라인이 사용하는 PostgREST 쿼리 빌더 부분 집합
+
+    select 컬럼은 구분하지 않고 행 전체를 반환합니다. (호출 측은 필요한 키만 읽음)
+    """
+
+    def __init__(self, db: "InMemorySupabase", table_name: str):
+        self.db = db
+        self.table_name = table_name
+        self.filters: List[Callable[[Dict[str, Any]], bool]] = []
+        self.orders: List[tuple] = []
+        self.offset = 0
+        self.row_limit: Optional[int] = None
+        self.count: Optional[str] = None
+        self.action = "select"
+        self.payload: Any = None
+
+    def select(self, *columns, count: Optional[str] = None):
+        self.count = count
+        return self
+
+    def eq(self, column: str, value: Any):
+        self.filters.append(lambda row: row.get(column) == value)
+        return self
+
+    def neq(self, column: str, value: Any):
+        self.filters.append(lambda row: row.get(column) != value)
+        return self
+
+    def in_(self, column: str, values: List[Any]):
+        values = set(values)
+        self.filters.append(lambda row: row.get(column) in values)
+        return self
+
+    def gte(self, column: str, value: Any):
+        self.filters.append(lambda row: row.get(column) is not None and row.get(column) >= value)
+        return self
+
+    def lte(self, column: str, value: Any):
+        self.filters.append(lambda row: row.get(column) is not None and row.get(column) <= value)
+        return self
+
+    def order(self, column: str, desc: bool = False):
+        self.orders.append((column, desc))
+        return self
+
+    def limit(self, size: int):
+        self.row_limit = size
+        return self
+
+    def range(self, start: int, end: int):
+        self.offset = start
+        self.row_limit = end - start + 1
+        return self
+
+    def update(self, data: Dict[str, Any]):
+        self.action, self.payload = "update", data
+        return self
+
+    def insert(self, data: Any):
+        self.action, self.payload = "insert", data
+        return self
+
+    def upsert(self, data: Any):
+        self.action, self.payload = "upsert", data
+        return self
+
+    def _matches(self, row: Dict[str, Any]) -> bool:
+        return all(f(row) for f in self.filters)
+
+    def execute(self) -> InMemoryResponse:
+        rows = self.db.rows(self.table_name)
+
+        if self.action in ("insert", "upsert"):
+            payload = self.payload if isinstance(self.payload, list) else [self.payload]
+            saved = [self.db.write(self.table_name, item, upsert=self.action == "upsert") for item in payload]
+            return InMemoryResponse(saved)
+
+        matched = [row for row in rows if self._matches(row)]
+        if self.action == "update":
+            for row in matched:
+                row.update(copy.deepcopy(self.payload))
+            return InMemoryResponse([dict(row) for row in matched])
+
+        # 정렬 키는 뒤에서부터 적용 (앞쪽 order가 우선)
+        for column, desc in reversed(self.orders):
+            matched.sort(key=lambda row: (row.get(column) is None, row.get(column) or ""), reverse=desc)
+        total = len(matched)
+        end = None if self.row_limit is None else self.offset + self.row_limit
+        data = [copy.deepcopy(row) for row in matched[self.offset:end]]
+        return InMemoryResponse(data, total if self.count else None)
+
+
+class InMemorySupabase:
+    """Supabase 클라이언트 대체용 메모리 DB (테이블명 → 행 목록)"""
+
+    # supabase/db/latest_ai_analysis.sql 뷰와 같은 기준으로 원본 테이블에서 계산
+    LATEST_AI_ANALYSIS_VIEW = "latest_ai_analysis"
+
+    def __init__(self):
+        self.tables: Dict[str, List[Dict[str, Any]]] = {}
+
+    def table(self, name: str) -> InMemoryQuery:
+        return InMemoryQuery(self, name)
+
+    def rows(self, name: str) -> List[Dict[str, Any]]:
+        if name == self.LATEST_AI_ANALYSIS_VIEW:
+            latest: Dict[tuple, Dict[str, Any]] = {}
+            for row in self.tables.get("ai_influencer_analyses_new", []):
+                key = (row.get("platform"), row.get("alias"))
+                if key not in latest or (row.get("analyzed_at") or "") > (latest[key].get("analyzed_at") or ""):
+                    latest[key] = row
+            return list(latest.values())
+        return self.tables.setdefault(name, [])
+
+    def write(self, name: str, item: Dict[str, Any], upsert: bool = False) -> Dict[str, Any]:
+        rows = self.rows(name)
+        item = copy.deepcopy(item)
+        if upsert and "id" in item:
+            for row in rows:
+                if row.get("id") == item["id"]:
+                    row.update(item)
+                    return dict(row)
+        item.setdefault("id", str(uuid.uuid4()))
+        rows.append(item)
+        return dict(item)
+
+
+def parse_campaign_content(content: str) -> Dict[str, Any]:
+    """analyze_campaign이 구성한 캠페인 내용 문자열을 캠페인 딕셔너리로 복원"""
+    fields = {
+        "캠페인명": "campaign_name",
+        "설명": "campaign_description",
+        "타입": "campaign_type",
+        "지시사항": "campaign_instructions",
+        "태그": "tags",
+    }
+    campaign = {}
+    for line in content.strip().splitlines():
+        label, _, value = line.partition(": ")
+        if label in fields:
+            campaign[fields[label]] = value
+    return campaign
+
+
+def load_crawling_rows(path: Optional[str]) -> List[Dict[str, Any]]:
+    """메모리 DB에 넣을 크롤링 데이터
+
+    - path 지정 시: tb_instagram_crawling 행을 내보낸 JSON 배열
+    - 미지정 시: perform_ai_analysis 픽스처에 기록된 입력(id, description, posts)
+    """
+    from src.utils.llm_replay import iter_fixtures
+
+    if path:
+        with open(path, "r", encoding="utf-8") as f:
+            rows = json.load(f)
+    else:
+        rows = []
+        for fixture in iter_fixtures("perform_ai_analysis"):
+            args = fixture.get("args") or [{}]
+            rows.append({key: args[0].get(key) for key in ("id", "description", "posts")})
+    for row in rows:
+        row.setdefault("status", "COMPLETE")
+    return rows
+
+
+def run_stage(name: str, func: Callable[[], Any]) -> Dict[str, Any]:
+    """파이프라인 단계 1개 실행 (소요 시간과 LLM 재생 적중/미기록 수 집계)"""
+    from src.utils.llm_replay import get_replay_stats, reset_replay_stats
+
+    reset_replay_stats()
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    stats = get_replay_stats()
+    return {
+        "stage": name,
+        "elapsed_s": elapsed,
+        "hits": sum(s["hits"] for s in stats.values()),
+        "misses": sum(s["misses"] for s in stats.values()),
+        "result": result,
+    }
+
+
+def run_pipeline(crawling_rows: List[Dict[str, Any]], campaigns: List[Dict[str, Any]],
+                 required_count: int) -> List[Dict[str, Any]]:
+    """메모리 DB를 새로 만들어 파이프라인 전체를 1회 실행"""
+    import streamlit as st
+    from src.supabase.simple_client import simple_client
+    from src.ui import influencer_matching_components as matching
+    from src.ui.ai_analysis_execution import execute_ai_analysis
+
+    # streamlit bare 모드 경고(ScriptRunContext 없음) 숨김 (streamlit이 import 시 로거별 레벨을 지정하므로 import 후 설정)
+    for logger_name in list(logging.root.manager.loggerDict):
+        if logger_name.startswith("streamlit"):
+            logging.getLogger(logger_name).setLevel(logging.ERROR)
+
+    db = InMemorySupabase()
+    db.tables["tb_instagram_crawling"] = copy.deepcopy(crawling_rows)
+    saved_campaign_analyses: Dict[str, Any] = {}
+
+    # Supabase 클라이언트와 캠페인 분석 저장(Edge Function)을 메모리 DB로 대체
+    simple_client.get_client = lambda: db
+    matching.save_campaign_analysis_to_db = \
+        lambda campaign_id, analysis_result: saved_campaign_analyses.__setitem__(campaign_id, analysis_result) or True
+
+    st.session_state["ai_analysis_stop_requested"] = False
+    results = [run_stage("AI 분석 실행", execute_ai_analysis)]
+
+    for index, campaign in enumerate(campaigns):
+        campaign = {"id": f"benchmark-campaign-{index + 1}", **campaign}
+        st.session_state.pop("campaign_analysis_result", None)
+        st.session_state.pop("matched_influencers", None)
+
+        results.append(run_stage(f"캠페인 분석 #{index + 1}", lambda: matching.analyze_campaign(campaign, force_reanalyze=True)))
+        if not st.session_state.get("campaign_analysis_result"):
+            continue
+        results.append(run_stage(f"매칭 #{index + 1}", lambda: matching.match_influencers(required_count)))
+        if st.session_state.get("matched_influencers"):
+            results.append(run_stage(f"제안서 생성 #{index + 1}", lambda: matching.generate_proposals(campaign)))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM 파이프라인 오프라인 벤치마크")
+    parser.add_argument("--repeat", type=int, default=1, help="파이프라인 반복 횟수 (매 회 메모리 DB 초기화)")
+    parser.add_argument("--required-count", type=int, default=10, help="매칭 시 필요 인플루언서 수")
+    parser.add_argument("--crawling-data", default=None, help="tb_instagram_crawling 행 JSON 배열 (기본: 픽스처 입력)")
+    parser.add_argument("--fixtures", default=None, help="픽스처 폴더 (기본: samples/data/llm_fixtures)")
+    parser.add_argument("--latency-ms", type=float, default=None, help="고정 합성 지연(ms), 미지정 시 기록된 지연 사용")
+    parser.add_argument("--latency-scale", type=float, default=None, help="지연 배율 (0이면 지연 없이 파이프라인 자체 시간만 측정)")
+    parser.add_argument("--jitter-ms", type=float, default=None, help="결정적 ±지터(ms)")
+    parser.add_argument("--strict", action="store_true", help="기록되지 않은 입력에서 바로 오류 발생")
+    args = parser.parse_args()
+
+    if args.fixtures:
+        os.environ["LLM_REPLAY_DIR"] = args.fixtures
+    if args.latency_ms is not None:
+        os.environ["LLM_REPLAY_LATENCY_MS"] = str(args.latency_ms)
+    if args.latency_scale is not None:
+        os.environ["LLM_REPLAY_LATENCY_SCALE"] = str(args.latency_scale)
+    if args.jitter_ms is not None:
+        os.environ["LLM_REPLAY_JITTER_MS"] = str(args.jitter_ms)
+    if args.strict:
+        os.environ["LLM_REPLAY_STRICT"] = "1"
+    # 재생 모드에서는 실제 API를 호출하지 않지만 진입점의 API 키 확인은 통과해야 함
+    os.environ.setdefault("OPENAI_API_KEY", "llm-replay")
+
+    from src.utils.llm_replay import iter_fixtures, get_fixture_dir
+
+    crawling_rows = load_crawling_rows(args.crawling_data)
+    campaigns = [
+        parse_campaign_content((fixture.get("args") or [""])[0])
+        for fixture in iter_fixtures("analyze_campaign_with_gemini")
+    ]
+    if not crawling_rows and not campaigns:
+        print(f"❌ {get_fixture_dir()}에 기록된 픽스처가 없습니다. LLM_REPLAY_MODE=record로 먼저 기록하세요.")
+        sys.exit(1)
+
+    print(f"📼 크롤링 데이터 {len(crawling_rows)}개, 캠페인 {len(campaigns)}개 x {args.repeat}회 실행")
+    print(f"{'회차':>4} {'단계':<16} {'소요(s)':>9} {'재생':>6} {'미기록':>6}")
+    total_misses = 0
+    for run in range(1, args.repeat + 1):
+        for r in run_pipeline(crawling_rows, campaigns, args.required_count):
+            total_misses += r["misses"]
+            print(f"{run:>4} {r['stage']:<16} {r['elapsed_s']:>9.2f} {r['hits']:>6} {r['misses']:>6}")
+            if isinstance(r["result"], dict) and "analyzed_count" in r["result"]:
+                res = r["result"]
+                print(f"{'':>4} └ 성공 {res.get('analyzed_count', 0)}, 건너뜀 {res.get('skipped_count', 0)}, "
+                      f"실패 {res.get('failed_count', 0)}")
+
+    if total_misses:
+        print(f"⚠️ 기록되지 않은 LLM 입력 {total_misses}건은 실패한 호출로 처리되어 측정값에 실제 응답 처리 시간이 빠져 있습니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+LLM 호출 재생 하네스 데모 스크립트
+기록된 LLM 픽스처(samples/data/llm_fixtures)를 네트워크 없이 재생하여
+동시성 수준별로 재생 하네스가 동작하는지 확인합니다.
+
+주의: 재생 모드에서는 기록된 응답과 합성 지연(sleep)만 반환하므로
+측정값은 전처리/파싱/DB 저장 등 실제 파이프라인 성능이 아닙니다.
+(파이프라인 전체 측정은 benchmark_llm_pipeline.py 사용)
+
+사용 예:
+    # 1) 실제 호출을 기록 (앱 실행 시 환경 변수 설정)
+    LLM_REPLAY_MODE=record streamlit run app.py
+
+    # 2) 기록된 호출을 동시성 1/4/8로 재생
+    python samples/scripts/replay_llm_fixtures.py --function perform_ai_analysis --concurrency 1,4,8
+"""
+
+import argparse
+import os
+import sys
+import time
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, PROJECT_ROOT)
+
+# 재생 모드는 대상 모듈 import 전에 설정
+os.environ["LLM_REPLAY_MODE"] = "replay"
+
+
+def load_target(function_name: str) -> Callable:
+    """재생 대상 함수 로드"""
+    if function_name == "perform_ai_analysis":
+        from src.ui.ai_analysis_common import perform_ai_analysis
+        return perform_ai_analysis
+    from src.utils import gemini_client
+    return getattr(gemini_client, function_name)
+
+
+def run_benchmark(func: Callable, fixtures: List[Dict[str, Any]], concurrency: int, repeat: int) -> Dict[str, Any]:
+    """동시성 수준 1개에 대한 픽스처 재생 (픽스처 키가 맞지 않아 재생되지 않은 호출은 미기록으로 따로 집계)"""
+    from src.utils.llm_replay import get_replay_stats, reset_replay_stats
+
+    reset_replay_stats()
+    calls = [(f.get("args", []), f.get("kwargs", {})) for f in fixtures] * repeat
+    latencies = []
+
+    def _call(call):
+        args, kwargs = call
+        started = time.perf_counter()
+        func(*args, **kwargs)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(_call, calls))
+    elapsed = time.perf_counter() - started
+    stats = get_replay_stats()
+
+    return {
+        "concurrency": concurrency,
+        "calls": len(calls),
+        "replayed": sum(s["hits"] for s in stats.values()),
+        "missed": sum(s["misses"] for s in stats.values()),
+        "elapsed_s": elapsed,
+        "throughput": len(calls) / elapsed if elapsed > 0 else 0,
+        "p50_ms": statistics.median(latencies) if latencies else 0,
+        "max_ms": max(latencies) if latencies else 0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM 호출 재생 하네스 데모")
+    parser.add_argument("--function", default="perform_ai_analysis",
+                        choices=["perform_ai_analysis", "generate_proposal_with_openai",
+                                 "generate_proposal_with_gemini", "analyze_campaign_with_gemini"],
+                        help="재생할 LLM 호출 함수")
+    parser.add_argument("--concurrency", default="1,4,8", help="쉼표로 구분된 동시성 수준")
+    parser.add_argument("--repeat", type=int, default=1, help="픽스처 반복 횟수")
+    parser.add_argument("--fixtures", default=None, help="픽스처 폴더 (기본: samples/data/llm_fixtures)")
+    parser.add_argument("--latency-ms", type=float, default=None, help="고정 합성 지연(ms), 미지정 시 기록된 지연 사용")
+    parser.add_argument("--latency-scale", type=float, default=None, help="지연 배율")
+    parser.add_argument("--jitter-ms", type=float, default=None, help="결정적 ±지터(ms)")
+    args = parser.parse_args()
+
+    if args.fixtures:
+        os.environ["LLM_REPLAY_DIR"] = args.fixtures
+    if args.latency_ms is not None:
+        os.environ["LLM_REPLAY_LATENCY_MS"] = str(args.latency_ms)
+    if args.latency_scale is not None:
+        os.environ["LLM_REPLAY_LATENCY_SCALE"] = str(args.latency_scale)
+    if args.jitter_ms is not None:
+        os.environ["LLM_REPLAY_JITTER_MS"] = str(args.jitter_ms)
+
+    from src.utils.llm_replay import iter_fixtures, get_fixture_dir
+
+    fixtures = list(iter_fixtures(args.function))
+    if not fixtures:
+        print(f"❌ {get_fixture_dir()}/{args.function}에 기록된 픽스처가 없습니다. LLM_REPLAY_MODE=record로 먼저 기록하세요.")
+        sys.exit(1)
+
+    func = load_target(args.function)
+    print(f"📼 {args.function}: 픽스처 {len(fixtures)}개 x {args.repeat}회 재생")
+    print(f"{'동시성':>6} {'호출':>6} {'재생':>6} {'미기록':>6} {'소요(s)':>9} {'처리량(/s)':>11} {'p50(ms)':>9} {'max(ms)':>9}")
+    for level in [int(c) for c in args.concurrency.split(",") if c.strip()]:
+        r = run_benchmark(func, fixtures, level, args.repeat)
+        print(f"{r['concurrency']:>6} {r['calls']:>6} {r['replayed']:>6} {r['missed']:>6} {r['elapsed_s']:>9.2f} "
+              f"{r['throughput']:>11.2f} {r['p50_ms']:>9.1f} {r['max_ms']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
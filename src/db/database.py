@@ -4,6 +4,41 @@ from datetime import datetime
 from ..supabase.simple_client import simple_client
 from ..supabase.auth import supabase_auth
 from .models import Campaign, Influencer, CampaignInfluencer, CampaignInfluencerParticipation, PerformanceMetric
+from ..utils.influencer_search_index import InfluencerSearchIndex
+from ..utils.entity_cache import BatchedEntityCache, group_by
+
+# 대량 저장 후 초기화할 세션 캐시 키
+INFLUENCER_CACHE_KEYS = [
+    "influencers_data",
+    "influencer_page_cache",
+    "manager_filtered_influencers",
+    "campaign_participation_cache",
+    "all_participation_influencer_ids",
+    "participation_count_cache",
+    "influencer_stats_snapshot",
+]
+PARTICIPATION_CACHE_KEYS = [
+    "participations_cache",
+    "participation_index",
+    "campaign_participation_cache",
+    "all_participation_influencer_ids",
+    "participation_count_cache",
+]
+
+# 프로세스 공용 인플루언서 검색 인덱스 (ID만 보관, 실제 행은 요청 사용자 권한으로 재조회)
+influencer_search_index = InfluencerSearchIndex(simple_client.get_influencer_search_rows)
+
+# 프로세스 공용 ID 단위 캐시 (성과 리포트): 캠페인 ID → 참여 목록, 참여 ID → 콘텐츠 목록
+# 참여/콘텐츠 쓰기 메서드에서 변경된 ID를 무효화 (ID를 알 수 없으면 전체 무효화)
+participations_cache = BatchedEntityCache(
+    lambda campaign_ids: group_by(simple_client.get_participations_by_campaign_ids(campaign_ids), "campaign_id"),
+    ttl=300, default_factory=list
+)
+contents_cache = BatchedEntityCache(
+    lambda participation_ids: group_by(simple_client.get_contents_by_participation_ids(participation_ids), "participation_id"),
+    ttl=300, default_factory=list
+)
+
 
 class DatabaseManager:
     def __init__(self):
@@ -40,6 +75,11 @@ class DatabaseManager:
             "message": f"{operation} 중 오류가 발생했습니다: {error_msg}"
         }
     
+    def _invalidate_session_caches(self, keys: List[str]):
+        """대량 저장 후 세션 캐시를 한 번에 초기화"""
+        for key in keys:
+            st.session_state.pop(key, None)
+    
     # 캠페인 관련 메서드들
     def get_campaigns(self) -> List[Dict[str, Any]]:
         """사용자의 캠페인 목록 조회"""
@@ -49,6 +89,14 @@ class DatabaseManager:
             self._handle_error(e, "캠페인 조회")
             return []
     
+    def get_campaign_performance_rollups(self, campaign_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """캠페인 × 플랫폼별 성과 롤업 조회 (campaign_ids 미지정 시 전체)"""
+        try:
+            return simple_client.get_campaign_performance_rollups(campaign_ids)
+        except Exception as e:
+            self._handle_error(e, "캠페인 성과 롤업 조회")
+            return []
+    
     def create_campaign(self, campaign: Campaign) -> Dict[str, Any]:
         """새 캠페인 생성"""
         try:
@@ -95,14 +143,108 @@ class DatabaseManager:
             return self._handle_error(e, "캠페인 삭제")
     
     # 인플루언서 관련 메서드들
-    def get_influencers(self, platform: Optional[str] = None) -> List[Dict[str, Any]]:
+    def get_influencers(self, platform: Optional[str] = None, columns: str = "*") -> List[Dict[str, Any]]:
         """인플루언서 목록 조회"""
         try:
-            return simple_client.get_influencers(platform=platform)
+            return simple_client.get_influencers(platform=platform, columns=columns)
         except Exception as e:
             self._handle_error(e, "인플루언서 조회")
             return []
     
+    def get_influencer_group_stats(self) -> Optional[List[Dict[str, Any]]]:
+        """플랫폼 × 카테고리별 인플루언서 집계 (서버 집계, 실패 시 None)"""
+        try:
+            return simple_client.get_influencer_group_stats()
+        except Exception as e:
+            self._handle_error(e, "인플루언서 집계 조회")
+            return None
+    
+    def get_influencers_page(self, filters: Dict[str, Any], after: Optional[Dict[str, Any]] = None, page_size: int = 10, count: Optional[str] = "estimated") -> Dict[str, Any]:
+        """필터 조건으로 인플루언서 한 페이지 조회 (서버 필터 + keyset 페이지네이션)
+        
+        Args:
+            filters: {"platform", "content_category", "min_followers", "max_followers", "search_term"}
+            after: 이전 페이지의 next_cursor (첫 페이지는 None)
+        """
+        try:
+            return simple_client.get_influencers_page(
+                platform=filters.get("platform"),
+                content_category=filters.get("content_category"),
+                min_followers=filters.get("min_followers", 0),
+                max_followers=filters.get("max_followers"),
+                search_term=filters.get("search_term"),
+                after=after,
+                page_size=page_size,
+                count=count
+            )
+        except Exception as e:
+            self._handle_error(e, "인플루언서 페이지 조회")
+            return {"data": [], "next_cursor": None, "total_count": None}
+    
+    def search_influencers(self, search_term: str, platform: Optional[str] = None, limit: int = 20, fuzzy: bool = True) -> List[Dict[str, Any]]:
+        """SNS ID/별칭 순위 검색 (서버 트라이그램 RPC, 실패 시 인메모리 검색 인덱스 사용)"""
+        try:
+            results = simple_client.search_influencers(search_term, platform=platform, limit=limit, fuzzy=fuzzy)
+            if results is not None:
+                return results
+            return self.search_influencers_indexed(search_term, platform=platform, limit=limit, fuzzy=fuzzy)
+        except Exception as e:
+            self._handle_error(e, "인플루언서 검색")
+            return []
+    
+    def search_influencers_with_analysis(self, filters: Dict[str, Any], limit: Optional[int] = None) -> Optional[List[Dict[str, Any]]]:
+        """인플루언서 + 최신 AI 분석 서버 조인 검색
+        
+        Args:
+            filters: {"category", "tag_keywords", "min_followers", "max_followers",
+                      "overall_score_range", "growth_potential_range"}
+        Returns:
+            표시용 인플루언서 컬럼 + 최신 분석 점수(analysis_id, overall_score 등, 분석 없으면 None) 행 목록,
+            검색 RPC 호출 실패 시 None (결과 없음과 구분)
+        """
+        try:
+            return simple_client.search_influencers_with_analysis(
+                category=filters.get("category"),
+                tag_keywords=filters.get("tag_keywords"),
+                min_followers=filters.get("min_followers"),
+                max_followers=filters.get("max_followers"),
+                overall_score_range=filters.get("overall_score_range", (0.0, 10.0)),
+                growth_potential_range=filters.get("growth_potential_range", (0.0, 10.0)),
+                limit=limit
+            )
+        except Exception as e:
+            self._handle_error(e, "인플루언서 AI 분석 검색")
+            return None
+    
+    def search_influencers_indexed(self, search_term: str, platform: Optional[str] = None, limit: int = 20, fuzzy: bool = True) -> List[Dict[str, Any]]:
+        """검색 인덱스로 SNS ID/별칭 부분·오타 허용 검색
+        
+        Returns:
+            순위순 인플루언서 행 목록 (각 행에 search_match, search_score 추가)
+        """
+        try:
+            ranked = influencer_search_index.search(search_term, platform=platform, limit=limit, fuzzy=fuzzy)
+            if not ranked:
+                return []
+            rows = {str(row["id"]): row for row in simple_client.get_influencers_by_ids([r["id"] for r in ranked])}
+            results = []
+            for r in ranked:
+                row = rows.get(r["id"])
+                if row:  # 삭제되었거나 조회 권한이 없는 행은 제외
+                    results.append({**row, "search_match": r["match"], "search_score": r["score"]})
+            return results
+        except Exception as e:
+            self._handle_error(e, "인플루언서 인덱스 검색")
+            return []
+    
+    def get_influencer_platform_counts(self) -> Dict[str, int]:
+        """검색 인덱스 기준 플랫폼별 인플루언서 수"""
+        try:
+            return influencer_search_index.platform_counts()
+        except Exception as e:
+            self._handle_error(e, "플랫폼별 인플루언서 수 조회")
+            return {}
+    
     def get_influencer_info(self, platform: str, sns_id: str) -> Dict[str, Any]:
         """특정 인플루언서 정보 조회"""
         try:
@@ -115,6 +257,8 @@ class DatabaseManager:
         try:
             influencer_data = influencer.dict()
             result = simple_client.create_influencer(influencer_data)
+            if result.get("success"):
+                influencer_search_index.mark_stale()
             return result
         except Exception as e:
             return self._handle_error(e, "인플루언서 생성")
@@ -123,23 +267,88 @@ class DatabaseManager:
         """인플루언서 정보 업데이트"""
         try:
             result = simple_client.update_influencer(influencer_id, update_data)
+            if result.get("success"):
+                influencer_search_index.mark_stale()
             return result
         except Exception as e:
             return self._handle_error(e, "인플루언서 업데이트")
     
+    def bulk_update_influencers(self, updates: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """인플루언서 정보 일괄 업데이트
+        
+        Args:
+            updates: {influencer_id: update_data}
+        Returns:
+            {"success", "saved", "results": {influencer_id: {"success", "message"}}, "message"}
+        """
+        try:
+            result = simple_client.bulk_update_influencers(updates)
+            if result.get("saved"):
+                self._invalidate_session_caches(INFLUENCER_CACHE_KEYS)
+                influencer_search_index.mark_stale()
+            return result
+        except Exception as e:
+            return self._handle_error(e, "인플루언서 일괄 업데이트")
+    
+    def get_influencers_by_platform_sns_ids(self, keys: List[tuple]) -> List[Dict[str, Any]]:
+        """(platform, sns_id) 목록으로 인플루언서 일괄 조회"""
+        try:
+            return simple_client.get_influencers_by_platform_sns_ids(keys)
+        except Exception as e:
+            self._handle_error(e, "인플루언서 일괄 조회")
+            return []
+    
+    def get_influencers_by_sns_ids(self, sns_ids: List[str], platform: Optional[str] = None) -> List[Dict[str, Any]]:
+        """SNS ID 목록으로 인플루언서 일괄 조회 (platform 미지정 시 전체 플랫폼)"""
+        try:
+            return simple_client.get_influencers_by_sns_ids(sns_ids, platform=platform)
+        except Exception as e:
+            self._handle_error(e, "인플루언서 일괄 조회")
+            return []
+    
+    def bulk_import_influencers(self, influencers: List[Influencer], update_existing: bool = False,
+                                update_columns: Optional[List[set]] = None) -> Dict[str, Any]:
+        """인플루언서 일괄 등록 (기존 (platform, sns_id)는 일괄 조회로 중복 처리)
+        
+        Args:
+            influencers: 등록할 인플루언서 모델 목록 (업로드 파일에 있는 필드 + 신규 등록용 기본값만 지정된 모델)
+            update_existing: True면 이미 등록된 인플루언서를 업로드 값으로 업데이트
+                (지정되지 않은 필드는 모델 기본값으로 덮어쓰지 않도록 제외)
+            update_columns: 행별로 업데이트에 사용할 필드 집합 (None이면 지정된 필드 전체)
+        Returns:
+            {"success", "created", "updated", "duplicates", "failed", "results": 입력 순서대로 행별 결과, "message"}
+        """
+        try:
+            result = simple_client.bulk_import_influencers(
+                [influencer.dict(exclude_unset=True) for influencer in influencers],
+                update_existing=update_existing,
+                update_columns=update_columns
+            )
+            if result.get("created") or result.get("updated"):
+                self._invalidate_session_caches(INFLUENCER_CACHE_KEYS)
+                influencer_search_index.mark_stale()
+            return result
+        except Exception as e:
+            return self._handle_error(e, "인플루언서 일괄 등록")
+    
     def delete_influencer(self, influencer_id: str) -> Dict[str, Any]:
         """인플루언서 삭제"""
         try:
             result = simple_client.delete_influencer(influencer_id)
+            if result.get("success"):
+                influencer_search_index.invalidate([influencer_id])
             return result
         except Exception as e:
             return self._handle_error(e, "인플루언서 삭제")
     
     # 캠페인 참여 관련 메서드들
-    def get_campaign_participations(self, campaign_id: str, page: int = 1, page_size: int = 5, search_sns_id: str = None) -> Dict[str, Any]:
-        """캠페인 참여자 목록 조회 (페이징 지원, SNS ID 검색 지원)"""
+    def get_campaign_participations(self, campaign_id: str, page: int = 1, page_size: int = 5, search_sns_id: str = None, count: Optional[str] = "exact") -> Dict[str, Any]:
+        """캠페인 참여자 목록 조회 (페이징 지원, SNS ID 검색 지원)
+        
+        count: "exact" | "estimated" | "planned" | None - 전체 개수는 필터 조합별로 한 번만 조회 후 캐시
+        """
         try:
-            return simple_client.get_campaign_participations(campaign_id=campaign_id, page=page, page_size=page_size, search_sns_id=search_sns_id)
+            return simple_client.get_campaign_participations(campaign_id=campaign_id, page=page, page_size=page_size, search_sns_id=search_sns_id, count=count)
         except Exception as e:
             self._handle_error(e, "캠페인 참여자 조회")
             return {"data": [], "total_count": 0, "total_pages": 0, "current_page": page, "page_size": page_size}
@@ -147,47 +356,107 @@ class DatabaseManager:
     def get_all_campaign_participations(self, campaign_id: str) -> List[Dict[str, Any]]:
         """캠페인 참여자 목록 조회 (모든 데이터, 페이징 없음)"""
         try:
-            # 큰 page_size로 설정하여 모든 데이터를 가져옴
-            result = simple_client.get_campaign_participations(campaign_id=campaign_id, page=1, page_size=1000)
-            return result.get('data', []) if isinstance(result, dict) else result
+            # 페이지 목록 조회(get_campaign_participations)는 page_size를 100으로 제한하고 카운트 쿼리도 실행하므로,
+            # 카운트 없이 끝까지 페이지를 넘기는 일괄 조회 사용
+            return simple_client.get_participations_by_campaign_ids([campaign_id])
         except Exception as e:
             self._handle_error(e, "캠페인 참여자 조회")
             return []
     
+    def get_participations_by_campaign_ids(self, campaign_ids: List[str], updated_since: Optional[str] = None) -> List[Dict[str, Any]]:
+        """여러 캠페인의 참여자 목록 일괄 조회 (in_() 필터, updated_since 이후 수정분만 선택 가능)"""
+        try:
+            return simple_client.get_participations_by_campaign_ids(campaign_ids, updated_since=updated_since)
+        except Exception as e:
+            self._handle_error(e, "캠페인 참여자 일괄 조회")
+            return []
+    
+    def get_participation_index(self) -> Dict[str, Any]:
+        """참여 인덱스 조회 ((influencer_id, campaign_id) 투영 1회 조회, 세션 캐시)
+        
+        참여 추가/삭제/수정 시 PARTICIPATION_CACHE_KEYS로 초기화됩니다.
+        Returns:
+            {"influencer_ids": 참여한 인플루언서 ID set,
+             "campaigns_by_influencer": {influencer_id: [campaign_id, ...]},
+             "influencers_by_campaign": {campaign_id: {influencer_id, ...}}}
+        """
+        cache_key = "participation_index"
+        if cache_key in st.session_state:
+            return st.session_state[cache_key]
+        
+        try:
+            campaigns_by_influencer: Dict[str, List[str]] = {}
+            influencers_by_campaign: Dict[str, set] = {}
+            for pair in simple_client.get_participation_pairs():
+                influencer_id = pair.get('influencer_id')
+                campaign_id = pair.get('campaign_id')
+                if not influencer_id or not campaign_id:
+                    continue
+                campaigns_by_influencer.setdefault(influencer_id, []).append(campaign_id)
+                influencers_by_campaign.setdefault(campaign_id, set()).add(influencer_id)
+            
+            index = {
+                "influencer_ids": set(campaigns_by_influencer),
+                "campaigns_by_influencer": campaigns_by_influencer,
+                "influencers_by_campaign": influencers_by_campaign,
+            }
+            st.session_state[cache_key] = index
+            return index
+        except Exception as e:
+            self._handle_error(e, "참여 인덱스 조회")
+            return {"influencer_ids": set(), "campaigns_by_influencer": {}, "influencers_by_campaign": {}}
+    
     def get_all_participated_influencer_ids(self) -> set:
         """모든 캠페인에 참여한 인플루언서 ID 목록 조회"""
+        return self.get_participation_index()["influencer_ids"]
+    
+    def get_influencer_campaign_names(self) -> Dict[str, List[str]]:
+        """인플루언서별 참여 캠페인명 목록 ({influencer_id: [campaign_name, ...]})"""
         try:
-            # 모든 캠페인 참여 정보를 한 번에 조회
-            campaigns = self.get_campaigns()
-            all_participations = []
-            for campaign in campaigns:
-                participations = self.get_all_campaign_participations(campaign['id'])
-                all_participations.extend(participations)
-            
-            # 참여한 인플루언서 ID 목록 추출
-            participated_influencer_ids = set()
-            for participation in all_participations:
-                influencer_id = participation.get('influencer_id')
-                if influencer_id:
-                    participated_influencer_ids.add(influencer_id)
-            
-            return participated_influencer_ids
+            campaign_names = {c['id']: c.get('campaign_name', '') for c in self.get_campaigns()}
+            return {
+                influencer_id: [campaign_names[c] for c in campaign_ids if c in campaign_names]
+                for influencer_id, campaign_ids in self.get_participation_index()["campaigns_by_influencer"].items()
+            }
         except Exception as e:
-            self._handle_error(e, "참여 인플루언서 ID 조회")
-            return set()
+            self._handle_error(e, "인플루언서별 참여 캠페인 조회")
+            return {}
     
     def add_influencer_to_campaign(self, participation_data: Dict[str, Any]) -> Dict[str, Any]:
         """캠페인에 인플루언서 추가"""
         try:
             result = simple_client.create_campaign_participation(participation_data)
+            if result.get("success"):
+                self._invalidate_session_caches(PARTICIPATION_CACHE_KEYS)
+                participations_cache.invalidate([participation_data.get("campaign_id")])
             return result
         except Exception as e:
             return self._handle_error(e, "캠페인 참여 추가")
     
+    def bulk_add_influencers_to_campaign(self, campaign_id: str, influencer_ids: List[str], participation_defaults: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """여러 인플루언서를 캠페인에 일괄 추가 (기존 참여는 건너뜀)
+        
+        Returns:
+            {"success", "added", "existing", "failed", "results": {influencer_id: {"status", "message", "participation_id"}}, "message"}
+        """
+        try:
+            result = simple_client.bulk_add_influencers_to_campaign(campaign_id, influencer_ids, participation_defaults)
+            if result.get("added"):
+                self._invalidate_session_caches(PARTICIPATION_CACHE_KEYS)
+                participations_cache.invalidate([campaign_id])
+            return result
+        except Exception as e:
+            return self._handle_error(e, "캠페인 참여 일괄 추가")
+    
     def remove_influencer_from_campaign(self, participation_id: str) -> Dict[str, Any]:
         """캠페인에서 인플루언서 제거"""
         try:
             result = simple_client.delete_campaign_participation(participation_id)
+            if result.get("success"):
+                self._invalidate_session_caches(PARTICIPATION_CACHE_KEYS)
+                # 참여 ID만으로는 캠페인을 알 수 없으므로 참여 캐시는 전체 무효화
+                participations_cache.invalidate()
+                contents_cache.invalidate([participation_id])
             return result
         except Exception as e:
             return self._handle_error(e, "캠페인 참여 제거")
@@ -196,10 +465,31 @@ class DatabaseManager:
         """캠페인 참여 정보 업데이트"""
         try:
             result = simple_client.update_campaign_participation(participation_id, updates)
+            if result.get("success"):
+                self._invalidate_session_caches(PARTICIPATION_CACHE_KEYS)
+                participations_cache.invalidate()
             return result
         except Exception as e:
             return self._handle_error(e, "캠페인 참여 업데이트")
     
+    def bulk_update_participations(self, updates: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """캠페인 참여 정보 일괄 업데이트
+        
+        Args:
+            updates: {participation_id: update_data}
+        Returns:
+            {"success", "saved", "results": {participation_id: {"success", "message"}}, "message"}
+        """
+        try:
+            result = simple_client.bulk_update_campaign_participations(updates)
+            if result.get("saved"):
+                self._invalidate_session_caches(PARTICIPATION_CACHE_KEYS)
+                # 변경 데이터는 참여 ID 기준이라 캠페인을 알 수 없으므로 참여 캐시는 전체 무효화
+                participations_cache.invalidate()
+            return result
+        except Exception as e:
+            return self._handle_error(e, "캠페인 참여 일괄 업데이트")
+    
     def get_participation_by_campaign_and_influencer(self, campaign_id: str, influencer_id: str) -> Dict[str, Any]:
         """특정 캠페인과 인플루언서의 참여 정보 조회"""
         try:
@@ -217,6 +507,54 @@ class DatabaseManager:
             self._handle_error(e, "캠페인 콘텐츠 조회")
             return []
     
+    def get_contents_by_participation_ids(self, participation_ids: List[str]) -> List[Dict[str, Any]]:
+        """여러 참여의 콘텐츠 일괄 조회 (in_() 필터)"""
+        try:
+            return simple_client.get_contents_by_participation_ids(participation_ids)
+        except Exception as e:
+            self._handle_error(e, "캠페인 콘텐츠 일괄 조회")
+            return []
+    
+    def get_contents_by_campaign_ids(self, campaign_ids: List[str], updated_since: Optional[str] = None) -> List[Dict[str, Any]]:
+        """여러 캠페인의 콘텐츠 일괄 조회 (updated_since 이후 수정분만 선택 가능)"""
+        try:
+            return simple_client.get_contents_by_campaign_ids(campaign_ids, updated_since=updated_since)
+        except Exception as e:
+            self._handle_error(e, "캠페인 콘텐츠 증분 조회")
+            return []
+    
+    def get_contents_by_urls(self, content_urls: List[str]) -> List[Dict[str, Any]]:
+        """콘텐츠 URL 목록으로 기존 콘텐츠 일괄 조회"""
+        try:
+            return simple_client.get_contents_by_urls(content_urls)
+        except Exception as e:
+            self._handle_error(e, "콘텐츠 URL 조회")
+            return []
+    
+    def get_participations_by_content_links(self, content_urls: List[str]) -> List[Dict[str, Any]]:
+        """content_links에 URL이 등록된 참여 일괄 조회"""
+        try:
+            return simple_client.get_participations_by_content_links(content_urls)
+        except Exception as e:
+            self._handle_error(e, "콘텐츠 링크 참여 조회")
+            return []
+    
+    def get_content_metric_trend(self, campaign_ids: List[str], bucket: str = "day", start: Optional[str] = None, end: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+        """기간 버킷별 콘텐츠 성과 합계 조회 (선택 기간만, 조회 실패 시 None)"""
+        try:
+            return simple_client.get_content_metric_trend(campaign_ids, bucket=bucket, start=start, end=end)
+        except Exception as e:
+            self._handle_error(e, "콘텐츠 성과 트렌드 조회")
+            return None
+    
+    def get_content_metric_history(self, content_ids: List[str], bucket: str = "day", start: Optional[str] = None, end: Optional[str] = None) -> List[Dict[str, Any]]:
+        """여러 콘텐츠의 지표 이력(성장 곡선) 일괄 조회"""
+        try:
+            return simple_client.get_content_metric_history(content_ids, bucket=bucket, start=start, end=end)
+        except Exception as e:
+            self._handle_error(e, "콘텐츠 지표 이력 조회")
+            return []
+    
     def get_performance_data_by_participation(self, participation_id: str) -> List[Dict[str, Any]]:
         """참여별 성과 데이터 조회 (campaign_influencer_contents 테이블 기반)"""
         try:
@@ -228,21 +566,41 @@ class DatabaseManager:
     def create_campaign_influencer_content(self, content_data: Dict[str, Any]) -> Dict[str, Any]:
         """캠페인 인플루언서 콘텐츠 생성"""
         try:
-            return simple_client.create_campaign_influencer_content(content_data)
+            result = simple_client.create_campaign_influencer_content(content_data)
+            if result.get("success"):
+                contents_cache.invalidate([content_data.get("participation_id")])
+            return result
         except Exception as e:
             return self._handle_error(e, "캠페인 콘텐츠 생성")
     
+    def bulk_save_campaign_influencer_contents(self, contents: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """캠페인 인플루언서 콘텐츠 일괄 저장 (id 있으면 업데이트, 없으면 생성)"""
+        try:
+            result = simple_client.bulk_save_campaign_influencer_contents(contents)
+            if result.get("saved"):
+                contents_cache.invalidate({c.get("participation_id") for c in contents})
+            return result
+        except Exception as e:
+            return self._handle_error(e, "캠페인 콘텐츠 일괄 저장")
+    
     def update_campaign_influencer_content(self, content_id: str, update_data: Dict[str, Any]) -> Dict[str, Any]:
         """캠페인 인플루언서 콘텐츠 업데이트"""
         try:
-            return simple_client.update_campaign_influencer_content(content_id, update_data)
+            result = simple_client.update_campaign_influencer_content(content_id, update_data)
+            if result.get("success"):
+                # 콘텐츠 ID만으로는 참여를 알 수 없으므로 콘텐츠 캐시는 전체 무효화
+                contents_cache.invalidate()
+            return result
         except Exception as e:
             return self._handle_error(e, "캠페인 콘텐츠 업데이트")
     
     def delete_campaign_influencer_content(self, content_id: str) -> Dict[str, Any]:
         """캠페인 인플루언서 콘텐츠 삭제"""
         try:
-            return simple_client.delete_campaign_influencer_content(content_id)
+            result = simple_client.delete_campaign_influencer_content(content_id)
+            if result.get("success"):
+                contents_cache.invalidate()
+            return result
         except Exception as e:
             return self._handle_error(e, "캠페인 콘텐츠 삭제")
     
@@ -1,11 +1,24 @@
 import streamlit as st
 import os
+import time
 from typing import Dict, Any, List, Optional
 from .config import supabase_config
 
 class SimpleSupabaseClient:
     """간단한 Supabase 클라이언트 (인증 상태 확인 포함)"""
     
+    # PostgREST in_() 필터는 URL 쿼리스트링으로 전달되므로 ID 개수를 나눠서 요청
+    IN_FILTER_CHUNK_SIZE = 200
+    
+    # 대량 저장 시 요청 1회에 보낼 행 수
+    BULK_CHUNK_SIZE = 500
+    
+    # 참여 목록 개수 캐시 (필터 조합별, 세션 단위) 유지 시간(초)
+    PARTICIPATION_COUNT_TTL = 60
+    
+    # 인플루언서별 최신 AI 분석 1건만 노출하는 뷰 (supabase/db/latest_ai_analysis.sql)
+    LATEST_AI_ANALYSIS_VIEW = "latest_ai_analysis"
+    
     def __init__(self):
         self.client = None
     
@@ -73,6 +86,111 @@ class SimpleSupabaseClient:
             "message": f"{operation} 중 오류가 발생했습니다: {error_msg}"
         }
     
+    def _bulk_write(self, table: str, rows: List[Dict[str, Any]], on_conflict: Optional[str] = "id", chunk_size: Optional[int] = None) -> Dict[str, Any]:
+        """여러 행을 청크 단위로 한 번에 저장 (on_conflict 지정 시 upsert, None이면 insert)
+        
+        청크 요청이 실패하면 해당 청크만 행 단위로 다시 시도하여 실패한 행을 식별합니다.
+        Returns:
+            {"success": 전체 성공 여부, "saved": 저장된 행 수,
+             "results": 입력 순서대로 {"success", "data" 또는 "message"}}
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(rows)
+        client = self.get_client()
+        if not client:
+            return {
+                "success": False,
+                "saved": 0,
+                "results": [{"success": False, "message": "데이터베이스 연결 실패"} for _ in rows],
+                "message": "데이터베이스 연결 실패"
+            }
+        
+        def _execute(batch):
+            query = client.table(table)
+            if on_conflict:
+                return query.upsert(batch, on_conflict=on_conflict).execute()
+            return query.insert(batch).execute()
+        
+        chunk_size = chunk_size or self.BULK_CHUNK_SIZE
+        for start in range(0, len(rows), chunk_size):
+            batch = rows[start:start + chunk_size]
+            try:
+                response = _execute(batch)
+                data = response.data or []
+                for offset in range(len(batch)):
+                    results[start + offset] = {"success": True, "data": data[offset] if offset < len(data) else None}
+            except Exception:
+                # 제약조건 위반 등으로 청크가 실패하면 행 단위로 재시도
+                for offset, row in enumerate(batch):
+                    try:
+                        response = _execute([row])
+                        results[start + offset] = {"success": True, "data": (response.data or [None])[0]}
+                    except Exception as row_error:
+                        results[start + offset] = self._handle_error(row_error, "대량 저장")
+        
+        saved = sum(1 for r in results if r and r.get("success"))
+        return {
+            "success": saved == len(rows),
+            "saved": saved,
+            "results": results,
+            "message": f"{saved}/{len(rows)}건 저장되었습니다."
+        }
+    
+    def _bulk_update_by_id(self, table: str, updates: Dict[str, Dict[str, Any]], required_columns: List[str]) -> Dict[str, Any]:
+        """id별 변경 데이터를 기본키 기준 청크 upsert로 일괄 업데이트
+        
+        upsert는 INSERT 경로의 NOT NULL 검사를 거치므로, 변경 데이터에 없는 필수 컬럼은
+        기존 행 값으로 채웁니다(in_() 조회 1회/청크). 존재하지 않는 id는 새로 만들지 않고 실패 처리합니다.
+        Returns:
+            {"success": 전체 성공 여부, "saved": 성공 건수, "results": {id: {"success", "message"}}}
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        client = self.get_client()
+        if not client:
+            return {
+                "success": False,
+                "saved": 0,
+                "results": {row_id: {"success": False, "message": "데이터베이스 연결 실패"} for row_id in updates},
+                "message": "데이터베이스 연결 실패"
+            }
+        
+        ids = list(updates.keys())
+        existing = {}
+        select_columns = ", ".join(["id"] + required_columns)
+        for start in range(0, len(ids), self.IN_FILTER_CHUNK_SIZE):
+            chunk = ids[start:start + self.IN_FILTER_CHUNK_SIZE]
+            try:
+                response = client.table(table).select(select_columns).in_("id", chunk).execute()
+                for row in response.data or []:
+                    existing[str(row["id"])] = row
+            except Exception as e:
+                for row_id in chunk:
+                    results[row_id] = self._handle_error(e, "기존 데이터 조회")
+        
+        # 필수 컬럼 보완 후 컬럼 구성이 같은 행끼리 묶어서 저장 (PostgREST 대량 저장은 키가 동일해야 함)
+        groups: Dict[tuple, List[tuple]] = {}
+        for row_id, update_data in updates.items():
+            if row_id in results:
+                continue
+            if str(row_id) not in existing:
+                results[row_id] = {"success": False, "message": "존재하지 않는 데이터입니다."}
+                continue
+            row = {**existing[str(row_id)], **update_data, "id": row_id}
+            groups.setdefault(tuple(sorted(row.keys())), []).append((row_id, row))
+        
+        for group in groups.values():
+            written = self._bulk_write(table, [row for _, row in group], on_conflict="id")
+            for (row_id, _), result in zip(group, written["results"]):
+                results[row_id] = {"success": bool(result and result.get("success")),
+                                   "message": (result or {}).get("message", "")}
+        
+        saved = sum(1 for r in results.values() if r.get("success"))
+        return {
+            "success": saved == len(updates),
+            "saved": saved,
+            "results": results,
+            "message": f"{saved}/{len(updates)}건 업데이트되었습니다."
+        }
+    
     # 캠페인 관련 메서드들
     def get_campaigns(self) -> List[Dict[str, Any]]:
         """사용자의 캠페인 목록 조회"""
@@ -90,6 +208,38 @@ class SimpleSupabaseClient:
             self._handle_error(e, "캠페인 조회")
             return []
     
+    def get_campaign_performance_rollups(self, campaign_ids: Optional[List[str]] = None, page_size: int = 1000) -> List[Dict[str, Any]]:
+        """캠페인 × 플랫폼별 성과 롤업 조회 (campaign_performance_rollups, 트리거로 유지, 페이지 단위로 끝까지 조회)"""
+        try:
+            client = self.get_client()
+            if not client:
+                return []
+            
+            # campaign_ids가 없으면 전체를 한 묶음으로 조회
+            chunks = [None] if campaign_ids is None else [
+                list(campaign_ids[start:start + self.IN_FILTER_CHUNK_SIZE])
+                for start in range(0, len(campaign_ids), self.IN_FILTER_CHUNK_SIZE)
+            ]
+            
+            rollups = []
+            for chunk in chunks:
+                offset = 0
+                while True:
+                    query = client.table("campaign_performance_rollups").select("*")
+                    if chunk is not None:
+                        query = query.in_("campaign_id", chunk)
+                    response = query.order("campaign_id").order("platform")\
+                        .range(offset, offset + page_size - 1)\
+                        .execute()
+                    rows = response.data or []
+                    rollups.extend(rows)
+                    if len(rows) < page_size:
+                        break
+                    offset += page_size
+            return rollups
+        except Exception as e:
+            return []
+    
     def create_campaign(self, campaign_data: Dict[str, Any]) -> Dict[str, Any]:
         """새 캠페인 생성"""
         try:
@@ -158,8 +308,8 @@ class SimpleSupabaseClient:
             return self._handle_error(e, "캠페인 삭제")
     
     # 인플루언서 관련 메서드들
-    def get_influencers(self, platform: Optional[str] = None) -> List[Dict[str, Any]]:
-        """인플루언서 목록 조회 (페이지네이션 적용)"""
+    def get_influencers(self, platform: Optional[str] = None, columns: str = "*") -> List[Dict[str, Any]]:
+        """인플루언서 목록 조회 (페이지네이션 적용, columns로 조회 컬럼 제한)"""
         try:
             client = self.get_client()
             if not client:
@@ -172,7 +322,7 @@ class SimpleSupabaseClient:
             offset = 0
             
             while True:
-                query = client.table("connecta_influencers").select("*")
+                query = client.table("connecta_influencers").select(columns)
                 
                 if platform:
                     query = query.eq("platform", platform)
@@ -273,6 +423,328 @@ class SimpleSupabaseClient:
         except Exception as e:
             return self._handle_error(e, "인플루언서 업데이트")
     
+    def bulk_update_influencers(self, updates: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """인플루언서 정보 일괄 업데이트 ({influencer_id: update_data}, 청크 단위 upsert)"""
+        try:
+            return self._bulk_update_by_id(
+                "connecta_influencers", updates,
+                required_columns=["platform", "sns_id", "sns_url", "content_category"]
+            )
+        except Exception as e:
+            return self._handle_error(e, "인플루언서 일괄 업데이트")
+    
+    def _escape_like(self, value: str) -> str:
+        """LIKE/ILIKE 패턴의 와일드카드(%, _)와 이스케이프 문자(\\)를 일반 문자로 검색되도록 이스케이프"""
+        return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    
+    def get_influencers_page(self, platform: Optional[str] = None, content_category: Optional[str] = None,
+                             min_followers: int = 0, max_followers: Optional[int] = None, search_term: Optional[str] = None,
+                             after: Optional[Dict[str, Any]] = None, page_size: int = 10, count: Optional[str] = "estimated") -> Dict[str, Any]:
+        """인플루언서 목록 한 페이지 조회 (필터는 서버에서 적용, 등록일 최신순 keyset 페이지네이션)
+        
+        Args:
+            after: 이전 페이지 마지막 행의 커서 {"created_at", "id"} (첫 페이지는 None)
+            count: "exact" | "estimated" | "planned" | None - 첫 페이지에서만 조회
+        Returns:
+            {"data": 현재 페이지 행, "next_cursor": 다음 페이지 커서 또는 None, "total_count": 개수 또는 None}
+        """
+        try:
+            client = self.get_client()
+            if not client:
+                return {"data": [], "next_cursor": None, "total_count": None}
+            
+            request_count = count if count and after is None else None
+            if request_count:
+                query = client.table("connecta_influencers").select("*", count=request_count)
+            else:
+                query = client.table("connecta_influencers").select("*")
+            
+            if platform:
+                query = query.eq("platform", platform)
+            if content_category:
+                query = query.ilike("content_category", f"%{self._escape_like(content_category)}%")
+            if min_followers:
+                query = query.gte("followers_count", int(min_followers))
+            if max_followers is not None:
+                query = query.lte("followers_count", int(max_followers))
+            
+            # * 는 PostgREST에서 %로 바뀌므로 제거, 나머지 예약 문자는 값 인용으로 처리
+            term = (search_term or "").replace("*", "").replace("@", "").strip()
+            conditions = []
+            if term:
+                pattern = self._quote_filter_value(f"*{self._escape_like(term)}*")
+                conditions.append(f"or(sns_id.ilike.{pattern},influencer_name.ilike.{pattern})")
+            if after:
+                # (created_at, id) < (커서 등록일, 커서 id)
+                created_at = self._quote_filter_value(after["created_at"])
+                conditions.append(
+                    f"or(created_at.lt.{created_at},"
+                    f"and(created_at.eq.{created_at},id.lt.{after['id']}))"
+                )
+            if conditions:
+                # 여러 or 조건을 하나의 논리식으로 묶어서 전달
+                query = query.or_(f"and({','.join(conditions)})")
+            
+            # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+            response = query.order("created_at", desc=True).order("id", desc=True).limit(page_size + 1).execute()
+            rows = response.data or []
+            has_more = len(rows) > page_size
+            rows = rows[:page_size]
+            
+            return {
+                "data": rows,
+                "next_cursor": {"created_at": rows[-1]["created_at"], "id": rows[-1]["id"]} if has_more else None,
+                "total_count": response.count if request_count else None
+            }
+        except Exception as e:
+            return {"data": [], "next_cursor": None, "total_count": None}
+    
+    def search_influencers(self, search_term: str, platform: Optional[str] = None, limit: int = 20,
+                           fuzzy: bool = True, min_similarity: float = 0.3, sns_id_only: bool = False,
+                           campaign_id: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+        """search_influencers RPC로 SNS ID/별칭 트라이그램 검색 (정확 > 접두 > 부분 > 유사 일치 순, 상위 limit건)
+        
+        Returns:
+            순위순 인플루언서 행 목록, RPC 호출 실패 시 None (마이그레이션 미적용 등)
+        """
+        try:
+            client = self.get_client()
+            if not client:
+                return None
+            
+            response = client.rpc("search_influencers", {
+                "p_term": search_term,
+                "p_platform": platform,
+                "p_limit": limit,
+                "p_min_similarity": min_similarity,
+                "p_fuzzy": fuzzy,
+                "p_sns_id_only": sns_id_only,
+                "p_campaign_id": campaign_id,
+            }).execute()
+            return response.data or []
+        except Exception as e:
+            return None
+    
+    def search_influencers_with_analysis(self, category: Optional[str] = None, tag_keywords: Optional[List[str]] = None,
+                                         min_followers: Optional[int] = None, max_followers: Optional[int] = None,
+                                         overall_score_range: tuple = (0.0, 10.0), growth_potential_range: tuple = (0.0, 10.0),
+                                         limit: Optional[int] = None) -> Optional[List[Dict[str, Any]]]:
+        """search_influencers_with_analysis RPC로 인플루언서 + 최신 AI 분석 점수 조회 (필터/점수 범위는 서버에서 적용)
+        
+        Returns:
+            결과 행 목록, 클라이언트가 없거나 RPC 호출 실패 시 None (마이그레이션 미적용 등)
+        """
+        try:
+            client = self.get_client()
+            if not client:
+                return None
+            
+            response = client.rpc("search_influencers_with_analysis", {
+                "p_category": category,
+                "p_tag_keywords": tag_keywords or None,
+                "p_min_followers": min_followers,
+                "p_max_followers": max_followers,
+                "p_overall_min": overall_score_range[0],
+                "p_overall_max": overall_score_range[1],
+                "p_growth_min": growth_potential_range[0],
+                "p_growth_max": growth_potential_range[1],
+                "p_limit": limit,
+            }).execute()
+            return response.data or []
+        except Exception as e:
+            return None
+    
+    def get_influencer_group_stats(self) -> Optional[List[Dict[str, Any]]]:
+        """get_influencer_group_stats RPC로 플랫폼 × 카테고리별 집계 조회
+        
+        Returns:
+            집계 행 목록, RPC 호출 실패 시 None (마이그레이션 미적용 등)
+        """
+        try:
+            client = self.get_client()
+            if not client:
+                return None
+            
+            response = client.rpc("get_influencer_group_stats", {}).execute()
+            return response.data or []
+        except Exception as e:
+            return None
+    
+    def get_influencer_search_rows(self, updated_since: Optional[str] = None, page_size: int = 1000) -> List[Dict[str, Any]]:
+        """검색 인덱스용 인플루언서 최소 컬럼 조회 (updated_since 이후 수정분만, 페이지 단위로 끝까지)"""
+        try:
+            client = self.get_client()
+            if not client:
+                return []
+            
+            rows = []
+            offset = 0
+            while True:
+                query = client.table("connecta_influencers")\
+                    .select("id, platform, sns_id, influencer_name, updated_at")
+                if updated_since:
+                    query = query.gte("updated_at", updated_since)
+                response = query.order("updated_at").order("id")\
+                    .range(offset, offset + page_size - 1).execute()
+                page = response.data or []
+                rows.extend(page)
+                if len(page) < page_size:
+                    break
+                offset += page_size
+            return rows
+        except Exception as e:
+            return []
+    
+    def get_influencers_by_ids(self, influencer_ids: List[str]) -> List[Dict[str, Any]]:
+        """ID 목록으로 인플루언서 전체 정보 일괄 조회 (in_() 청크 조회)"""
+        try:
+            client = self.get_client()
+            if not client or not influencer_ids:
+                return []
+            
+            influencer_ids = list(dict.fromkeys(influencer_ids))
+            influencers = []
+            for start in range(0, len(influencer_ids), self.IN_FILTER_CHUNK_SIZE):
+                response = client.table("connecta_influencers")\
+                    .select("*")\
+                    .in_("id", influencer_ids[start:start + self.IN_FILTER_CHUNK_SIZE])\
+                    .execute()
+                influencers.extend(response.data or [])
+            return influencers
+        except Exception as e:
+            return []
+    
+    def get_influencers_by_platform_sns_ids(self, keys: List[tuple]) -> List[Dict[str, Any]]:
+        """(platform, sns_id) 목록으로 기존 인플루언서 일괄 조회 (플랫폼별 in_() 청크 조회)"""
+        try:
+            client = self.get_client()
+            if not client or not keys:
+                return []
+            
+            sns_ids_by_platform: Dict[str, List[str]] = {}
+            for platform, sns_id in dict.fromkeys(keys):
+                sns_ids_by_platform.setdefault(platform, []).append(sns_id)
+            
+            influencers = []
+            for platform, sns_ids in sns_ids_by_platform.items():
+                for start in range(0, len(sns_ids), self.IN_FILTER_CHUNK_SIZE):
+                    response = client.table("connecta_influencers")\
+                        .select("*")\
+                        .eq("platform", platform)\
+                        .in_("sns_id", sns_ids[start:start + self.IN_FILTER_CHUNK_SIZE])\
+                        .execute()
+                    influencers.extend(response.data or [])
+            return influencers
+        except Exception as e:
+            return []
+    
+    def get_influencers_by_sns_ids(self, sns_ids: List[str], platform: Optional[str] = None) -> List[Dict[str, Any]]:
+        """SNS ID 목록으로 인플루언서 일괄 조회 (platform 미지정 시 전체 플랫폼, in_() 청크 조회)"""
+        try:
+            client = self.get_client()
+            if not client or not sns_ids:
+                return []
+            
+            sns_ids = list(dict.fromkeys(sns_ids))
+            influencers = []
+            for start in range(0, len(sns_ids), self.IN_FILTER_CHUNK_SIZE):
+                query = client.table("connecta_influencers")\
+                    .select("id, platform, sns_id, influencer_name, followers_count")\
+                    .in_("sns_id", sns_ids[start:start + self.IN_FILTER_CHUNK_SIZE])
+                if platform:
+                    query = query.eq("platform", platform)
+                response = query.execute()
+                influencers.extend(response.data or [])
+            return influencers
+        except Exception as e:
+            return []
+    
+    def bulk_import_influencers(self, influencers: List[Dict[str, Any]], update_existing: bool = False,
+                                update_columns: Optional[List[set]] = None) -> Dict[str, Any]:
+        """인플루언서 일괄 등록 - 기존 (platform, sns_id)는 일괄 조회로 미리 걸러내고 신규만 청크 insert
+        
+        Args:
+            influencers: 정규화된 인플루언서 데이터 목록 (platform, sns_id 필수)
+            update_existing: True면 이미 등록된 인플루언서는 업로드 값으로 일괄 업데이트
+            update_columns: 행별로 업데이트에 사용할 컬럼 집합 (신규 등록용 기본값이 기존 값을 덮어쓰지 않도록,
+                None이면 값이 있는 컬럼 전체)
+        Returns:
+            {"success", "created", "updated", "duplicates", "failed",
+             "results": 입력 순서대로 {"status": created|updated|duplicate|failed, "message", "id"}}
+        """
+        try:
+            results: List[Optional[Dict[str, Any]]] = [None] * len(influencers)
+            keys = [(row.get("platform"), row.get("sns_id")) for row in influencers]
+            existing = {
+                (row["platform"], row["sns_id"]): row
+                for row in self.get_influencers_by_platform_sns_ids([k for k in keys if k[0] and k[1]])
+            }
+            
+            seen = set()
+            insert_idx, update_idx = [], []
+            for i, key in enumerate(keys):
+                if not key[0] or not key[1]:
+                    results[i] = {"status": "failed", "message": "플랫폼과 SNS ID는 필수입니다."}
+                elif key in seen:
+                    results[i] = {"status": "duplicate", "message": "파일 내 중복된 SNS ID입니다."}
+                elif key in existing:
+                    if update_existing:
+                        update_idx.append(i)
+                    else:
+                        results[i] = {"status": "duplicate", "message": "이미 등록된 인플루언서입니다.",
+                                      "id": existing[key]["id"]}
+                seen.add(key)
+                if results[i] is None and key not in existing:
+                    insert_idx.append(i)
+            
+            # 값이 없는 컬럼은 DB 기본값을 쓰도록 제외하고, 컬럼 구성이 같은 행끼리 묶어서 insert
+            groups: Dict[tuple, List[int]] = {}
+            for i in insert_idx:
+                row = {k: v for k, v in influencers[i].items() if v is not None}
+                groups.setdefault(tuple(sorted(row.keys())), []).append(i)
+            for indices in groups.values():
+                rows = [{k: v for k, v in influencers[i].items() if v is not None} for i in indices]
+                written = self._bulk_write("connecta_influencers", rows, on_conflict=None)
+                for i, result in zip(indices, written["results"]):
+                    if result and result.get("success"):
+                        results[i] = {"status": "created", "message": "",
+                                      "id": (result.get("data") or {}).get("id")}
+                    else:
+                        results[i] = {"status": "duplicate" if (result or {}).get("error") == "DUPLICATE_INFLUENCER" else "failed",
+                                      "message": (result or {}).get("message", "")}
+            
+            if update_idx:
+                updates = {}
+                for i in update_idx:
+                    influencer_id = existing[keys[i]]["id"]
+                    allowed = update_columns[i] if update_columns is not None else influencers[i].keys()
+                    updates[influencer_id] = {k: v for k, v in influencers[i].items()
+                                              if v is not None and k in allowed and k not in ("created_by",)}
+                updated = self._bulk_update_by_id(
+                    "connecta_influencers", updates,
+                    required_columns=["platform", "sns_id", "sns_url", "content_category"]
+                )
+                for i in update_idx:
+                    influencer_id = existing[keys[i]]["id"]
+                    result = updated["results"].get(influencer_id, {})
+                    results[i] = {"status": "updated" if result.get("success") else "failed",
+                                  "message": result.get("message", ""), "id": influencer_id}
+            
+            counts = {status: sum(1 for r in results if r["status"] == status)
+                      for status in ("created", "updated", "duplicate", "failed")}
+            return {
+                "success": counts["failed"] == 0,
+                "created": counts["created"],
+                "updated": counts["updated"],
+                "duplicates": counts["duplicate"],
+                "failed": counts["failed"],
+                "results": results,
+                "message": f"신규 {counts['created']}건, 업데이트 {counts['updated']}건, "
+                           f"중복 {counts['duplicate']}건, 실패 {counts['failed']}건"
+            }
+        except Exception as e:
+            return self._handle_error(e, "인플루언서 일괄 등록")
+    
     def delete_influencer(self, influencer_id: str) -> Dict[str, Any]:
         """인플루언서 삭제"""
         try:
@@ -337,8 +809,63 @@ class SimpleSupabaseClient:
             return self._handle_error(e, "사용자 통계 조회")
     
     # 캠페인 참여 관련 메서드들
-    def get_campaign_participations(self, campaign_id: str = None, participation_id: str = None, page: int = 1, page_size: int = 5, search_sns_id: str = None) -> Dict[str, Any]:
-        """캠페인 참여 목록 조회 (페이징 지원, SNS ID 검색 지원)"""
+    PARTICIPATION_SELECT = """
+        *,
+        campaigns!inner(id, campaign_name, created_by),
+        connecta_influencers!inner(
+            id, influencer_name, sns_id, platform, sns_url, 
+            followers_count, phone_number, shipping_address, 
+            email, kakao_channel_id, content_category, 
+            contact_method, interested_products, owner_comment, 
+            manager_rating, content_rating, comments_count, 
+            post_count, profile_text, dm_reply
+        )
+    """
+    
+    def _flatten_participation(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """참여 조회 결과(캠페인/인플루언서 조인 포함)를 평면화"""
+        # sample_status 값은 이미 DB enum과 UI가 동일하므로 그대로 사용
+        db_sample_status = item.get('sample_status')
+        ui_sample_status = db_sample_status
+        
+        return {
+            # 참여 기본 정보
+            'id': item.get('id'),
+            'campaign_id': item.get('campaign_id'),
+            'influencer_id': item.get('influencer_id'),
+            'manager_comment': item.get('manager_comment'),
+            'influencer_requests': item.get('influencer_requests'),
+            'memo': item.get('memo'),
+            'sample_status': ui_sample_status,  # UI 값으로 변환
+            'influencer_feedback': item.get('influencer_feedback'),
+            'content_uploaded': item.get('content_uploaded'),
+            'cost_krw': item.get('cost_krw'),
+            'content_links': item.get('content_links', []),
+            'created_by': item.get('created_by'),
+            'created_at': item.get('created_at'),
+            'updated_at': item.get('updated_at'),
+            
+            # 캠페인 정보 (평면화)
+            'campaign_name': item.get('campaigns', {}).get('campaign_name'),
+            
+            # 인플루언서 정보 (평면화)
+            'influencer_name': item.get('connecta_influencers', {}).get('influencer_name'),
+            'sns_id': item.get('connecta_influencers', {}).get('sns_id'),
+            'platform': item.get('connecta_influencers', {}).get('platform'),
+            'sns_url': item.get('connecta_influencers', {}).get('sns_url'),
+            'followers_count': item.get('connecta_influencers', {}).get('followers_count'),
+            'phone_number': item.get('connecta_influencers', {}).get('phone_number'),
+            'shipping_address': item.get('connecta_influencers', {}).get('shipping_address'),
+            'email': item.get('connecta_influencers', {}).get('email'),
+            'kakao_channel_id': item.get('connecta_influencers', {}).get('kakao_channel_id'),
+        }
+    
+    def get_campaign_participations(self, campaign_id: str = None, participation_id: str = None, page: int = 1, page_size: int = 5, search_sns_id: str = None, count: Optional[str] = "exact") -> Dict[str, Any]:
+        """캠페인 참여 목록 조회 (페이징 지원, SNS ID 검색 지원)
+        
+        전체 개수는 별도 카운트 쿼리 없이 데이터 요청과 같은 요청으로 받아오고(count="exact" | "estimated" | "planned"),
+        필터 조합별로 세션에 캐시하여 다음 페이지부터는 데이터만 조회합니다. count=None이면 개수를 조회하지 않습니다.
+        """
         try:
             client = self.get_client()
             if not client:
@@ -348,20 +875,21 @@ class SimpleSupabaseClient:
             if page_size > 100:
                 page_size = 100
             
+            search_term = search_sns_id.strip() if search_sns_id and search_sns_id.strip() else None
+            count_cache = st.session_state.setdefault("participation_count_cache", {})
+            count_key = (campaign_id, participation_id, search_term, count)
+            cached = count_cache.get(count_key)
+            cached_count = None
+            if cached and time.time() - cached["at"] < self.PARTICIPATION_COUNT_TTL:
+                cached_count = cached["count"]
+            request_count = count if count and cached_count is None else None
+            
             # 직접 Supabase 클라이언트 사용 (Edge Function 우회)
-            # sns_url 필드를 명시적으로 포함하여 테스트
-            query = client.table('campaign_influencer_participations').select("""
-                *,
-                campaigns!inner(id, campaign_name, created_by),
-                connecta_influencers!inner(
-                    id, influencer_name, sns_id, platform, sns_url, 
-                    followers_count, phone_number, shipping_address, 
-                    email, kakao_channel_id, content_category, 
-                    contact_method, interested_products, owner_comment, 
-                    manager_rating, content_rating, comments_count, 
-                    post_count, profile_text, dm_reply
-                )
-            """)
+            # !inner 조인 조건이 같은 요청에 적용되므로 개수도 데이터와 동일한 기준으로 계산됨
+            if request_count:
+                query = client.table('campaign_influencer_participations').select(self.PARTICIPATION_SELECT, count=request_count)
+            else:
+                query = client.table('campaign_influencer_participations').select(self.PARTICIPATION_SELECT)
             
             # 사용자 필터링 (RLS 정책 적용)
             if hasattr(self, '_get_current_user_id'):
@@ -377,97 +905,41 @@ class SimpleSupabaseClient:
             if campaign_id:
                 query = query.eq('campaign_id', campaign_id)
             
-            # SNS ID 검색 필터링
-            if search_sns_id and search_sns_id.strip():
-                query = query.ilike('connecta_influencers.sns_id', f'%{search_sns_id.strip()}%')
-            
-            # 전체 개수 조회 (페이징을 위해)
-            count_query = client.table('campaign_influencer_participations').select("""
-                id,
-                campaigns!inner(id, campaign_name, created_by),
-                connecta_influencers!inner(id)
-            """, count="exact")
-            
-            # 사용자 필터링 (RLS 정책 적용)
-            if hasattr(self, '_get_current_user_id'):
-                user_id = self._get_current_user_id()
-                if user_id:
-                    count_query = count_query.eq('campaigns.created_by', user_id)
-            
-            if campaign_id:
-                count_query = count_query.eq('campaign_id', campaign_id)
-            if participation_id:
-                count_query = count_query.eq('id', participation_id)
-            
-            # SNS ID 검색 필터링 (count_query에도 적용)
-            if search_sns_id and search_sns_id.strip():
-                count_query = count_query.ilike('connecta_influencers.sns_id', f'%{search_sns_id.strip()}%')
+            # SNS ID 검색 필터링 (조인된 connecta_influencers.sns_id 부분 일치)
+            # 일치 건수 제한 없이 페이징/개수에 그대로 반영되며, sns_id 트라이그램 인덱스로 처리됨
+            if search_term:
+                query = query.ilike('connecta_influencers.sns_id', f'%{search_term}%')
             
-            count_result = count_query.execute()
-            total_count = count_result.count if count_result.count is not None else 0
-            
-            # 페이징 적용
+            # 페이징 적용 (개수를 모르면 1행을 더 읽어 다음 페이지 존재 여부 확인)
             offset = (page - 1) * page_size
-            result = query.order('created_at', desc=True).range(offset, offset + page_size - 1).execute()
-            
-            if result.data:
-                # 데이터 평면화
-                flattened_data = []
-                for item in result.data:
-                    # sample_status 값은 이미 DB enum과 UI가 동일하므로 그대로 사용
-                    db_sample_status = item.get('sample_status')
-                    ui_sample_status = db_sample_status
-                    
-                    flattened_item = {
-                        # 참여 기본 정보
-                        'id': item.get('id'),
-                        'campaign_id': item.get('campaign_id'),
-                        'influencer_id': item.get('influencer_id'),
-                        'manager_comment': item.get('manager_comment'),
-                        'influencer_requests': item.get('influencer_requests'),
-                        'memo': item.get('memo'),
-                        'sample_status': ui_sample_status,  # UI 값으로 변환
-                        'influencer_feedback': item.get('influencer_feedback'),
-                        'content_uploaded': item.get('content_uploaded'),
-                        'cost_krw': item.get('cost_krw'),
-                        'content_links': item.get('content_links', []),
-                        'created_by': item.get('created_by'),
-                        'created_at': item.get('created_at'),
-                        'updated_at': item.get('updated_at'),
-                        
-                        # 캠페인 정보 (평면화)
-                        'campaign_name': item.get('campaigns', {}).get('campaign_name'),
-                        
-                        # 인플루언서 정보 (평면화)
-                        'influencer_name': item.get('connecta_influencers', {}).get('influencer_name'),
-                        'sns_id': item.get('connecta_influencers', {}).get('sns_id'),
-                        'platform': item.get('connecta_influencers', {}).get('platform'),
-                        'sns_url': item.get('connecta_influencers', {}).get('sns_url'),
-                        'followers_count': item.get('connecta_influencers', {}).get('followers_count'),
-                        'phone_number': item.get('connecta_influencers', {}).get('phone_number'),
-                        'shipping_address': item.get('connecta_influencers', {}).get('shipping_address'),
-                        'email': item.get('connecta_influencers', {}).get('email'),
-                        'kakao_channel_id': item.get('connecta_influencers', {}).get('kakao_channel_id'),
-                    }
-                    flattened_data.append(flattened_item)
-                
+            lookahead = 1 if cached_count is None and not request_count else 0
+            result = query.order('created_at', desc=True).order('id')\
+                .range(offset, offset + page_size - 1 + lookahead).execute()
+            
+            if request_count and result.count is not None:
+                cached_count = result.count
+                count_cache[count_key] = {"count": cached_count, "at": time.time()}
+            
+            rows = result.data or []
+            has_next = len(rows) > page_size
+            rows = rows[:page_size]
+            if cached_count is not None:
+                total_count = cached_count
                 total_pages = (total_count + page_size - 1) // page_size
-                
-                return {
-                    "data": flattened_data,
-                    "total_count": total_count,
-                    "total_pages": total_pages,
-                    "current_page": page,
-                    "page_size": page_size
-                }
+                has_next = page < total_pages
             else:
-                return {
-                    "data": [],
-                    "total_count": 0,
-                    "total_pages": 0,
-                    "current_page": page,
-                    "page_size": page_size
-                }
+                # 개수를 조회하지 않은 경우 현재 페이지까지의 행 수로 추정하고, 다음 페이지가 있으면 한 페이지 더 노출
+                total_count = offset + len(rows)
+                total_pages = page + 1 if has_next else (total_count + page_size - 1) // page_size
+            
+            return {
+                "data": [self._flatten_participation(item) for item in rows],
+                "total_count": total_count,
+                "total_pages": total_pages,
+                "current_page": page,
+                "page_size": page_size,
+                "has_next": has_next
+            }
                 
         except Exception as e:
             return {
@@ -478,6 +950,70 @@ class SimpleSupabaseClient:
                 "page_size": page_size
             }
     
+    def get_participations_by_campaign_ids(self, campaign_ids: List[str], page_size: int = 1000, updated_since: Optional[str] = None) -> List[Dict[str, Any]]:
+        """여러 캠페인의 참여 목록을 in_() 필터로 일괄 조회 (페이지 단위로 끝까지 조회, 평면화된 결과)
+
+        updated_since가 주어지면 해당 시각 이후 수정된 참여만 조회 (증분 새로고침용)
+        """
+        try:
+            client = self.get_client()
+            if not client or not campaign_ids:
+                return []
+            
+            participations = []
+            for start in range(0, len(campaign_ids), self.IN_FILTER_CHUNK_SIZE):
+                chunk = list(campaign_ids[start:start + self.IN_FILTER_CHUNK_SIZE])
+                offset = 0
+                while True:
+                    query = client.table('campaign_influencer_participations')\
+                        .select(self.PARTICIPATION_SELECT)\
+                        .in_('campaign_id', chunk)
+                    if updated_since:
+                        query = query.gte('updated_at', updated_since)
+                    
+                    # 사용자 필터링 (RLS 정책 적용)
+                    if hasattr(self, '_get_current_user_id'):
+                        user_id = self._get_current_user_id()
+                        if user_id:
+                            query = query.eq('campaigns.created_by', user_id)
+                    
+                    response = query.order('created_at', desc=True).order('id')\
+                        .range(offset, offset + page_size - 1).execute()
+                    rows = response.data or []
+                    participations.extend(self._flatten_participation(item) for item in rows)
+                    if len(rows) < page_size:
+                        break
+                    offset += page_size
+            
+            return participations
+        except Exception as e:
+            return []
+
+    def get_participation_pairs(self, page_size: int = 1000) -> List[Dict[str, Any]]:
+        """전체 참여의 (influencer_id, campaign_id) 쌍만 페이지 단위로 끝까지 조회 (조인/카운트 없음)"""
+        try:
+            client = self.get_client()
+            if not client:
+                return []
+            
+            pairs = []
+            offset = 0
+            while True:
+                response = client.table('campaign_influencer_participations')\
+                    .select('influencer_id, campaign_id')\
+                    .order('id')\
+                    .range(offset, offset + page_size - 1)\
+                    .execute()
+                rows = response.data or []
+                pairs.extend(rows)
+                if len(rows) < page_size:
+                    break
+                offset += page_size
+            
+            return pairs
+        except Exception as e:
+            return []
+    
     def create_campaign_participation(self, participation_data: Dict[str, Any]) -> Dict[str, Any]:
         """캠페인 참여 생성"""
         try:
@@ -545,6 +1081,65 @@ class SimpleSupabaseClient:
         except Exception as e:
             return self._handle_error(e, "참여 생성")
     
+    def bulk_add_influencers_to_campaign(self, campaign_id: str, influencer_ids: List[str], participation_defaults: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """여러 인플루언서를 캠페인에 일괄 추가
+        
+        기존 참여는 in_() 조회로 한 번에 확인하고, 나머지만 청크 단위 insert로 추가합니다.
+        Args:
+            participation_defaults: 새 참여에 공통으로 넣을 값 (sample_status, cost_krw, memo 등)
+        Returns:
+            {"success", "added", "existing", "failed",
+             "results": {influencer_id: {"status": added|existing|failed, "message", "participation_id"}}}
+        """
+        try:
+            client = self.get_client()
+            if not client:
+                return {"success": False, "added": 0, "existing": 0, "failed": len(influencer_ids),
+                        "results": {}, "message": "데이터베이스 연결 실패"}
+            
+            influencer_ids = [str(i) for i in dict.fromkeys(influencer_ids) if i]
+            results: Dict[str, Dict[str, Any]] = {}
+            
+            for start in range(0, len(influencer_ids), self.IN_FILTER_CHUNK_SIZE):
+                chunk = influencer_ids[start:start + self.IN_FILTER_CHUNK_SIZE]
+                response = client.table("campaign_influencer_participations")\
+                    .select("id, influencer_id")\
+                    .eq("campaign_id", campaign_id)\
+                    .in_("influencer_id", chunk)\
+                    .execute()
+                for row in response.data or []:
+                    results[str(row["influencer_id"])] = {"status": "existing", "message": "이미 참여 중입니다.",
+                                                          "participation_id": row["id"]}
+            
+            defaults = dict(participation_defaults or {})
+            for field in ("id", "created_at", "updated_at", "created_by", "campaign_id", "influencer_id"):
+                defaults.pop(field, None)
+            if defaults.get("sample_status") not in (None, '요청', '발송준비', '발송완료', '수령'):
+                defaults["sample_status"] = '요청'
+            
+            new_ids = [i for i in influencer_ids if i not in results]
+            rows = [{**defaults, "campaign_id": campaign_id, "influencer_id": i} for i in new_ids]
+            written = self._bulk_write("campaign_influencer_participations", rows, on_conflict=None)
+            for influencer_id, result in zip(new_ids, written["results"]):
+                if result and result.get("success"):
+                    results[influencer_id] = {"status": "added", "message": "",
+                                              "participation_id": (result.get("data") or {}).get("id")}
+                else:
+                    results[influencer_id] = {"status": "failed", "message": (result or {}).get("message", "")}
+            
+            counts = {status: sum(1 for r in results.values() if r["status"] == status)
+                      for status in ("added", "existing", "failed")}
+            return {
+                "success": counts["failed"] == 0,
+                "added": counts["added"],
+                "existing": counts["existing"],
+                "failed": counts["failed"],
+                "results": results,
+                "message": f"추가 {counts['added']}명, 기존 참여 {counts['existing']}명, 실패 {counts['failed']}명"
+            }
+        except Exception as e:
+            return self._handle_error(e, "캠페인 참여 일괄 추가")
+    
     def update_campaign_participation(self, participation_id: str, update_data: Dict[str, Any]) -> Dict[str, Any]:
         """캠페인 참여 업데이트"""
         try:
@@ -591,6 +1186,24 @@ class SimpleSupabaseClient:
         except Exception as e:
             return self._handle_error(e, "참여 업데이트")
     
+    def bulk_update_campaign_participations(self, updates: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """캠페인 참여 정보 일괄 업데이트 ({participation_id: update_data}, 청크 단위 upsert)"""
+        try:
+            valid_statuses = ['요청', '발송준비', '발송완료', '수령']
+            cleaned = {}
+            for participation_id, update_data in updates.items():
+                # 자동 생성/작성자 필드는 업데이트하지 않음 (단건 업데이트와 동일 규칙)
+                data = {k: v for k, v in update_data.items() if k not in ('id', 'created_at', 'updated_at', 'created_by')}
+                if 'sample_status' in data and data['sample_status'] not in valid_statuses:
+                    data['sample_status'] = '요청'  # 기본값
+                cleaned[participation_id] = data
+            return self._bulk_update_by_id(
+                "campaign_influencer_participations", cleaned,
+                required_columns=["campaign_id", "influencer_id"]
+            )
+        except Exception as e:
+            return self._handle_error(e, "참여 일괄 업데이트")
+    
     def delete_campaign_participation(self, participation_id: str) -> Dict[str, Any]:
         """캠페인 참여 삭제"""
         try:
@@ -633,6 +1246,254 @@ class SimpleSupabaseClient:
         except Exception as e:
             return []
     
+    def get_contents_by_participation_ids(self, participation_ids: List[str], page_size: int = 1000) -> List[Dict[str, Any]]:
+        """여러 참여의 콘텐츠를 in_() 필터로 일괄 조회"""
+        try:
+            client = self.get_client()
+            if not client or not participation_ids:
+                return []
+            
+            contents = []
+            for start in range(0, len(participation_ids), self.IN_FILTER_CHUNK_SIZE):
+                chunk = list(participation_ids[start:start + self.IN_FILTER_CHUNK_SIZE])
+                offset = 0
+                while True:
+                    response = client.table("campaign_influencer_contents")\
+                        .select("*")\
+                        .in_("participation_id", chunk)\
+                        .order("created_at", desc=True)\
+                        .order("id")\
+                        .range(offset, offset + page_size - 1)\
+                        .execute()
+                    rows = response.data or []
+                    contents.extend(rows)
+                    if len(rows) < page_size:
+                        break
+                    offset += page_size
+            
+            return contents
+        except Exception as e:
+            return []
+    
+    def get_contents_by_campaign_ids(self, campaign_ids: List[str], updated_since: Optional[str] = None, page_size: int = 1000) -> List[Dict[str, Any]]:
+        """여러 캠페인에 속한 콘텐츠를 참여 테이블 조인 필터로 일괄 조회
+
+        updated_since가 주어지면 해당 시각 이후 수정된 콘텐츠만 조회 (증분 새로고침용)
+        결과 행에는 소속 campaign_id가 함께 포함됩니다.
+        """
+        try:
+            client = self.get_client()
+            if not client or not campaign_ids:
+                return []
+            
+            contents = []
+            for start in range(0, len(campaign_ids), self.IN_FILTER_CHUNK_SIZE):
+                chunk = list(campaign_ids[start:start + self.IN_FILTER_CHUNK_SIZE])
+                offset = 0
+                while True:
+                    query = client.table("campaign_influencer_contents")\
+                        .select("*, campaign_influencer_participations!inner(campaign_id)")\
+                        .in_("campaign_influencer_participations.campaign_id", chunk)
+                    if updated_since:
+                        query = query.gte("updated_at", updated_since)
+                    response = query.order("updated_at").order("id")\
+                        .range(offset, offset + page_size - 1)\
+                        .execute()
+                    rows = response.data or []
+                    for row in rows:
+                        participation = row.pop("campaign_influencer_participations", None) or {}
+                        row["campaign_id"] = participation.get("campaign_id")
+                        contents.append(row)
+                    if len(rows) < page_size:
+                        break
+                    offset += page_size
+            
+            return contents
+        except Exception as e:
+            return []
+    
+    def get_contents_by_urls(self, content_urls: List[str], chunk_size: int = 50) -> List[Dict[str, Any]]:
+        """콘텐츠 URL 목록으로 기존 콘텐츠 일괄 조회 (URL이 길어 in_() 청크를 작게 유지)"""
+        try:
+            client = self.get_client()
+            if not client or not content_urls:
+                return []
+            
+            contents = []
+            for start in range(0, len(content_urls), chunk_size):
+                chunk = list(content_urls[start:start + chunk_size])
+                response = client.table("campaign_influencer_contents")\
+                    .select("*")\
+                    .in_("content_url", chunk)\
+                    .execute()
+                contents.extend(response.data or [])
+            return contents
+        except Exception as e:
+            return []
+    
+    def get_participations_by_content_links(self, content_urls: List[str], chunk_size: int = 50) -> List[Dict[str, Any]]:
+        """content_links 배열에 주어진 URL이 포함된 참여 일괄 조회 (배열 겹침 필터)"""
+        try:
+            client = self.get_client()
+            if not client or not content_urls:
+                return []
+            
+            participations = []
+            for start in range(0, len(content_urls), chunk_size):
+                chunk = list(content_urls[start:start + chunk_size])
+                response = client.table("campaign_influencer_participations")\
+                    .select("id, campaign_id, influencer_id, content_links")\
+                    .ov("content_links", chunk)\
+                    .execute()
+                participations.extend(response.data or [])
+            return participations
+        except Exception as e:
+            return []
+    
+    def latest_ai_analysis_query(self, columns: str = "*", count: Optional[str] = None):
+        """latest_ai_analysis 뷰 조회 쿼리 (뷰의 distinct on 키 (platform, alias) 순으로 정렬)"""
+        client = self.get_client()
+        if not client:
+            return None
+        table = client.table(self.LATEST_AI_ANALYSIS_VIEW)
+        query = table.select(columns, count=count) if count else table.select(columns)
+        return query\
+            .order("platform")\
+            .order("alias")
+    
+    def _quote_filter_value(self, value: Any) -> str:
+        """PostgREST or() 필터 값 인용 (쉼표/괄호/따옴표가 포함된 alias 대응)"""
+        escaped = str(value).replace("\\", "\\\\").replace('"', '\\"')
+        return f'"{escaped}"'
+    
+    def latest_ai_analysis_page(self, columns: str = "*", after: Optional[Dict[str, Any]] = None,
+                                page_size: int = 1000, category: Optional[str] = None):
+        """latest_ai_analysis 뷰 1페이지 조회 - (platform, alias) 키셋 페이징
+        
+        offset 페이징은 페이지마다 앞 페이지의 distinct on 결과를 다시 계산하므로,
+        이전 페이지 마지막 행(after)의 (platform, alias) 이후 행만 조회합니다.
+        커서 계산을 위해 선택 컬럼에 platform, alias를 항상 포함합니다.
+        
+        Returns:
+            Supabase 응답 (response.data가 비어 있거나 page_size 미만이면 마지막 페이지)
+        """
+        if columns.strip() != "*":
+            selected = {c.strip() for c in columns.split(",")}
+            columns = ", ".join([columns] + [c for c in ("platform", "alias") if c not in selected])
+        query = self.latest_ai_analysis_query(columns)
+        if query is None:
+            raise ConnectionError("데이터베이스 연결 실패")
+        if category:
+            query = query.eq("category", category)
+        if after:
+            platform = self._quote_filter_value(after["platform"])
+            alias = self._quote_filter_value(after["alias"])
+            query = query.or_(f"platform.gt.{platform},and(platform.eq.{platform},alias.gt.{alias})")
+        return query.limit(page_size).execute()
+    
+    def get_latest_ai_analyses(self, columns: str = "*", keys: Optional[List[tuple]] = None,
+                               category: Optional[str] = None, page_size: int = 1000) -> List[Dict[str, Any]]:
+        """인플루언서별 최신 AI 분석 1건씩 조회 (키셋 페이지 단위로 끝까지)
+        
+        keys: (platform, alias) 목록 - 지정 시 플랫폼별 alias in_() 청크 조회
+        """
+        try:
+            if keys is not None and not keys:
+                return []
+            
+            if keys is None:
+                analyses = []
+                last_row = None
+                while True:
+                    rows = self.latest_ai_analysis_page(columns, after=last_row, page_size=page_size, category=category).data or []
+                    analyses.extend(rows)
+                    if len(rows) < page_size:
+                        break
+                    last_row = rows[-1]
+                return analyses
+            
+            aliases_by_platform: Dict[str, List[str]] = {}
+            for platform, alias in dict.fromkeys(keys):
+                if platform and alias:
+                    aliases_by_platform.setdefault(platform, []).append(alias)
+            
+            # 청크 크기(IN_FILTER_CHUNK_SIZE)가 페이지 크기보다 작아 (platform, alias)당 1행인 결과는 한 번에 모두 조회됨
+            analyses = []
+            for platform, aliases in aliases_by_platform.items():
+                for start in range(0, len(aliases), self.IN_FILTER_CHUNK_SIZE):
+                    query = self.latest_ai_analysis_query(columns)
+                    if query is None:
+                        return []
+                    query = query.eq("platform", platform).in_("alias", aliases[start:start + self.IN_FILTER_CHUNK_SIZE])
+                    if category:
+                        query = query.eq("category", category)
+                    analyses.extend(query.execute().data or [])
+            return analyses
+        except Exception as e:
+            return []
+    
+    def get_content_metric_trend(self, campaign_ids: List[str], bucket: str = "day", start: Optional[str] = None, end: Optional[str] = None, page_size: int = 1000) -> Optional[List[Dict[str, Any]]]:
+        """캠페인 × 플랫폼 × 기간 버킷(day/week/month)별 콘텐츠 성과 합계 조회 (get_content_metric_trend RPC, 페이지 단위로 끝까지 조회)
+
+        Returns:
+            집계 행 목록 (결과가 없으면 빈 리스트), RPC를 사용할 수 없거나 오류가 나면 None
+        """
+        try:
+            client = self.get_client()
+            if not client:
+                return None
+            if not campaign_ids:
+                return []
+            
+            params = {
+                "p_campaign_ids": list(campaign_ids),
+                "p_bucket": bucket,
+                "p_start": start,
+                "p_end": end,
+            }
+            trend = []
+            offset = 0
+            while True:
+                response = client.rpc("get_content_metric_trend", params)\
+                    .range(offset, offset + page_size - 1)\
+                    .execute()
+                rows = response.data or []
+                trend.extend(rows)
+                if len(rows) < page_size:
+                    break
+                offset += page_size
+            return trend
+        except Exception as e:
+            return None
+    
+    def get_content_metric_history(self, content_ids: List[str], bucket: str = "day", start: Optional[str] = None, end: Optional[str] = None, page_size: int = 1000) -> List[Dict[str, Any]]:
+        """여러 콘텐츠의 지표 성장 곡선 조회 (버킷별 마지막 스냅샷, get_content_metric_history RPC, 페이지 단위로 끝까지 조회)"""
+        try:
+            client = self.get_client()
+            if not client or not content_ids:
+                return []
+            
+            params = {
+                "p_content_ids": list(content_ids),
+                "p_bucket": bucket,
+                "p_start": start,
+                "p_end": end,
+            }
+            history = []
+            offset = 0
+            while True:
+                response = client.rpc("get_content_metric_history", params)\
+                    .range(offset, offset + page_size - 1)\
+                    .execute()
+                rows = response.data or []
+                history.extend(rows)
+                if len(rows) < page_size:
+                    break
+                offset += page_size
+            return history
+        except Exception as e:
+            return []
+    
     def create_campaign_influencer_content(self, content_data: Dict[str, Any]) -> Dict[str, Any]:
         """캠페인 인플루언서 콘텐츠 생성"""
         try:
@@ -659,6 +1520,34 @@ class SimpleSupabaseClient:
         except Exception as e:
             return self._handle_error(e, "콘텐츠 생성")
     
+    def bulk_save_campaign_influencer_contents(self, contents: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """콘텐츠 일괄 저장 - id가 있는 행은 id 기준 upsert, 없는 행은 insert (각각 청크 단위 요청)
+        
+        Returns: _bulk_write와 동일 (results는 입력 순서 유지)
+        """
+        try:
+            rows = [{k: v for k, v in c.items() if k != "created_by"} for c in contents]
+            update_idx = [i for i, row in enumerate(rows) if row.get("id")]
+            insert_idx = [i for i, row in enumerate(rows) if not row.get("id")]
+            
+            results: List[Optional[Dict[str, Any]]] = [None] * len(rows)
+            for indices, on_conflict in ((update_idx, "id"), (insert_idx, None)):
+                if not indices:
+                    continue
+                written = self._bulk_write("campaign_influencer_contents", [rows[i] for i in indices], on_conflict=on_conflict)
+                for i, result in zip(indices, written["results"]):
+                    results[i] = result
+            
+            saved = sum(1 for r in results if r and r.get("success"))
+            return {
+                "success": saved == len(rows),
+                "saved": saved,
+                "results": results,
+                "message": f"{saved}/{len(rows)}건의 콘텐츠가 저장되었습니다."
+            }
+        except Exception as e:
+            return self._handle_error(e, "콘텐츠 일괄 저장")
+    
     def update_campaign_influencer_content(self, content_id: str, update_data: Dict[str, Any]) -> Dict[str, Any]:
         """캠페인 인플루언서 콘텐츠 업데이트"""
         try:
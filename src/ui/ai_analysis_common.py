@@ -14,6 +14,33 @@ import numpy as np
 import time
 from ..db.database import db_manager
 from ..supabase.simple_client import simple_client
+from ..utils.llm_replay import llm_replay
+
+def _fetch_analyzed_ids(client, batch_size=1000):
+    """ai_analysis_status 테이블에서 is_analyzed=TRUE인 ID 집합 조회 (분석 대상 제외 목록)"""
+    analyzed_ids = set()
+    offset = 0
+    
+    while True:
+        analysis_status_response = client.table("ai_analysis_status").select("id")\
+            .eq("is_analyzed", True)\
+            .limit(batch_size)\
+            .range(offset, offset + batch_size - 1).execute()
+        
+        if not analysis_status_response.data:
+            break
+        
+        # 이미 분석된 ID 목록에 추가
+        for item in analysis_status_response.data:
+            analyzed_ids.add(item["id"])
+        
+        offset += batch_size
+        
+        # 마지막 배치면 종료
+        if len(analysis_status_response.data) < batch_size:
+            break
+    
+    return analyzed_ids
 
 def get_completed_crawling_data(client, limit=1000, offset=0):
     """크롤링 완료되고 AI 분석이 필요한 데이터 조회 (페이징) - 재시도 포함
@@ -32,27 +59,7 @@ def get_completed_crawling_data(client, limit=1000, offset=0):
             
             # 1단계: ai_analysis_status 테이블에서 is_analyzed=TRUE인 ID 목록을 가져와서 제외 목록 생성
             batch_size = 1000  # Supabase 최대 limit
-            analyzed_ids = set()
-            analysis_offset = 0
-            
-            while True:
-                analysis_status_response = client.table("ai_analysis_status").select("id")\
-                    .eq("is_analyzed", True)\
-                    .limit(batch_size)\
-                    .range(analysis_offset, analysis_offset + batch_size - 1).execute()
-                
-                if not analysis_status_response.data:
-                    break
-                
-                # 이미 분석된 ID 목록에 추가
-                for item in analysis_status_response.data:
-                    analyzed_ids.add(item["id"])
-                
-                analysis_offset += batch_size
-                
-                # 마지막 배치면 종료
-                if len(analysis_status_response.data) < batch_size:
-                    break
+            analyzed_ids = _fetch_analyzed_ids(client, batch_size)
             
             # 2단계: tb_instagram_crawling에서 status='COMPLETE'인 모든 데이터를 배치로 조회
             collected_data = []
@@ -117,27 +124,7 @@ def get_completed_crawling_data_count(client):
             
             # 1단계: ai_analysis_status 테이블에서 is_analyzed=TRUE인 ID 목록을 가져와서 제외 목록 생성
             batch_size = 1000  # Supabase 최대 limit
-            analyzed_ids = set()
-            offset = 0
-            
-            while True:
-                analysis_status_response = client.table("ai_analysis_status").select("id")\
-                    .eq("is_analyzed", True)\
-                    .limit(batch_size)\
-                    .range(offset, offset + batch_size - 1).execute()
-                
-                if not analysis_status_response.data:
-                    break
-                
-                # 이미 분석된 ID 목록에 추가
-                for item in analysis_status_response.data:
-                    analyzed_ids.add(item["id"])
-                
-                offset += batch_size
-                
-                # 마지막 배치면 종료
-                if len(analysis_status_response.data) < batch_size:
-                    break
+            analyzed_ids = _fetch_analyzed_ids(client, batch_size)
             
             # 2단계: tb_instagram_crawling에서 status='COMPLETE'인 모든 데이터를 배치로 조회
             total_count = 0
@@ -184,6 +171,56 @@ def get_completed_crawling_data_count(client):
                 return 0
     return 0
 
+def iter_pending_crawling_data(client, batch_size=1000):
+    """AI 분석 대상 크롤링 데이터를 페이지 단위로 스트리밍 (id, description, posts만 조회)
+    - 전체 목록을 메모리에 모으지 않고 페이지별 리스트를 yield
+    """
+    if not client:
+        return
+    
+    analyzed_ids = _fetch_analyzed_ids(client, batch_size)
+    crawling_offset = 0
+    
+    while True:
+        response = client.table("tb_instagram_crawling").select("id, description, posts")\
+            .eq("status", "COMPLETE")\
+            .range(crawling_offset, crawling_offset + batch_size - 1).execute()
+        
+        if not response.data:
+            break
+        
+        page = [
+            data for data in response.data
+            if data.get("id") not in analyzed_ids
+            and data.get("posts") and data.get("posts").strip()
+        ]
+        if page:
+            yield page
+        
+        crawling_offset += batch_size
+        
+        # 마지막 배치면 종료
+        if len(response.data) < batch_size:
+            break
+
+def get_recent_analysis_latencies(client, limit=500):
+    """과거 실행에서 기록된 AI 호출 지연 시간(ms) 목록 (notes.input_metrics.latency_ms)"""
+    if not client:
+        return []
+    try:
+        response = client.table("ai_influencer_analyses_new")\
+            .select("input_metrics:notes->input_metrics")\
+            .order("analyzed_at", desc=True)\
+            .limit(limit).execute()
+        latencies = []
+        for item in response.data or []:
+            metrics = item.get("input_metrics")
+            if isinstance(metrics, dict) and metrics.get("latency_ms"):
+                latencies.append(float(metrics["latency_ms"]))
+        return latencies
+    except Exception:
+        return []
+
 def is_recently_analyzed_by_id(client, crawling_id):
     """크롤링 ID 최근 분석 여부(30일) - ai_influencer_analyses_new 테이블에서 확인"""
     max_retries = 3
@@ -215,7 +252,48 @@ def is_recently_analyzed_by_id(client, crawling_id):
                 return False
     return False
 
-def save_ai_analysis_result(client, crawling_data, analysis_result, crawling_id):
+def compute_content_hash(description, posts):
+    """AI 분석 입력(description + posts)의 SHA-256 해시 계산"""
+    import hashlib
+    payload = json.dumps(
+        {"description": description or "", "posts": posts or ""},
+        ensure_ascii=False,
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def get_stored_content_hashes(client, crawling_ids):
+    """크롤링 ID 목록의 마지막 분석 입력 해시를 한 번의 in_() 조회로 가져오기"""
+    if not client or not crawling_ids:
+        return {}
+    try:
+        response = client.table("ai_analysis_status").select("id, content_hash")\
+            .in_("id", list(crawling_ids))\
+            .execute()
+        return {
+            item["id"]: item["content_hash"]
+            for item in (response.data or [])
+            if item.get("content_hash")
+        }
+    except Exception:
+        # content_hash 컬럼이 없거나 조회 실패 시 사전 확인 없이 분석 진행
+        return {}
+
+def restamp_unchanged_analysis(client, crawling_id, content_hash):
+    """입력이 변경되지 않은 프로필은 LLM 호출 없이 분석 완료 상태만 갱신"""
+    now = datetime.now().isoformat()
+    client.table("ai_analysis_status").update({
+        "is_analyzed": True,
+        "content_hash": content_hash,
+        "updated_at": now
+    }).eq("id", crawling_id).execute()
+
+    client.table("tb_instagram_crawling").update({
+        "ai_analysis_status": True,
+        "updated_at": now
+    }).eq("id", crawling_id).execute()
+
+def save_ai_analysis_result(client, crawling_data, analysis_result, crawling_id, content_hash=None):
     """AI 분석 결과 저장 - client 주입 버전"""
     max_retries = 3
     retry_delay = 1
@@ -224,9 +302,11 @@ def save_ai_analysis_result(client, crawling_data, analysis_result, crawling_id)
             if not client:
                 raise Exception("Supabase 클라이언트 없음")
 
-            # 추적용 crawling_id 주입
+            # 추적용 crawling_id 및 입력 해시 주입
             if "notes" in analysis_result and isinstance(analysis_result["notes"], dict):
                 analysis_result["notes"]["crawling_id"] = crawling_id
+                if content_hash:
+                    analysis_result["notes"]["content_hash"] = content_hash
 
             # 새 테이블 사용 (ai_influencer_analyses_new)
             # unique constraint: (influencer_id, alias, analyzed_on) 기준으로 중복 체크
@@ -246,23 +326,34 @@ def save_ai_analysis_result(client, crawling_data, analysis_result, crawling_id)
                 client.table("ai_influencer_analyses_new").insert(analysis_result).execute()
             
             # AI 분석 상태 업데이트 (트리거가 있지만 명시적으로도 업데이트)
+            analyzed_at = analysis_result.get("analyzed_at", datetime.now().isoformat())
             try:
-                analyzed_at = analysis_result.get("analyzed_at", datetime.now().isoformat())
-                client.table("ai_analysis_status").upsert({
+                status_data = {
                     "id": crawling_id,
                     "is_analyzed": True,
                     "analyzed_at": analyzed_at,
                     "updated_at": datetime.now().isoformat()
-                }).execute()
-                
-                # tb_instagram_crawling 테이블의 AI 분석 상태도 업데이트
+                }
+                if content_hash:
+                    try:
+                        client.table("ai_analysis_status").upsert({**status_data, "content_hash": content_hash}).execute()
+                    except Exception:
+                        # content_hash 컬럼이 없는 경우(마이그레이션 미적용) 해시 없이 상태만 갱신
+                        client.table("ai_analysis_status").upsert(status_data).execute()
+                else:
+                    client.table("ai_analysis_status").upsert(status_data).execute()
+            except Exception as status_error:
+                st.warning(f"AI 분석 상태 업데이트 중 오류 (분석 결과는 저장됨): {str(status_error)}")
+            
+            # tb_instagram_crawling 테이블의 AI 분석 상태도 업데이트 (ai_analysis_status 실패와 별개로 진행)
+            try:
                 client.table("tb_instagram_crawling").update({
                     "ai_analysis_status": True,
                     "ai_analyzed_at": analyzed_at,
                     "updated_at": datetime.now().isoformat()
                 }).eq("id", crawling_id).execute()
             except Exception as status_error:
-                st.warning(f"AI 분석 상태 업데이트 중 오류 (분석 결과는 저장됨): {str(status_error)}")
+                st.warning(f"크롤링 분석 상태 업데이트 중 오류 (분석 결과는 저장됨): {str(status_error)}")
             
             return
 
@@ -279,6 +370,7 @@ def save_ai_analysis_result(client, crawling_data, analysis_result, crawling_id)
                 st.error(f"AI 분석 결과 저장 오류: {error_msg}")
                 raise
 
+@llm_replay("perform_ai_analysis")
 def perform_ai_analysis(data):
     """AI 분석 수행 - 5분 타임아웃, 재시도 로직 포함"""
     from openai import OpenAI
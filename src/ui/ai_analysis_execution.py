@@ -8,11 +8,18 @@ from ..supabase.simple_client import simple_client
 from .ai_analysis_common import (
     get_completed_crawling_data, 
     get_completed_crawling_data_count,
+    iter_pending_crawling_data,
+    get_recent_analysis_latencies,
     is_recently_analyzed_by_id,
+    compute_content_hash,
+    get_stored_content_hashes,
+    restamp_unchanged_analysis,
     save_ai_analysis_result,
     perform_ai_analysis,
     transform_to_db_format
 )
+from ..utils.ai_input_preprocessor import compact_ai_input, get_input_token_budget
+from ..utils.ai_run_estimator import estimate_analysis_run
 
 def render_ai_analysis_execution():
     """AI 분석 실행 탭"""
@@ -49,6 +56,8 @@ def render_ai_analysis_execution():
     
     # 분석 실행 버튼 (분석 중이 아닐 때만 표시)
     if not st.session_state.ai_analysis_running:
+        render_ai_analysis_estimator()
+        
         if st.button("🚀 AI 분석 시작", type="primary"):
             st.session_state.ai_analysis_running = True
             st.session_state.ai_analysis_stop_requested = False
@@ -83,11 +92,13 @@ def render_ai_analysis_execution():
                 # 건너뛴 이유 상세 정보 표시
                 if result.get("skipped_count", 0) > 0:
                     st.markdown("#### 📋 건너뛴 이유 상세")
-                    skip_col1, skip_col2 = st.columns(2)
+                    skip_col1, skip_col2, skip_col3 = st.columns(3)
                     with skip_col1:
                         st.info(f"🕐 최근 30일 이내 분석됨: **{result.get('skipped_recent_analysis', 0)}개**")
                     with skip_col2:
                         st.info(f"📝 posts 데이터 없음: **{result.get('skipped_no_posts', 0)}개**")
+                    with skip_col3:
+                        st.info(f"♻️ 내용 변경 없음: **{result.get('skipped_unchanged', 0)}개**")
                 
                 
                 # 실패한 항목들 표시
@@ -99,6 +110,94 @@ def render_ai_analysis_execution():
             else:
                 st.error(f"❌ AI 분석 실패: {result['error']}")
 
+def render_ai_analysis_estimator():
+    """AI 분석 실행 전 비용/소요 시간 추정 (dry-run, LLM 호출 없음)"""
+    with st.expander("💰 실행 비용/소요 시간 추정 (Dry-run)", expanded=False):
+        st.caption("분석 대기 중인 프로필의 입력 토큰을 로컬 토크나이저로 계산하고, 과거 실행의 호출 지연 시간으로 총 비용과 소요 시간을 추정합니다.")
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            concurrency = st.number_input("동시 호출 수", min_value=1, max_value=64, value=1, step=1, key="estimator_concurrency")
+            avg_output_tokens = st.number_input("호출당 평균 출력 토큰", min_value=0, value=2000, step=100, key="estimator_output_tokens")
+        with col2:
+            rate_limit = st.number_input("분당 최대 호출 수 (0: 제한 없음)", min_value=0, value=0, step=10, key="estimator_rate_limit")
+            default_latency = st.number_input("기본 호출 지연(초, 기록 없을 때)", min_value=1.0, value=30.0, step=5.0, key="estimator_default_latency")
+        with col3:
+            input_price = st.number_input("입력 100만 토큰당 가격($)", min_value=0.0, value=0.25, step=0.05, format="%.2f", key="estimator_input_price")
+            output_price = st.number_input("출력 100만 토큰당 가격($)", min_value=0.0, value=2.0, step=0.1, format="%.2f", key="estimator_output_price")
+        
+        if st.button("🧮 추정 실행", key="run_ai_analysis_estimator"):
+            client = simple_client.get_client()
+            if not client:
+                st.error("Supabase 클라이언트 생성 실패")
+                return
+            
+            token_budget = get_input_token_budget()
+            input_tokens = []
+            unchanged_count = 0
+            status_text = st.empty()
+            
+            try:
+                for page in iter_pending_crawling_data(client):
+                    stored_hashes = get_stored_content_hashes(client, [d["id"] for d in page])
+                    for data in page:
+                        if stored_hashes.get(data["id"]) == compute_content_hash(data.get("description"), data.get("posts")):
+                            # 변경 없는 프로필은 LLM 호출 없이 상태만 갱신됨
+                            unchanged_count += 1
+                            continue
+                        _, metrics = compact_ai_input(data, token_budget=token_budget)
+                        input_tokens.append(metrics["compacted_tokens"])
+                    status_text.text(f"토큰 계산 중... {len(input_tokens) + unchanged_count:,}개")
+            except Exception as e:
+                st.error(f"분석 대기 데이터 조회 중 오류: {str(e)}")
+                return
+            finally:
+                status_text.empty()
+            
+            st.session_state.ai_analysis_estimate = {
+                "unchanged_count": unchanged_count,
+                **estimate_analysis_run(
+                    input_tokens,
+                    get_recent_analysis_latencies(client),
+                    concurrency=concurrency,
+                    rate_limit_per_minute=rate_limit or None,
+                    avg_output_tokens=avg_output_tokens,
+                    input_price_per_1m=input_price,
+                    output_price_per_1m=output_price,
+                    default_latency_seconds=default_latency
+                )
+            }
+        
+        estimate = st.session_state.get("ai_analysis_estimate")
+        if estimate:
+            c1, c2, c3, c4 = st.columns(4)
+            c1.metric("🤖 LLM 호출", f"{estimate['call_count']:,}", help=f"변경 없음(호출 생략): {estimate['unchanged_count']:,}개")
+            c2.metric("🧮 총 토큰", f"{estimate['total_input_tokens'] + estimate['total_output_tokens']:,}",
+                      help=f"입력 {estimate['total_input_tokens']:,} / 출력 {estimate['total_output_tokens']:,}")
+            c3.metric("💵 예상 비용", f"${estimate['estimated_cost_usd']:,.2f}")
+            c4.metric("⏱️ 예상 소요 시간", _format_duration(estimate["wall_seconds"]),
+                      help=f"p90 지연 기준: {_format_duration(estimate['wall_seconds_p90'])}")
+            
+            if estimate["latency_samples"]:
+                st.caption(
+                    f"과거 호출 {estimate['latency_samples']:,}건 기준 지연: 평균 {estimate['mean_latency_seconds']:.1f}초, "
+                    f"p50 {estimate['p50_latency_seconds']:.1f}초, p90 {estimate['p90_latency_seconds']:.1f}초 · "
+                    f"프로필당 평균 입력 {estimate['avg_input_tokens']:,.0f} 토큰 (최대 {estimate['max_input_tokens']:,})"
+                )
+            else:
+                st.caption("과거 호출 지연 기록이 없어 기본 지연 값으로 추정했습니다.")
+
+def _format_duration(seconds):
+    """초 단위 시간을 읽기 쉬운 문자열로 변환"""
+    seconds = int(round(seconds))
+    hours, remainder = divmod(seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
+    if hours:
+        return f"{hours}시간 {minutes}분"
+    if minutes:
+        return f"{minutes}분 {secs}초"
+    return f"{secs}초"
+
 def execute_ai_analysis():
     """AI 분석 실행 함수 (배치 처리) - 안정화 버전"""
     try:
@@ -128,9 +227,12 @@ def execute_ai_analysis():
         skipped_count = 0
         skipped_recent_analysis = 0  # 최근 분석으로 건너뛴 개수
         skipped_no_posts = 0  # posts가 없어서 건너뛴 개수
+        skipped_unchanged = 0  # 마지막 분석 이후 내용 변경이 없어 건너뛴 개수
         failed_count = 0
         processed_count = 0
         failed_items = []
+        total_original_tokens = 0  # 전처리 전 입력 토큰 합계
+        total_compacted_tokens = 0  # 전처리 후 입력 토큰 합계
         
         # 실제 처리된 항목 수를 추적 (total_count는 초기 예상치일 뿐)
         actual_processed_count = 0
@@ -152,6 +254,7 @@ def execute_ai_analysis():
                     "skipped_count": skipped_count,
                     "skipped_recent_analysis": skipped_recent_analysis,
                     "skipped_no_posts": skipped_no_posts,
+                    "skipped_unchanged": skipped_unchanged,
                     "failed_count": failed_count,
                     "total_count": total_count,
                     "failed_items": failed_items
@@ -173,6 +276,11 @@ def execute_ai_analysis():
             batch_progress_bar = st.progress(0)
             batch_status_text = st.empty()
 
+            # 배치 단위로 마지막 분석 입력 해시를 한 번에 조회 (변경 없는 프로필 사전 확인용)
+            stored_hashes = get_stored_content_hashes(
+                client, [d.get("id") for d in batch_data if d.get("id")]
+            )
+
             for index, data in enumerate(batch_data):
                 # 각 항목 처리 전에도 중지 요청 확인
                 if st.session_state.get("ai_analysis_stop_requested", False):
@@ -182,6 +290,9 @@ def execute_ai_analysis():
                         "stopped": True,
                         "analyzed_count": analyzed_count,
                         "skipped_count": skipped_count,
+                        "skipped_recent_analysis": skipped_recent_analysis,
+                        "skipped_no_posts": skipped_no_posts,
+                        "skipped_unchanged": skipped_unchanged,
                         "failed_count": failed_count,
                         "total_count": total_count,
                         "failed_items": failed_items
@@ -208,6 +319,21 @@ def execute_ai_analysis():
                     batch_progress_bar.progress(batch_progress)
                     batch_status_text.text(f"배치 {batch_num + 1} 진행: {index + 1}/{len(batch_data)} - {current_id}")
 
+                    # 0) 입력 해시 사전 확인 (마지막 분석 이후 description/posts 변경이 없으면 상태만 갱신)
+                    content_hash = compute_content_hash(data.get("description"), data.get("posts"))
+                    if stored_hashes.get(data["id"]) == content_hash:
+                        try:
+                            restamp_unchanged_analysis(client, data["id"], content_hash)
+                        except Exception as restamp_error:
+                            # 상태가 갱신되지 않아 다음 실행에서 다시 조회되므로 건너뜀이 아닌 실패로 집계
+                            st.warning(f"⚠️ {current_id}: 분석 상태 갱신 실패 - {str(restamp_error)}")
+                            failed_items.append({"id": current_id, "error": f"상태 갱신 실패: {str(restamp_error)}"})
+                            failed_count += 1
+                            continue
+                        skipped_count += 1
+                        skipped_unchanged += 1
+                        continue
+
                     # 1) 최근 분석 여부 체크 (30일 이내 분석된 것은 건너뛰기)
                     # 새로운 조건에서는 ai_analysis_status.is_analyzed = FALSE인 것만 조회하므로
                     # 30일 체크는 선택적으로 적용 (강제 재분석 방지용)
@@ -216,7 +342,7 @@ def execute_ai_analysis():
                         skipped_recent_analysis += 1
                         continue
 
-                    # 2) 입력 구성 (posts는 자르지 않음)
+                    # 2) 입력 구성 (posts는 아래 전처리 단계에서 토큰 예산 내로 압축)
                     posts_content = data.get("posts", "") or ""
                     if not posts_content:
                         # posts 데이터가 없는 경우는 분석 불가능하므로 is_analyzed를 TRUE로 업데이트
@@ -245,8 +371,15 @@ def execute_ai_analysis():
                         "posts": posts_content
                     }
 
+                    # 2-1) 입력 전처리 (중복 캡션/해시태그, URL 제거 및 토큰 예산 적용)
+                    ai_input_data, input_metrics = compact_ai_input(ai_input_data)
+                    total_original_tokens += input_metrics["original_tokens"]
+                    total_compacted_tokens += input_metrics["compacted_tokens"]
+
                     # 3) AI 분석
+                    call_started = time.perf_counter()
                     analysis_result = perform_ai_analysis(ai_input_data)
+                    input_metrics["latency_ms"] = round((time.perf_counter() - call_started) * 1000, 1)
                     if not analysis_result:
                         failed_items.append({"id": current_id, "error": "AI 분석 실패"})
                         failed_count += 1
@@ -259,9 +392,12 @@ def execute_ai_analysis():
                         failed_count += 1
                         continue
 
+                    # 품질 대비 비용 비교를 위해 항목별 토큰 수/지연 시간을 분석 결과 notes에 기록
+                    transformed_result["notes"]["input_metrics"] = input_metrics
+
                     # 5) 저장
                     try:
-                        save_ai_analysis_result(client, data, transformed_result, data["id"])
+                        save_ai_analysis_result(client, data, transformed_result, data["id"], content_hash=content_hash)
                         analyzed_count += 1
                     except Exception as se:
                         failed_items.append({"id": current_id, "error": f"저장 실패: {str(se)}"})
@@ -281,7 +417,7 @@ def execute_ai_analysis():
                                 
                                 # 건너뛴 이유 상세 정보
                                 if skipped_count > 0:
-                                    st.caption(f"건너뛴 이유: 최근 분석 {skipped_recent_analysis}개, posts 없음 {skipped_no_posts}개")
+                                    st.caption(f"건너뛴 이유: 최근 분석 {skipped_recent_analysis}개, posts 없음 {skipped_no_posts}개, 변경 없음 {skipped_unchanged}개")
                                 
                                 # 중지 요청 상태 표시
                                 if st.session_state.get("ai_analysis_stop_requested", False):
@@ -345,11 +481,20 @@ def execute_ai_analysis():
             # 건너뛴 이유 상세 정보 표시
             if skipped_count > 0:
                 st.markdown("#### 📋 건너뛴 이유 상세")
-                skip_col1, skip_col2 = st.columns(2)
+                skip_col1, skip_col2, skip_col3 = st.columns(3)
                 with skip_col1:
                     st.info(f"🕐 최근 30일 이내 분석됨: **{skipped_recent_analysis}개**")
                 with skip_col2:
                     st.info(f"📝 posts 데이터 없음: **{skipped_no_posts}개**")
+                with skip_col3:
+                    st.info(f"♻️ 내용 변경 없음: **{skipped_unchanged}개**")
+
+            if total_original_tokens > 0:
+                saved_ratio = (1 - total_compacted_tokens / total_original_tokens) * 100
+                st.caption(
+                    f"🧮 입력 토큰: {total_original_tokens:,} → {total_compacted_tokens:,} "
+                    f"({saved_ratio:.1f}% 절감)"
+                )
 
             if failed_items:
                 st.markdown("### ❌ 실패한 항목들")
@@ -363,8 +508,11 @@ def execute_ai_analysis():
             "skipped_count": skipped_count,
             "skipped_recent_analysis": skipped_recent_analysis,
             "skipped_no_posts": skipped_no_posts,
+            "skipped_unchanged": skipped_unchanged,
             "failed_count": failed_count,
             "total_count": total_count,
+            "total_original_tokens": total_original_tokens,
+            "total_compacted_tokens": total_compacted_tokens,
             "failed_items": failed_items
         }
 
@@ -91,11 +91,11 @@ def get_average_overall_score():
         
         all_scores = []
         page_size = 1000
-        offset = 0
+        last_row = None
         
         while True:
             # 페이징으로 데이터 가져오기
-            response = client.table("ai_influencer_analyses_new").select("evaluation").range(offset, offset + page_size - 1).execute()
+            response = simple_client.latest_ai_analysis_page("evaluation", after=last_row, page_size=page_size)
             
             if not response.data or len(response.data) == 0:
                 break
@@ -118,7 +118,7 @@ def get_average_overall_score():
             if len(response.data) < page_size:
                 break
                 
-            offset += page_size
+            last_row = response.data[-1]
         
         avg_score = sum(all_scores) / len(all_scores) if all_scores else 0
         
@@ -136,11 +136,11 @@ def get_category_average_scores():
         
         category_scores = {}  # {category: [scores]}
         page_size = 1000
-        offset = 0
+        last_row = None
         
         while True:
             # 페이징으로 데이터 가져오기
-            response = client.table("ai_influencer_analyses_new").select("category, evaluation").range(offset, offset + page_size - 1).execute()
+            response = simple_client.latest_ai_analysis_page("category, evaluation", after=last_row, page_size=page_size)
             
             if not response.data or len(response.data) == 0:
                 break
@@ -165,7 +165,7 @@ def get_category_average_scores():
             if len(response.data) < page_size:
                 break
                 
-            offset += page_size
+            last_row = response.data[-1]
         
         # 카테고리별 평균 계산
         category_averages = {}
@@ -188,13 +188,13 @@ def get_recommendation_distribution():
         
         all_recommendations = []
         page_size = 1000
-        offset = 0
+        last_row = None
         
         print(f"Starting to fetch all recommendations with pagination...")
         
         while True:
             # 페이징으로 데이터 가져오기
-            response = client.table("ai_influencer_analyses_new").select("recommendation").range(offset, offset + page_size - 1).execute()
+            response = simple_client.latest_ai_analysis_page("recommendation", after=last_row, page_size=page_size)
             
             if not response.data or len(response.data) == 0:
                 break
@@ -203,13 +203,13 @@ def get_recommendation_distribution():
             page_recommendations = [item.get("recommendation") for item in response.data if item.get("recommendation")]
             all_recommendations.extend(page_recommendations)
             
-            print(f"Fetched page {offset//page_size + 1}: {len(response.data)} records, {len(page_recommendations)} recommendations")
+            print(f"Fetched page: {len(response.data)} records, {len(page_recommendations)} recommendations")
             
             # 더 이상 데이터가 없으면 중단
             if len(response.data) < page_size:
                 break
                 
-            offset += page_size
+            last_row = response.data[-1]
         
         print(f"Total recommendations collected: {len(all_recommendations)}")
         
@@ -233,13 +233,13 @@ def get_category_distribution():
         
         all_categories = []
         page_size = 1000
-        offset = 0
+        last_row = None
         
         print(f"Starting to fetch all categories with pagination...")
         
         while True:
             # 페이징으로 데이터 가져오기
-            response = client.table("ai_influencer_analyses_new").select("category").range(offset, offset + page_size - 1).execute()
+            response = simple_client.latest_ai_analysis_page("category", after=last_row, page_size=page_size)
             
             if not response.data or len(response.data) == 0:
                 break
@@ -248,13 +248,13 @@ def get_category_distribution():
             page_categories = [item.get("category") for item in response.data if item.get("category")]
             all_categories.extend(page_categories)
             
-            print(f"Fetched page {offset//page_size + 1}: {len(response.data)} records, {len(page_categories)} categories")
+            print(f"Fetched page: {len(response.data)} records, {len(page_categories)} categories")
             
             # 더 이상 데이터가 없으면 중단
             if len(response.data) < page_size:
                 break
                 
-            offset += page_size
+            last_row = response.data[-1]
         
         print(f"Total categories collected: {len(all_categories)}")
         
@@ -275,7 +275,7 @@ def get_category_distribution():
         return {}
 
 def get_analysis_rate():
-    """분석률 조회 - tb_instagram_crawling 테이블 대비 ai_influencer_analyses 테이블의 비율"""
+    """분석률 조회 - tb_instagram_crawling 테이블 대비 분석된 인플루언서(latest_ai_analysis) 비율"""
     try:
         client = simple_client.get_client()
         if not client:
@@ -285,8 +285,8 @@ def get_analysis_rate():
         crawling_response = client.table("tb_instagram_crawling").select("id", count="exact").limit(10000).execute()
         total_crawling_count = crawling_response.count if crawling_response.count else 0
         
-        # ai_influencer_analyses 테이블의 총 분석 수
-        analysis_response = client.table("ai_influencer_analyses_new").select("id", count="exact").limit(10000).execute()
+        # 분석된 인플루언서 수 (재분석 이력은 한 번만 집계)
+        analysis_response = simple_client.latest_ai_analysis_query("id", count="exact").limit(1).execute()
         total_analysis_count = analysis_response.count if analysis_response.count else 0
         
         analysis_rate = (total_analysis_count / total_crawling_count) * 100 if total_crawling_count > 0 else 0
@@ -305,13 +305,13 @@ def get_tags_for_wordcloud():
         
         all_tags = []
         page_size = 1000
-        offset = 0
+        last_row = None
         
         print(f"Starting to fetch all tags with pagination...")
         
         while True:
             # 페이징으로 데이터 가져오기
-            response = client.table("ai_influencer_analyses_new").select("tags").range(offset, offset + page_size - 1).execute()
+            response = simple_client.latest_ai_analysis_page("tags", after=last_row, page_size=page_size)
             
             if not response.data or len(response.data) == 0:
                 break
@@ -331,13 +331,13 @@ def get_tags_for_wordcloud():
             
             all_tags.extend(page_tags)
             
-            print(f"Fetched page {offset//page_size + 1}: {len(response.data)} records, {len(page_tags)} tags")
+            print(f"Fetched page: {len(response.data)} records, {len(page_tags)} tags")
             
             # 더 이상 데이터가 없으면 중단
             if len(response.data) < page_size:
                 break
                 
-            offset += page_size
+            last_row = response.data[-1]
         
         # 디버깅: 태그 통계 확인
         print(f"Total tags collected: {len(all_tags)}")
@@ -361,11 +361,11 @@ def get_category_tags(category):
         
         all_tags = []
         page_size = 1000
-        offset = 0
+        last_row = None
         
         while True:
             # 특정 카테고리의 데이터만 페이징으로 가져오기
-            response = client.table("ai_influencer_analyses_new").select("tags").eq("category", category).range(offset, offset + page_size - 1).execute()
+            response = simple_client.latest_ai_analysis_page("tags", after=last_row, page_size=page_size, category=category)
             
             if not response.data or len(response.data) == 0:
                 break
@@ -404,7 +404,7 @@ def get_category_tags(category):
             if len(response.data) < page_size:
                 break
                 
-            offset += page_size
+            last_row = response.data[-1]
         
         return all_tags
     except Exception as e:
@@ -420,10 +420,10 @@ def get_evaluation_scores_statistics():
         
         all_data = []
         page_size = 1000
-        offset = 0
+        last_row = None
         
         while True:
-            response = client.table("ai_influencer_analyses_new").select("evaluation, content_analysis").range(offset, offset + page_size - 1).execute()
+            response = simple_client.latest_ai_analysis_page("evaluation, content_analysis", after=last_row, page_size=page_size)
             
             if not response.data or len(response.data) == 0:
                 break
@@ -434,7 +434,7 @@ def get_evaluation_scores_statistics():
             if len(response.data) < page_size:
                 break
                 
-            offset += page_size
+            last_row = response.data[-1]
         
         if not all_data:
             return None
@@ -564,10 +564,10 @@ def get_enhanced_network_analysis_statistics():
             
             all_data = []
             page_size = 1000
-            offset = 0
+            last_row = None
             
             while True:
-                response = client.table("ai_influencer_analyses_new").select("follow_network_analysis, followers, followings").range(offset, offset + page_size - 1).execute()
+                response = simple_client.latest_ai_analysis_page("follow_network_analysis, followers, followings", after=last_row, page_size=page_size)
                 
                 if not response.data or len(response.data) == 0:
                     break
@@ -578,7 +578,7 @@ def get_enhanced_network_analysis_statistics():
                 if len(response.data) < page_size:
                     break
                     
-                offset += page_size
+                last_row = response.data[-1]
             
             if not all_data:
                 return None
@@ -743,10 +743,13 @@ def get_enhanced_activity_metrics_statistics():
             
             all_data = []
             page_size = 1000
-            offset = 0
+            last_row = None
             
             while True:
-                response = client.table("ai_influencer_analyses_new").select("follow_network_analysis, comment_authenticity_analysis, followers, followings, posts_count").range(offset, offset + page_size - 1).execute()
+                response = simple_client.latest_ai_analysis_page(
+                    "follow_network_analysis, comment_authenticity_analysis, followers, followings, posts_count",
+                    after=last_row, page_size=page_size
+                )
                 
                 if not response.data or len(response.data) == 0:
                     break
@@ -757,7 +760,7 @@ def get_enhanced_activity_metrics_statistics():
                 if len(response.data) < page_size:
                     break
                     
-                offset += page_size
+                last_row = response.data[-1]
             
             if not all_data:
                 return None
@@ -1120,10 +1123,10 @@ def get_comment_authenticity_statistics():
         
         all_data = []
         page_size = 1000
-        offset = 0
+        last_row = None
         
         while True:
-            response = client.table("ai_influencer_analyses_new").select("comment_authenticity_analysis").range(offset, offset + page_size - 1).execute()
+            response = simple_client.latest_ai_analysis_page("comment_authenticity_analysis", after=last_row, page_size=page_size)
             
             if not response.data or len(response.data) == 0:
                 break
@@ -1134,7 +1137,7 @@ def get_comment_authenticity_statistics():
             if len(response.data) < page_size:
                 break
                 
-            offset += page_size
+            last_row = response.data[-1]
         
         if not all_data:
             return None
@@ -1207,14 +1210,11 @@ def get_commerce_orientation_statistics():
         
         all_data = []
         page_size = 1000
-        offset = 0
+        last_row = None
         
         while True:
-            response = (
-                client.table("ai_influencer_analyses_new")
-                .select("commerce_orientation_analysis")
-                .range(offset, offset + page_size - 1)
-                .execute()
+            response = simple_client.latest_ai_analysis_page(
+                "commerce_orientation_analysis", after=last_row, page_size=page_size
             )
             
             if not response.data or len(response.data) == 0:
@@ -1225,7 +1225,7 @@ def get_commerce_orientation_statistics():
             if len(response.data) < page_size:
                 break
             
-            offset += page_size
+            last_row = response.data[-1]
         
         if not all_data:
             return None
@@ -1339,12 +1339,13 @@ def get_comprehensive_analysis_data():
         
         all_data = []
         page_size = 1000
-        offset = 0
+        last_row = None
         
         while True:
-            response = client.table("ai_influencer_analyses_new").select(
-                "followers, followings, posts_count, category, evaluation, follow_network_analysis, comment_authenticity_analysis, engagement_score, activity_score, communication_score, growth_potential_score, overall_score"
-            ).range(offset, offset + page_size - 1).execute()
+            response = simple_client.latest_ai_analysis_page(
+                "followers, followings, posts_count, category, evaluation, follow_network_analysis, comment_authenticity_analysis, engagement_score, activity_score, communication_score, growth_potential_score, overall_score",
+                after=last_row, page_size=page_size
+            )
             
             if not response.data or len(response.data) == 0:
                 break
@@ -1355,7 +1356,7 @@ def get_comprehensive_analysis_data():
             if len(response.data) < page_size:
                 break
                 
-            offset += page_size
+            last_row = response.data[-1]
 
         if not all_data:
             return None
@@ -1621,12 +1622,13 @@ def get_statistical_insights_data():
         
         all_data = []
         page_size = 1000
-        offset = 0
+        last_row = None
         
         while True:
-            response = client.table("ai_influencer_analyses_new").select(
-                "followers, followings, evaluation, follow_network_analysis, comment_authenticity_analysis, engagement_score, overall_score, analyzed_at"
-            ).range(offset, offset + page_size - 1).execute()
+            response = simple_client.latest_ai_analysis_page(
+                "followers, followings, evaluation, follow_network_analysis, comment_authenticity_analysis, engagement_score, overall_score, analyzed_at",
+                after=last_row, page_size=page_size
+            )
             
             if not response.data or len(response.data) == 0:
                 break
@@ -1637,7 +1639,7 @@ def get_statistical_insights_data():
             if len(response.data) < page_size:
                 break
                 
-            offset += page_size
+            last_row = response.data[-1]
         
         if not all_data:
             return None
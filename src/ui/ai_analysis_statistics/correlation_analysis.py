@@ -62,15 +62,11 @@ def get_campaign_performance_data(campaign_id):
         
         ai_analyses = []
         if sns_ids and platforms:
-            # sns_id와 platform으로 AI 분석 데이터 조회
-            for i, sns_id in enumerate(sns_ids):
-                platform = platforms[i] if i < len(platforms) else 'instagram'
-                ai_data = client.table("ai_influencer_analyses_new").select(
-                    "influencer_id, engagement_score, activity_score, communication_score, growth_potential_score, overall_score, followers, category, analyzed_at"
-                ).eq("influencer_id", sns_id).eq("platform", platform).execute()
-                
-                if ai_data.data:
-                    ai_analyses.extend(ai_data.data)
+            # (platform, sns_id = alias) 목록으로 인플루언서별 최신 AI 분석을 한 번에 조회
+            ai_analyses = simple_client.get_latest_ai_analyses(
+                "influencer_id, platform, alias, engagement_score, activity_score, communication_score, growth_potential_score, overall_score, followers, category, analyzed_at",
+                keys=[(m['platform'], m['sns_id']) for m in mappings.data if m['sns_id'] and m['platform']]
+            )
         
         # Debug 메시지 제거
         
@@ -98,7 +94,7 @@ def get_campaign_performance_data(campaign_id):
             ai_analysis = None
             if mapping['sns_id'] and mapping['platform'] and ai_analyses:
                 ai_analysis = next((a for a in ai_analyses 
-                                  if a['influencer_id'] == mapping['sns_id']), None)
+                                  if a['platform'] == mapping['platform'] and a['alias'] == mapping['sns_id']), None)
                 if ai_analysis:
                     ai_data_count += 1
             
@@ -40,15 +40,27 @@ def render_campaign_list():
         st.info("생성된 캠페인이 없습니다. 위에서 새 캠페인을 생성해보세요.")
         return
     
+    # 캠페인별 성과 합계 (campaign_performance_rollups, 캠페인 × 플랫폼 행을 캠페인 단위로 합산)
+    rollup_totals = {}
+    for rollup in db_manager.get_campaign_performance_rollups():
+        totals = rollup_totals.setdefault(rollup.get("campaign_id"), {"participants": 0, "uploaded": 0, "likes": 0, "views": 0})
+        for key in totals:
+            totals[key] += rollup.get(key) or 0
+    
     # 캠페인 목록을 테이블로 표시
     campaign_data = []
     for campaign in campaigns:
+        totals = rollup_totals.get(campaign.get('id'), {})
         campaign_data.append({
             "캠페인 이름": campaign.get('campaign_name', 'N/A'),
             "유형": format_campaign_type(campaign.get('campaign_type', '')),
             "상태": format_campaign_status(campaign.get('status', 'planned')),
             "시작일": campaign.get('start_date', 'N/A'),
-            "종료일": campaign.get('end_date', '미정')
+            "종료일": campaign.get('end_date', '미정'),
+            "참여": int(totals.get("participants", 0)),
+            "업로드 완료": int(totals.get("uploaded", 0)),
+            "좋아요": int(totals.get("likes", 0)),
+            "조회수": int(totals.get("views", 0)),
         })
     
     if campaign_data:
@@ -1,7 +1,9 @@
 """
 캠페인 참여 인플루언서 추가 관련 UI 컴포넌트
 """
+import re
 import streamlit as st
+import pandas as pd
 from src.db.database import db_manager
 from src.db.models import CampaignInfluencerParticipation
 from .common_functions import search_single_influencer, search_single_influencer_by_platform, safe_int_conversion
@@ -45,6 +47,10 @@ def render_add_influencer_workflow(selected_campaign):
     with col2:
         st.markdown("##### 📝 인플루언서 추가 정보")
         render_influencer_add_form(selected_campaign)
+    
+    # 여러 명 한 번에 추가 (SNS ID 붙여넣기 / 매칭 결과)
+    with st.expander("👥 여러 인플루언서 일괄 추가", expanded=False):
+        render_bulk_add_section(selected_campaign)
 
 def render_influencer_search_section():
     """인플루언서 검색 섹션"""
@@ -334,3 +340,166 @@ def render_influencer_add_form(selected_campaign):
         
         with col3:
             st.empty()  # 빈 공간
+
+def parse_sns_id_list(text):
+    """붙여넣은 SNS ID 목록 파싱 (줄바꿈/쉼표/공백 구분, @ 제거, 순서 유지 중복 제거)"""
+    sns_ids = [token.replace('@', '').strip() for token in re.split(r"[\s,;]+", text or "")]
+    return list(dict.fromkeys(sns_id for sns_id in sns_ids if sns_id))
+
+def _resolve_matched_candidates(matched):
+    """매칭 결과(AI 분석 행) → 일괄 추가 후보 목록 + 등록되지 않은 인플루언서
+
+    AI 분석 행의 influencer_id는 크롤링 테이블(tb_instagram_crawling) ID라 참여 등록에 쓸 수 없으므로
+    (platform, alias)로 connecta_influencers를 일괄 조회하여 인플루언서 ID로 변환합니다.
+    같은 매칭 결과에 대해서는 세션에 저장된 변환 결과를 재사용합니다.
+    """
+    keys, not_found = [], []
+    for inf in matched:
+        alias = (inf.get('alias') or '').replace('@', '').strip()
+        if inf.get('platform') and alias:
+            keys.append((inf['platform'], alias))
+        else:
+            not_found.append(alias or inf.get('name') or 'N/A')
+    keys = list(dict.fromkeys(keys))
+    
+    cached = st.session_state.get('matched_candidates_resolved')
+    if cached and cached['keys'] == keys:
+        return cached['resolved']
+    
+    influencers = {
+        (inf.get('platform'), inf.get('sns_id')): inf
+        for inf in db_manager.get_influencers_by_platform_sns_ids(keys)
+    }
+    candidates = []
+    for key in keys:
+        inf = influencers.get(key)
+        if not inf:
+            not_found.append(key[1])
+            continue
+        candidates.append({
+            'influencer_id': str(inf['id']),
+            'influencer_name': inf.get('influencer_name') or inf['sns_id'],
+            'platform': inf.get('platform', ''),
+            'followers_count': inf.get('followers_count') or 0,
+        })
+    
+    resolved = {'candidates': candidates, 'not_found': not_found}
+    st.session_state.matched_candidates_resolved = {'keys': keys, 'resolved': resolved}
+    return resolved
+
+def render_matched_bulk_add(selected_campaign, matched, key_prefix="bulk_add_matched"):
+    """매칭 결과를 등록된 인플루언서로 변환하여 일괄 추가 (등록되지 않은 인플루언서는 경고로 표시)"""
+    resolved = _resolve_matched_candidates(matched)
+    if resolved['not_found']:
+        st.warning(f"⚠️ 인플루언서로 등록되지 않은 매칭 결과 {len(resolved['not_found'])}개: "
+                   f"{', '.join(resolved['not_found'][:20])}"
+                   + (" ..." if len(resolved['not_found']) > 20 else ""))
+    render_bulk_participation_add(selected_campaign, resolved['candidates'], key_prefix=key_prefix)
+
+def render_bulk_add_section(selected_campaign):
+    """SNS ID 목록 또는 매칭 결과로 여러 인플루언서를 한 번에 추가"""
+    matched = st.session_state.get('matched_influencers', [])
+    sources = ["SNS ID 붙여넣기"] + (["매칭 결과"] if matched else [])
+    source = st.radio("추가 대상", sources, horizontal=True, key="bulk_add_source")
+    
+    if source == "매칭 결과":
+        render_matched_bulk_add(selected_campaign, matched, key_prefix="bulk_add_matched")
+        return
+    
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        sns_id_text = st.text_area(
+            "SNS ID 목록",
+            placeholder="한 줄에 하나씩 또는 쉼표로 구분하여 입력하세요\n@username1\nusername2",
+            key="bulk_add_sns_ids",
+            height=150
+        )
+    with col2:
+        platform = st.selectbox(
+            "플랫폼",
+            ["전체", "instagram", "youtube", "tiktok", "x", "blog", "facebook"],
+            key="bulk_add_platform"
+        )
+    
+    if st.button("🔍 인플루언서 확인", key="bulk_add_resolve"):
+        sns_ids = parse_sns_id_list(sns_id_text)
+        if not sns_ids:
+            st.error("SNS ID를 입력해주세요.")
+        else:
+            influencers = db_manager.get_influencers_by_sns_ids(sns_ids, platform=None if platform == "전체" else platform)
+            found = {inf['sns_id'] for inf in influencers}
+            st.session_state.bulk_add_resolved = {
+                'candidates': [
+                    {
+                        'influencer_id': str(inf['id']),
+                        'influencer_name': inf.get('influencer_name') or inf['sns_id'],
+                        'platform': inf.get('platform', ''),
+                        'followers_count': inf.get('followers_count') or 0,
+                    }
+                    for inf in influencers
+                ],
+                'not_found': [sns_id for sns_id in sns_ids if sns_id not in found],
+            }
+    
+    resolved = st.session_state.get('bulk_add_resolved')
+    if not resolved:
+        return
+    if resolved['not_found']:
+        st.warning(f"⚠️ 등록되지 않은 SNS ID {len(resolved['not_found'])}개: {', '.join(resolved['not_found'][:20])}"
+                   + (" ..." if len(resolved['not_found']) > 20 else ""))
+    render_bulk_participation_add(selected_campaign, resolved['candidates'], key_prefix="bulk_add_pasted")
+
+def render_bulk_participation_add(selected_campaign, candidates, key_prefix="bulk_add"):
+    """후보 인플루언서 선택 + 공통 참여 정보 입력 후 일괄 추가
+
+    Args:
+        candidates: [{'influencer_id', 'influencer_name', 'platform', 'followers_count'}]
+    """
+    if not candidates:
+        st.info("추가할 인플루언서가 없습니다.")
+        return
+    
+    campaign_id = selected_campaign.get('id', '') if isinstance(selected_campaign, dict) else str(selected_campaign)
+    
+    candidates_df = pd.DataFrame(candidates).drop_duplicates('influencer_id')
+    candidates_df.insert(0, '선택', True)
+    edited_df = st.data_editor(
+        candidates_df,
+        column_config={
+            '선택': st.column_config.CheckboxColumn('선택'),
+            'influencer_id': None,
+            'influencer_name': st.column_config.TextColumn('이름', disabled=True),
+            'platform': st.column_config.TextColumn('플랫폼', disabled=True),
+            'followers_count': st.column_config.NumberColumn('팔로워', format="%d", disabled=True),
+        },
+        hide_index=True,
+        width='stretch',
+        key=f"{key_prefix}_editor"
+    )
+    selected_ids = edited_df.loc[edited_df['선택'], 'influencer_id'].tolist()
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        sample_status = st.selectbox("샘플 상태", ["요청", "발송준비", "발송완료", "수령"], key=f"{key_prefix}_sample_status")
+    with col2:
+        cost_krw = st.number_input("비용 (원)", min_value=0, value=0, step=1000, key=f"{key_prefix}_cost_krw")
+    memo = st.text_input("메모", key=f"{key_prefix}_memo")
+    
+    if st.button(f"➕ 선택한 {len(selected_ids)}명 캠페인에 추가", type="primary",
+                 disabled=not selected_ids, key=f"{key_prefix}_submit"):
+        defaults = {'sample_status': sample_status, 'cost_krw': cost_krw}
+        if memo.strip():
+            defaults['memo'] = memo.strip()
+        with st.spinner("캠페인에 추가하는 중..."):
+            result = db_manager.bulk_add_influencers_to_campaign(campaign_id, selected_ids, defaults)
+        
+        if result.get("failed") or not result.get("results"):
+            st.warning(f"⚠️ {result.get('message', '')}")
+            names = dict(zip(edited_df['influencer_id'], edited_df['influencer_name']))
+            failed = [(names.get(i, i), r.get('message', '')) for i, r in (result.get("results") or {}).items() if r['status'] == 'failed']
+            if failed:
+                st.dataframe(pd.DataFrame(failed, columns=['인플루언서', '오류']), hide_index=True, width='stretch')
+        else:
+            st.success(f"✅ {result['message']}")
+        if result.get("added"):
+            st.session_state.participation_added = True  # 참여 추가 완료 플래그
@@ -646,66 +646,54 @@ def render_participation_list_table(participations):
         st.info("표시할 참여 인플루언서가 없습니다.")
 
 def save_edited_participations(original_df, edited_df):
-    """편집된 참여 인플루언서 데이터를 저장"""
+    """편집된 참여 인플루언서 데이터를 저장 (변경된 행만, 일괄 업데이트)"""
     try:
-        # 변경된 행들을 찾아서 업데이트
+        # 변경사항이 있는 행 찾기 (읽기 전용 컬럼 제외) - 문자열 기준 일괄 비교
+        readonly_columns = ["ID", "인플루언서", "플랫폼", "SNS ID", "참여일"]
+        comparison_columns = [col for col in original_df.columns if col not in readonly_columns]
+        original = original_df[comparison_columns].astype(str).reset_index(drop=True)
+        edited = edited_df[comparison_columns].astype(str).reset_index(drop=True)
+        changed_rows = edited_df.reset_index(drop=True)[(original != edited).any(axis=1)]
+        
+        if changed_rows.empty:
+            st.info("💡 변경된 내용이 없습니다. 테이블에서 정보를 편집한 후 다시 저장해주세요.")
+            return
+        
+        # 업데이트할 데이터 준비 (NumPy 타입을 Python 기본 타입으로 변환)
+        # 참고: influencer_name, platform, sns_id는 connecta_influencers 테이블에 있으므로 업데이트 불가
+        updates = {}
+        for _, edited_row in changed_rows.iterrows():
+            updates[edited_row["ID"]] = {
+                'sample_status': str(edited_row["샘플 상태"]),
+                'content_uploaded': bool(edited_row["업로드 완료"]),
+                'cost_krw': int(edited_row["비용"]) if edited_row["비용"] is not None else 0,
+                'manager_comment': str(edited_row["매니저코멘트"]) if edited_row["매니저코멘트"] else None,
+                'influencer_requests': str(edited_row["인플루언서요청사항"]) if edited_row["인플루언서요청사항"] else None,
+                'influencer_feedback': str(edited_row["인플루언서피드백"]) if edited_row["인플루언서피드백"] else None,
+                'memo': str(edited_row["메모"]) if edited_row["메모"] else None
+            }
+        
+        # 데이터베이스 일괄 업데이트 (청크 단위 요청, 캐시는 저장 후 한 번 초기화)
+        result = db_manager.bulk_update_participations(updates)
+        row_results = result.get("results") or {}
         updated_count = 0
         error_count = 0
-        total_changes = 0
-        
-        # DataFrame을 인덱스 기반으로 비교
-        for idx in range(len(original_df)):
-            original_row = original_df.iloc[idx]
-            edited_row = edited_df.iloc[idx]
-            
-            # 변경사항이 있는지 확인 (읽기 전용 컬럼 제외)
-            readonly_columns = ["ID", "인플루언서", "플랫폼", "SNS ID", "참여일"]
-            comparison_columns = [col for col in original_df.columns if col not in readonly_columns]
-            has_changes = False
-            
-            for col in comparison_columns:
-                if str(original_row[col]) != str(edited_row[col]):
-                    has_changes = True
-                    total_changes += 1
-                    break
-            
-            if has_changes:
-                participation_id = edited_row["ID"]
-                
-                # 업데이트할 데이터 준비 (NumPy 타입을 Python 기본 타입으로 변환)
-                # 참고: influencer_name, platform, sns_id는 connecta_influencers 테이블에 있으므로 업데이트 불가
-                update_data = {
-                    'sample_status': str(edited_row["샘플 상태"]),
-                    'content_uploaded': bool(edited_row["업로드 완료"]),
-                    'cost_krw': int(edited_row["비용"]) if edited_row["비용"] is not None else 0,
-                    'manager_comment': str(edited_row["매니저코멘트"]) if edited_row["매니저코멘트"] else None,
-                    'influencer_requests': str(edited_row["인플루언서요청사항"]) if edited_row["인플루언서요청사항"] else None,
-                    'influencer_feedback': str(edited_row["인플루언서피드백"]) if edited_row["인플루언서피드백"] else None,
-                    'memo': str(edited_row["메모"]) if edited_row["메모"] else None
-                }
-                
-                # 데이터베이스 업데이트
-                result = db_manager.update_campaign_participation(participation_id, update_data)
-                if result["success"]:
-                    updated_count += 1
-                else:
-                    error_count += 1
-                    st.error(f"❌ ID {participation_id} 업데이트 실패: {result['message']}")
+        for participation_id in updates:
+            row_result = row_results.get(participation_id, {})
+            if row_result.get("success"):
+                updated_count += 1
+            else:
+                error_count += 1
+                st.error(f"❌ ID {participation_id} 업데이트 실패: {row_result.get('message') or result.get('message', '')}")
         
         # 결과 표시
-        if total_changes == 0:
-            st.info("💡 변경된 내용이 없습니다. 테이블에서 정보를 편집한 후 다시 저장해주세요.")
-        elif updated_count > 0:
+        if updated_count > 0:
             st.success(f"✅ {updated_count}명의 참여 인플루언서 정보가 업데이트되었습니다!")
         
         if error_count > 0:
             st.error(f"❌ {error_count}명의 참여 인플루언서 업데이트에 실패했습니다.")
         
         if updated_count > 0:
-            # 캐시 초기화
-            if "participations_cache" in st.session_state:
-                del st.session_state["participations_cache"]
-            
             # 페이지 새로고침
             st.session_state.participation_bulk_update_completed = True  # 참여 대량 업데이트 완료 플래그
             
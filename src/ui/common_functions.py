@@ -8,6 +8,12 @@ from datetime import datetime, timedelta
 from ..db.database import db_manager
 from ..db.models import Campaign, Influencer, CampaignInfluencer, CampaignInfluencerParticipation, PerformanceMetric
 
+# 부분 일치 검색 최대 결과 수 (유사도 순 상위)
+SEARCH_RESULT_LIMIT = 200
+
+# 데이터베이스 platform_type enum 값 (supabase/db/enums.sql)
+SUPPORTED_PLATFORMS = ["instagram", "youtube", "tiktok", "x", "blog", "facebook"]
+
 def safe_int_conversion(value: Any, default: int = 0) -> int:
     """안전한 정수 변환 함수 - Streamlit number_input 호환"""
     try:
@@ -123,10 +129,9 @@ def search_single_influencer(search_term: str):
         clean_sns_id = clean_search_term.replace('@', '').strip()
         
         # 1단계: 정확한 매칭 시도 (등록 시 중복체크와 동일한 방식) - 모든 플랫폼에서
-        platforms = ["instagram", "youtube", "tiktok", "x", "blog", "facebook"]
         exact_match_results = []
         
-        for platform in platforms:
+        for platform in SUPPORTED_PLATFORMS:
             try:
                 exact_match_response = client.table("connecta_influencers")\
                     .select("*")\
@@ -164,39 +169,11 @@ def search_single_influencer(search_term: str):
                 "data": exact_match_results
             }
         
-        # 2단계: 부분 일치 검색 (기존 로직 유지)
-        # 검색어에 와일드카드 문자(_ 또는 %)가 있는지 확인
-        has_wildcards = '_' in clean_search_term or '%' in clean_search_term
-        
-        if has_wildcards:
-            # 와일드카드 문자가 있으면 Python에서 부분 검색 수행
-            all_influencers = client.table("connecta_influencers")\
-                .select("*")\
-                .order("created_at", desc=True)\
-                .execute()
-            
-            if all_influencers.data:
-                # Python에서 필터링 (대소문자 구분 없이)
-                search_term_lower = clean_search_term.lower()
-                filtered_results = []
-                for inf in all_influencers.data:
-                    sns_id = (inf.get('sns_id') or '').lower()
-                    influencer_name = (inf.get('influencer_name') or '').lower()
-                    
-                    if search_term_lower in sns_id or search_term_lower in influencer_name:
-                        filtered_results.append(inf)
-                
-                search_response_data = filtered_results
-            else:
-                search_response_data = []
-        else:
-            # 와일드카드 문자가 없으면 ilike 검색 사용
-            search_response = client.table("connecta_influencers")\
-                .select("*")\
-                .order("created_at", desc=True)\
-                .or_(f"influencer_name.ilike.%{clean_search_term}%,sns_id.ilike.%{clean_search_term}%")\
-                .execute()
-            search_response_data = search_response.data if search_response.data else []
+        # 2단계: 부분 일치 검색 (트라이그램 검색 RPC, 정확 > 접두 > 부분 일치 순)
+        # _ 와 % 는 와일드카드가 아닌 일반 문자로 검색됨
+        search_response_data = db_manager.search_influencers(
+            clean_search_term, limit=SEARCH_RESULT_LIMIT, fuzzy=False
+        )
         
         if search_response_data:
             return {
@@ -205,6 +182,15 @@ def search_single_influencer(search_term: str):
                 "data": search_response_data
             }
         
+        # 3단계: 오타 허용 검색 (트라이그램 유사도 순)
+        fuzzy_results = db_manager.search_influencers(clean_search_term)
+        if fuzzy_results:
+            return {
+                "success": True,
+                "message": f"🔎 정확히 일치하는 결과가 없어 비슷한 인플루언서 {len(fuzzy_results)}명을 찾았습니다.",
+                "data": fuzzy_results
+            }
+        
         return {
             "success": True,
             "message": "❌ 검색 결과가 없습니다.",
@@ -231,6 +217,14 @@ def search_single_influencer_by_platform(search_term: str, platform: str):
                 "data": None
             }
         
+        # 지원하지 않는 플랫폼은 조회 전에 확인 (검색 RPC는 enum 오류 대신 빈 결과/폴백으로 처리되므로)
+        if platform not in SUPPORTED_PLATFORMS:
+            return {
+                "success": False,
+                "message": f"❌ '{platform}' 플랫폼은 데이터베이스에서 지원되지 않습니다.",
+                "data": None
+            }
+        
         # Supabase에서 직접 검색 (특정 플랫폼)
         simple_client_instance = db_manager.get_client()
         client = simple_client_instance.get_client()
@@ -295,65 +289,11 @@ def search_single_influencer_by_platform(search_term: str, platform: str):
                 }
             # 다른 오류는 계속 진행
         
-        # 3단계: 부분 일치 검색 (기존 로직 유지)
-        # 검색어에 와일드카드 문자(_ 또는 %)가 있는지 확인
-        has_wildcards = '_' in clean_search_term or '%' in clean_search_term
-        
-        if has_wildcards:
-            # 와일드카드 문자가 있으면 Python에서 부분 검색 수행
-            try:
-                all_influencers = client.table("connecta_influencers")\
-                    .select("*")\
-                    .eq("platform", platform)\
-                    .order("created_at", desc=True)\
-                    .execute()
-                
-                if all_influencers.data:
-                    # Python에서 필터링 (대소문자 구분 없이)
-                    search_term_lower = clean_search_term.lower()
-                    filtered_results = []
-                    for inf in all_influencers.data:
-                        sns_id = (inf.get('sns_id') or '').lower()
-                        influencer_name = (inf.get('influencer_name') or '').lower()
-                        
-                        if search_term_lower in sns_id or search_term_lower in influencer_name:
-                            filtered_results.append(inf)
-                    
-                    search_response_data = filtered_results
-                else:
-                    search_response_data = []
-            except Exception as e:
-                # enum 오류인 경우 플랫폼이 지원되지 않는다는 메시지 반환
-                error_str = str(e)
-                if "enum" in error_str.lower() or "invalid input value" in error_str.lower():
-                    return {
-                        "success": False,
-                        "message": f"❌ '{platform}' 플랫폼은 데이터베이스에서 지원되지 않습니다.",
-                        "data": None
-                    }
-                # 다른 오류는 빈 결과로 처리
-                search_response_data = []
-        else:
-            # 와일드카드 문자가 없으면 ilike 검색 사용
-            try:
-                search_response = client.table("connecta_influencers")\
-                    .select("*")\
-                    .order("created_at", desc=True)\
-                    .eq("platform", platform)\
-                    .or_(f"influencer_name.ilike.%{clean_search_term}%,sns_id.ilike.%{clean_search_term}%")\
-                    .execute()
-                search_response_data = search_response.data if search_response.data else []
-            except Exception as e:
-                # enum 오류인 경우 플랫폼이 지원되지 않는다는 메시지 반환
-                error_str = str(e)
-                if "enum" in error_str.lower() or "invalid input value" in error_str.lower():
-                    return {
-                        "success": False,
-                        "message": f"❌ '{platform}' 플랫폼은 데이터베이스에서 지원되지 않습니다.",
-                        "data": None
-                    }
-                # 다른 오류는 빈 결과로 처리
-                search_response_data = []
+        # 3단계: 부분 일치 검색 (트라이그램 검색 RPC, 정확 > 접두 > 부분 일치 순)
+        # _ 와 % 는 와일드카드가 아닌 일반 문자로 검색됨
+        search_response_data = db_manager.search_influencers(
+            clean_search_term, platform=platform, limit=SEARCH_RESULT_LIMIT, fuzzy=False
+        )
         
         if search_response_data:
             return {
@@ -362,6 +302,15 @@ def search_single_influencer_by_platform(search_term: str, platform: str):
                 "data": search_response_data
             }
         
+        # 4단계: 오타 허용 검색 (트라이그램 유사도 순)
+        fuzzy_results = db_manager.search_influencers(clean_search_term, platform=platform)
+        if fuzzy_results:
+            return {
+                "success": True,
+                "message": f"🔎 {platform}에서 정확히 일치하는 결과가 없어 비슷한 인플루언서 {len(fuzzy_results)}명을 찾았습니다.",
+                "data": fuzzy_results
+            }
+        
         return {
             "success": True,
             "message": f"❌ {platform}에서 검색 결과가 없습니다.",
@@ -374,6 +323,50 @@ def search_single_influencer_by_platform(search_term: str, platform: str):
             "data": None
         }
 
+def render_search_index_matches(search_term: str):
+    """검색 실패 시 검색 인덱스 기반 후보 표시 (전체 플랫폼, 정확/부분/유사 일치 + 플랫폼별 등록 수)"""
+    try:
+        platform_counts = db_manager.get_influencer_platform_counts()
+        st.write(f"**총 {sum(platform_counts.values())}명의 인플루언서가 등록되어 있습니다:**")
+        
+        matches = db_manager.search_influencers_indexed(search_term, limit=50)
+        exact_matches = [inf for inf in matches if inf["search_match"] == "exact"]
+        partial_matches = [inf for inf in matches if inf["search_match"] in ("prefix", "substring")]
+        fuzzy_matches = [inf for inf in matches if inf["search_match"] == "fuzzy"]
+        
+        # 정확한 매칭 결과 (선택한 플랫폼이 달라 찾지 못한 경우)
+        if exact_matches:
+            st.success(f"**✅ 정확한 매칭 ({len(exact_matches)}명):**")
+            for inf in exact_matches:
+                active_status = "활성" if inf.get('active', True) else "비활성"
+                st.write(f"- {inf.get('sns_id')} ({inf.get('platform')}) - {inf.get('influencer_name') or '이름 없음'} [{active_status}]")
+        
+        # 부분 매칭 결과
+        if partial_matches:
+            st.info(f"**🔍 부분 매칭 ({len(partial_matches)}명):**")
+            for inf in partial_matches[:5]:  # 최대 5명만 표시
+                active_status = "활성" if inf.get('active', True) else "비활성"
+                st.write(f"- {inf.get('sns_id')} ({inf.get('platform')}) - {inf.get('influencer_name') or '이름 없음'} [{active_status}]")
+            if len(partial_matches) > 5:
+                st.write(f"... 외 {len(partial_matches) - 5}명 더")
+        
+        # 오타 허용 매칭 결과
+        if fuzzy_matches:
+            st.info(f"**🔎 비슷한 인플루언서 ({len(fuzzy_matches)}명):**")
+            for inf in fuzzy_matches[:5]:
+                active_status = "활성" if inf.get('active', True) else "비활성"
+                st.write(f"- {inf.get('sns_id')} ({inf.get('platform')}) - {inf.get('influencer_name') or '이름 없음'} [{active_status}] · 유사도 {inf['search_score']:.2f}")
+        
+        # 매칭이 없으면 플랫폼별 등록 수 표시
+        if not matches:
+            st.warning("**❌ 검색어와 일치하는 인플루언서가 없습니다.**")
+            st.write("**플랫폼별 등록 현황:**")
+            for platform, count in sorted(platform_counts.items(), key=lambda item: item[1], reverse=True):
+                st.write(f"- {platform.upper()}: {count}명")
+    
+    except Exception as e:
+        st.error(f"인플루언서 목록 조회 중 오류: {e}")
+
 def render_influencer_info_inline(influencer):
     """인라인 인플루언서 정보 표시 (폼 내에서 사용)"""
     # 정보 카드 형태로 표시 (이미지 제거로 전체 폭 사용)
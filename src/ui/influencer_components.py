@@ -17,6 +17,7 @@ from ..constants.categories import (
 from .common_functions import (
     search_single_influencer, 
     search_single_influencer_by_platform,
+    render_search_index_matches,
     safe_int_conversion,
     check_database_for_influencer
 )
@@ -69,6 +70,11 @@ def render_influencer_registration():
     with col2:
         render_influencer_management_panel()
 
+    # 스프레드시트 일괄 등록
+    from .influencer_import_components import render_influencer_bulk_import
+    with st.expander("📤 인플루언서 일괄 등록 (CSV/XLSX)", expanded=False):
+        render_influencer_bulk_import()
+
 def render_influencer_management_panel():
     """인플루언서 관리 패널 (등록/수정 통합)"""
     # 세션 상태에서 검색 결과 확인
@@ -864,79 +870,9 @@ def render_influencer_search_for_inquiry():
                     3. SNS ID에 오타가 없는지 확인하세요
                     """)
                 
-                # 모든 인플루언서 목록 표시
-                with st.expander("🔍 모든 인플루언서 목록", expanded=True):
-                    try:
-                        all_influencers = db_manager.get_influencers()
-                        st.write(f"**총 {len(all_influencers)}명의 인플루언서가 등록되어 있습니다:**")
-                        
-                        # 검색어와 정확히 일치하는 인플루언서 찾기
-                        exact_matches = []
-                        partial_matches = []
-                        # 검색어에서 @ 제거하고 앞뒤 공백 제거
-                        clean_search_term = search_term.replace('@', '').strip().lower()
-                        
-                        for inf in all_influencers:
-                            sns_id = inf.get('sns_id', '').lower()
-                            name = (inf.get('influencer_name', '') or '').lower()
-                            clean_sns_id = sns_id.replace('@', '').strip()
-                            
-                            # 정확한 매칭 (공백 제거된 검색어 사용)
-                            if (clean_search_term == sns_id.strip() or 
-                                clean_search_term == name.strip() or
-                                clean_search_term == clean_sns_id or
-                                clean_search_term == name.strip()):
-                                exact_matches.append(inf)
-                            
-                            # 부분 매칭 (공백 제거된 검색어 사용)
-                            elif (clean_search_term in clean_sns_id or 
-                                  clean_search_term in name.strip() or
-                                  clean_search_term in sns_id.strip() or
-                                  clean_search_term in name.strip()):
-                                partial_matches.append(inf)
-                        
-                        # 정확한 매칭 결과
-                        if exact_matches:
-                            st.success(f"**✅ 정확한 매칭 ({len(exact_matches)}명):**")
-                            for inf in exact_matches:
-                                active_status = "활성" if inf.get('active', True) else "비활성"
-                                st.write(f"- {inf.get('sns_id')} ({inf.get('platform')}) - {inf.get('influencer_name') or '이름 없음'} [{active_status}]")
-                        
-                        # 부분 매칭 결과
-                        if partial_matches:
-                            st.info(f"**🔍 부분 매칭 ({len(partial_matches)}명):**")
-                            for inf in partial_matches[:5]:  # 최대 5명만 표시
-                                active_status = "활성" if inf.get('active', True) else "비활성"
-                                st.write(f"- {inf.get('sns_id')} ({inf.get('platform')}) - {inf.get('influencer_name') or '이름 없음'} [{active_status}]")
-                            if len(partial_matches) > 5:
-                                st.write(f"... 외 {len(partial_matches) - 5}명 더")
-                        
-                        # 매칭이 없으면 전체 목록 표시
-                        if not exact_matches and not partial_matches:
-                            st.warning("**❌ 검색어와 일치하는 인플루언서가 없습니다.**")
-                            
-                            # 플랫폼별로 그룹화
-                            platform_groups = {}
-                            for inf in all_influencers:
-                                platform = inf.get('platform', 'unknown')
-                                if platform not in platform_groups:
-                                    platform_groups[platform] = []
-                                platform_groups[platform].append(inf)
-                            
-                            st.write("**전체 인플루언서 목록:**")
-                            for platform, influencers in platform_groups.items():
-                                st.write(f"**{platform.upper()} ({len(influencers)}명):**")
-                                for inf in influencers[:10]:  # 각 플랫폼당 최대 10명 표시
-                                    active_status = "활성" if inf.get('active', True) else "비활성"
-                                    st.write(f"- {inf.get('sns_id')} ({inf.get('influencer_name') or '이름 없음'}) [{active_status}]")
-                                if len(influencers) > 10:
-                                    st.write(f"... 외 {len(influencers) - 10}명 더")
-                                st.write("")
-                            
-                    except Exception as e:
-                        st.error(f"인플루언서 목록 조회 중 오류: {e}")
-                        import traceback
-                        st.code(traceback.format_exc())
+                # 검색 인덱스 기반 후보 표시 (전체 테이블 조회 없음)
+                with st.expander("🔍 비슷한 인플루언서 찾기", expanded=True):
+                    render_search_index_matches(search_term)
 
 def render_influencer_search_result(influencer):
     """검색된 인플루언서 결과를 좌측에 표시"""
@@ -1397,6 +1333,8 @@ def render_manager_influencer_management():
                     del st.session_state["campaign_participation_cache"]
                 if "all_participation_influencer_ids" in st.session_state:
                     del st.session_state["all_participation_influencer_ids"]
+                if "participation_index" in st.session_state:
+                    del st.session_state["participation_index"]
                 st.session_state.manager_refresh_requested = True  # 새로고침 요청 플래그
                 # 리렌더링 없이 상태 기반 UI 업데이트
         
@@ -1531,14 +1469,10 @@ def render_manager_influencer_management():
                 
                 participated_influencer_ids = st.session_state[participation_cache_key]
                 
-                # 특정 캠페인의 참여자 ID 목록 (필요한 경우에만)
+                # 특정 캠페인의 참여자 ID 목록 (참여 인덱스에서 조회)
                 specific_campaign_participant_ids = set()
                 if campaign_filter_type == "특정 캠페인" and selected_campaign:
-                    specific_participations = db_manager.get_all_campaign_participations(selected_campaign)
-                    for participation in specific_participations:
-                        influencer_id = participation.get('influencer_id')
-                        if influencer_id:
-                            specific_campaign_participant_ids.add(influencer_id)
+                    specific_campaign_participant_ids = db_manager.get_participation_index()["influencers_by_campaign"].get(selected_campaign, set())
                 
                 # 필터링 적용
                 campaign_filtered_influencers = []
@@ -1719,20 +1653,8 @@ def render_filtered_influencer_list(influencers, selected_manager):
             # 캠페인 참여 정보 캐시 확인
             cache_key = "campaign_participation_cache"
             if cache_key not in st.session_state:
-                # 캐시가 없으면 생성
-                campaigns = db_manager.get_campaigns()
-                participation_cache = {}
-                
-                for campaign in campaigns:
-                    participations = db_manager.get_all_campaign_participations(campaign['id'])
-                    for participation in participations:
-                        influencer_id = participation.get('influencer_id')
-                        if influencer_id:
-                            if influencer_id not in participation_cache:
-                                participation_cache[influencer_id] = []
-                            participation_cache[influencer_id].append(campaign['campaign_name'])
-                
-                st.session_state[cache_key] = participation_cache
+                # 캐시가 없으면 참여 인덱스로 생성 (참여 테이블 투영 조회 1회)
+                st.session_state[cache_key] = db_manager.get_influencer_campaign_names()
             
             # 캐시에서 참여 정보 조회
             participation_cache = st.session_state[cache_key]
@@ -1897,83 +1819,69 @@ def render_filtered_influencer_list(influencers, selected_manager):
     # 총 개수 표시
     st.caption(f"총 {len(influencers)}명의 인플루언서가 표시됩니다. (편집 가능)")
 
+def _influencer_update_data(edited_row):
+    """편집 행 → connecta_influencers 업데이트 데이터 (NumPy 타입을 Python 기본 타입으로 변환)"""
+    return {
+        'platform': str(edited_row["플랫폼"]),
+        'sns_id': str(edited_row["SNS ID"]),
+        'influencer_name': str(edited_row["이름"]) if edited_row["이름"] else str(edited_row["SNS ID"]),
+        'active': bool(edited_row["상태"]),
+        'followers_count': int(edited_row["팔로워"]) if edited_row["팔로워"] is not None else 0,
+        'content_category': str(edited_row["카테고리"]),
+        'price_krw': int(edited_row["가격"]) if edited_row["가격"] is not None else 0,
+        'manager_rating': int(edited_row["매니저평점"]) if edited_row["매니저평점"] is not None else None,
+        'content_rating': int(edited_row["콘텐츠평점"]) if edited_row["콘텐츠평점"] is not None else None,
+        'created_by': str(edited_row["담당자"]).strip() if edited_row["담당자"] and str(edited_row["담당자"]).strip() else None,
+        'sns_url': str(edited_row["SNS URL"]) if edited_row["SNS URL"] else None,
+        'owner_comment': str(edited_row["Owner Comment"]) if edited_row["Owner Comment"] else None,
+        'dm_reply': str(edited_row["DM 응답정보"]) if edited_row["DM 응답정보"] else None
+    }
+
+
 def save_edited_influencers(original_df, edited_df):
-    """편집된 인플루언서 데이터를 저장 (변경된 행만)"""
+    """편집된 인플루언서 데이터를 저장 (변경된 행만, 일괄 업데이트)"""
     try:
-        updated_count = 0
-        error_count = 0
-        changed_influencers = []
-        
-        # 변경된 행만 찾아서 업데이트
-        for idx in range(len(original_df)):
-            original_row = original_df.iloc[idx]
-            edited_row = edited_df.iloc[idx]
-            
-            # 변경사항이 있는지 확인 (ID, 등록일, 캠페인 참여 제외)
-            comparison_columns = [col for col in original_df.columns if col not in ["ID", "등록일", "캠페인 참여"]]
-            has_changes = False
-            
-            for col in comparison_columns:
-                if str(original_row[col]) != str(edited_row[col]):
-                    has_changes = True
-                    break
-            
-            if has_changes:
-                influencer_id = edited_row["ID"]
-                influencer_name = edited_row["이름"]
-                changed_influencers.append(influencer_name)
-                
-                # 업데이트할 데이터 준비 (NumPy 타입을 Python 기본 타입으로 변환)
-                update_data = {
-                    'platform': str(edited_row["플랫폼"]),
-                    'sns_id': str(edited_row["SNS ID"]),
-                    'influencer_name': str(edited_row["이름"]) if edited_row["이름"] else str(edited_row["SNS ID"]),
-                    'active': bool(edited_row["상태"]),
-                    'followers_count': int(edited_row["팔로워"]) if edited_row["팔로워"] is not None else 0,
-                    'content_category': str(edited_row["카테고리"]),
-                    'price_krw': int(edited_row["가격"]) if edited_row["가격"] is not None else 0,
-                    'manager_rating': int(edited_row["매니저평점"]) if edited_row["매니저평점"] is not None else None,
-                    'content_rating': int(edited_row["콘텐츠평점"]) if edited_row["콘텐츠평점"] is not None else None,
-                    'created_by': str(edited_row["담당자"]).strip() if edited_row["담당자"] and str(edited_row["담당자"]).strip() else None,
-                    'sns_url': str(edited_row["SNS URL"]) if edited_row["SNS URL"] else None,
-                    'owner_comment': str(edited_row["Owner Comment"]) if edited_row["Owner Comment"] else None,
-                    'dm_reply': str(edited_row["DM 응답정보"]) if edited_row["DM 응답정보"] else None
-                }
-                
-                # 데이터베이스 업데이트
-                result = db_manager.update_influencer(influencer_id, update_data)
-                if result["success"]:
-                    updated_count += 1
-                else:
-                    error_count += 1
-                    st.error(f"❌ {influencer_name} (ID: {influencer_id}) 업데이트 실패: {result['message']}")
+        # 변경사항이 있는 행 찾기 (ID, 등록일, 캠페인 참여 제외) - 문자열 기준 일괄 비교
+        comparison_columns = [col for col in original_df.columns if col not in ["ID", "등록일", "캠페인 참여"]]
+        original = original_df[comparison_columns].astype(str).reset_index(drop=True)
+        edited = edited_df[comparison_columns].astype(str).reset_index(drop=True)
+        changed_positions = (original != edited).any(axis=1)
+        changed_rows = edited_df.reset_index(drop=True)[changed_positions]
+        
+        if changed_rows.empty:
+            st.info("💡 변경된 데이터가 없습니다. 테이블에서 데이터를 편집한 후 다시 시도해주세요.")
+            return
+        
+        updates = {}
+        names = {}
+        for _, edited_row in changed_rows.iterrows():
+            influencer_id = edited_row["ID"]
+            updates[influencer_id] = _influencer_update_data(edited_row)
+            names[influencer_id] = edited_row["이름"]
+        
+        # 데이터베이스 일괄 업데이트 (청크 단위 요청, 캐시는 저장 후 한 번 초기화)
+        result = db_manager.bulk_update_influencers(updates)
+        row_results = result.get("results") or {}
+        updated = [influencer_id for influencer_id in updates if row_results.get(influencer_id, {}).get("success")]
+        failed = [influencer_id for influencer_id in updates if influencer_id not in updated]
+        
+        for influencer_id in failed:
+            message = row_results.get(influencer_id, {}).get("message") or result.get("message", "")
+            st.error(f"❌ {names[influencer_id]} (ID: {influencer_id}) 업데이트 실패: {message}")
         
         # 결과 표시
-        if updated_count > 0:
-            st.success(f"✅ {updated_count}명의 인플루언서 정보가 성공적으로 업데이트되었습니다!")
+        if updated:
+            st.success(f"✅ {len(updated)}명의 인플루언서 정보가 성공적으로 업데이트되었습니다!")
             
             # 변경된 인플루언서 목록 표시
             with st.expander("📋 변경된 인플루언서 목록", expanded=False):
-                for name in changed_influencers:
-                    st.write(f"• {name}")
+                for influencer_id in updated:
+                    st.write(f"• {names[influencer_id]}")
         
-        if error_count > 0:
-            st.error(f"❌ {error_count}명의 인플루언서 업데이트에 실패했습니다.")
+        if failed:
+            st.error(f"❌ {len(failed)}명의 인플루언서 업데이트에 실패했습니다.")
         
-        if updated_count == 0 and error_count == 0:
-            st.info("💡 변경된 데이터가 없습니다. 테이블에서 데이터를 편집한 후 다시 시도해주세요.")
-        
-        if updated_count > 0:
-            # 캐시 초기화
-            if "influencers_data" in st.session_state:
-                del st.session_state["influencers_data"]
-            if "manager_filtered_influencers" in st.session_state:
-                del st.session_state["manager_filtered_influencers"]
-            if "campaign_participation_cache" in st.session_state:
-                del st.session_state["campaign_participation_cache"]
-            if "all_participation_influencer_ids" in st.session_state:
-                del st.session_state["all_participation_influencer_ids"]
-            
+        if updated:
             # 페이지 새로고침
             st.rerun()
             
@@ -2113,6 +2021,21 @@ def render_influencer_search():
         import traceback
         st.code(traceback.format_exc())
 
+# 검색 화면 팔로워수 구간 → (최소, 최대) 팔로워 수
+FOLLOWER_RANGE_BOUNDS = {
+    "5000 이하": (None, 5000),
+    "5000 ~ 1만": (5000, 10000),
+    "1만 ~ 5만": (10000, 50000),
+    "5만 ~ 10만": (50000, 100000),
+    "10만 이상": (100000, None),
+}
+
+# 검색 결과의 최신 AI 분석 점수 컬럼
+AI_ANALYSIS_SCORE_COLUMNS = [
+    "overall_score", "growth_potential_score", "engagement_score",
+    "activity_score", "communication_score", "analyzed_at",
+]
+
 def perform_influencer_search(
     category: str = "전체",
     tag_search: str = "",
@@ -2122,110 +2045,36 @@ def perform_influencer_search(
     growth_potential_min: float = 0.0,
     growth_potential_max: float = 10.0
 ) -> List[Dict[str, Any]]:
-    """인플루언서 검색 수행"""
+    """인플루언서 검색 수행 (필터/점수 범위와 최신 AI 분석 조인은 서버에서 처리)"""
     try:
-        from ..supabase.simple_client import simple_client
-        
-        client = simple_client.get_client()
-        if not client:
-            return []
-        
-        # 1. 기본 인플루언서 데이터 조회
-        query = client.table("connecta_influencers").select("*")
-        
-        # 카테고리 필터링
-        if category != "전체":
-            query = query.eq("content_category", category)
-        
-        # 태그 필터링 (LIKE 검색)
-        if tag_search and tag_search.strip():
-            # 태그 필드에서 LIKE 검색 (PostgreSQL의 ILIKE 사용)
-            tag_keywords = [tag.strip() for tag in tag_search.split(",") if tag.strip()]
-            if tag_keywords:
-                # 여러 태그 중 하나라도 포함되면 검색
-                # Supabase의 or_ 메서드는 여러 조건을 쉼표로 구분하여 전달
-                tag_conditions = [f"tags.ilike.%{keyword}%" for keyword in tag_keywords]
-                if tag_conditions:
-                    query = query.or_(",".join(tag_conditions))
+        # 태그 필터링: 여러 태그 중 하나라도 포함되면 검색
+        tag_keywords = [tag.strip() for tag in tag_search.split(",") if tag.strip()] if tag_search else []
         
         # 팔로워수 구간 필터링
-        if follower_range != "전체":
-            if follower_range == "5000 이하":
-                query = query.lte("followers_count", 5000)
-            elif follower_range == "5000 ~ 1만":
-                query = query.gte("followers_count", 5000).lte("followers_count", 10000)
-            elif follower_range == "1만 ~ 5만":
-                query = query.gte("followers_count", 10000).lte("followers_count", 50000)
-            elif follower_range == "5만 ~ 10만":
-                query = query.gte("followers_count", 50000).lte("followers_count", 100000)
-            elif follower_range == "10만 이상":
-                query = query.gte("followers_count", 100000)
-        
-        # 인플루언서 데이터 조회
-        influencers_response = query.execute()
-        influencers = influencers_response.data if influencers_response.data else []
-        
-        # 2. AI 분석 결과와 조인하여 필터링
-        if influencers:
-            # AI 분석 결과 조회 (sns_id와 platform 기준으로 매칭, 새 테이블 사용)
-            ai_analyses_query = client.table("ai_influencer_analyses_new").select("*")
-            ai_analyses_response = ai_analyses_query.execute()
-            ai_analyses = ai_analyses_response.data if ai_analyses_response.data else []
-            
-            # AI 분석 결과를 딕셔너리로 변환 (sns_id + platform을 키로)
-            ai_analyses_dict = {}
-            for analysis in ai_analyses:
-                # alias나 influencer_id를 sns_id로 사용
-                key = None
-                if analysis.get('alias'):
-                    key = analysis['alias']
-                elif analysis.get('influencer_id'):
-                    key = analysis['influencer_id']
-                
-                if key:
-                    platform = analysis.get('platform', '')
-                    full_key = f"{platform}:{key}"
-                    ai_analyses_dict[full_key] = analysis
-            
-            # 인플루언서와 AI 분석 결과 매칭 및 필터링
-            filtered_influencers = []
-            for influencer in influencers:
-                sns_id = influencer.get('sns_id', '')
-                platform = influencer.get('platform', '')
-                full_key = f"{platform}:{sns_id}"
-                
-                # AI 분석 결과가 있는 경우 필터링 적용
-                ai_analysis = ai_analyses_dict.get(full_key)
-                
-                if ai_analysis:
-                    # 총점 필터링
-                    overall_score = ai_analysis.get('overall_score')
-                    if overall_score is not None:
-                        if overall_score < overall_score_min or overall_score > overall_score_max:
-                            continue
-                    
-                    # 성장성 필터링
-                    growth_potential_score = ai_analysis.get('growth_potential_score')
-                    if growth_potential_score is not None:
-                        if growth_potential_score < growth_potential_min or growth_potential_score > growth_potential_max:
-                            continue
-                    
-                    # AI 분석 결과를 인플루언서 데이터에 추가
-                    influencer['ai_analysis'] = ai_analysis
-                    filtered_influencers.append(influencer)
-                else:
-                    # AI 분석 결과가 없는 경우, 점수 필터가 기본값이면 포함
-                    if overall_score_min == 0.0 and overall_score_max == 10.0 and \
-                       growth_potential_min == 0.0 and growth_potential_max == 10.0:
-                        filtered_influencers.append(influencer)
-                    # AI 분석 결과가 없고 필터가 설정된 경우 제외
-                    elif overall_score_min > 0.0 or overall_score_max < 10.0 or \
-                         growth_potential_min > 0.0 or growth_potential_max < 10.0:
-                        continue
-                    else:
-                        filtered_influencers.append(influencer)
+        min_followers, max_followers = FOLLOWER_RANGE_BOUNDS.get(follower_range, (None, None))
+        
+        rows = db_manager.search_influencers_with_analysis({
+            "category": category if category != "전체" else None,
+            "tag_keywords": tag_keywords,
+            "min_followers": min_followers,
+            "max_followers": max_followers,
+            "overall_score_range": (overall_score_min, overall_score_max),
+            "growth_potential_range": (growth_potential_min, growth_potential_max),
+        })
+        if rows is None:
+            # 결과 없음(빈 목록)과 RPC 실패를 구분하여 빈 검색 결과로 보이지 않도록 함
+            st.error("❌ 인플루언서 검색 RPC(search_influencers_with_analysis) 호출에 실패했습니다.")
+            st.info("💡 `supabase/db/influencer_search_with_analysis.sql` 마이그레이션이 적용되었는지 확인해주세요.")
+            return []
         
-        return filtered_influencers
+        # 분석 점수 컬럼을 기존 표시 형식(ai_analysis)으로 묶기
+        results = []
+        for row in rows:
+            influencer = {k: v for k, v in row.items() if k not in AI_ANALYSIS_SCORE_COLUMNS and k != "analysis_id"}
+            if row.get("analysis_id"):
+                influencer["ai_analysis"] = {k: row.get(k) for k in AI_ANALYSIS_SCORE_COLUMNS}
+            results.append(influencer)
+        return results
         
     except Exception as e:
         st.error(f"검색 수행 중 오류: {str(e)}")
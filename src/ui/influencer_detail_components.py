@@ -391,9 +391,7 @@ def render_influencer_detail_form(influencer):
                     if result["success"]:
                         st.success("인플루언서 정보가 수정되었습니다!")
                         # 캐시 초기화
-                        for key in list(st.session_state.keys()):
-                            if key.startswith("filtered_influencers_"):
-                                del st.session_state[key]
+                        st.session_state.pop("influencer_page_cache", None)
                         # 폼 초기화 플래그 제거 (다음에 다시 로드되도록)
                         if f"{form_key}_initialized" in st.session_state:
                             del st.session_state[f"{form_key}_initialized"]
@@ -0,0 +1,196 @@
+"""
+인플루언서 일괄 등록 컴포넌트 (CSV/XLSX)
+- 업로드 파일을 한 번에 정규화/검증하고, 기존 (platform, sns_id)는 일괄 조회로 걸러낸 뒤 청크 단위로 등록
+"""
+import streamlit as st
+import pandas as pd
+from ..db.database import db_manager
+from ..db.models import Influencer
+from ..constants.categories import CATEGORY_OPTIONS, DEFAULT_CATEGORY
+
+
+PLATFORM_OPTIONS = ["instagram", "youtube", "tiktok", "x", "blog", "facebook"]
+
+# 업로드 파일의 플랫폼 표기 → DB 플랫폼 값
+PLATFORM_ALIASES = {
+    "인스타그램": "instagram", "insta": "instagram",
+    "유튜브": "youtube",
+    "틱톡": "tiktok",
+    "twitter": "x", "트위터": "x",
+    "블로그": "blog", "naver blog": "blog",
+    "페이스북": "facebook",
+}
+
+# 업로드 파일 헤더 → Influencer 필드명 (영문/한글 모두 허용)
+IMPORT_COLUMN_ALIASES = {
+    "platform": "platform", "플랫폼": "platform",
+    "sns_id": "sns_id", "sns id": "sns_id",
+    "sns_url": "sns_url", "sns url": "sns_url",
+    "influencer_name": "influencer_name", "별칭": "influencer_name", "이름": "influencer_name",
+    "content_category": "content_category", "카테고리": "content_category",
+    "followers_count": "followers_count", "팔로워 수": "followers_count", "팔로워": "followers_count",
+    "post_count": "post_count", "게시물 수": "post_count",
+    "price_krw": "price_krw", "가격": "price_krw", "가격 (원)": "price_krw",
+    "phone_number": "phone_number", "전화번호": "phone_number",
+    "email": "email", "이메일": "email",
+    "kakao_channel_id": "kakao_channel_id", "카카오 채널": "kakao_channel_id",
+    "shipping_address": "shipping_address", "배송 주소": "shipping_address",
+    "owner_comment": "owner_comment",
+    "tags": "tags", "태그": "tags",
+    "created_by": "created_by", "등록자": "created_by",
+}
+
+NUMERIC_COLUMNS = ["followers_count", "post_count", "price_krw"]
+
+STATUS_LABELS = {
+    "created": "✅ 신규 등록",
+    "updated": "✏️ 업데이트",
+    "duplicate": "⚠️ 중복",
+    "failed": "❌ 실패",
+}
+
+
+def normalize_influencer_frame(raw_df):
+    """헤더/플랫폼/SNS ID/카테고리 정규화 + 필수값 검증 (벡터 연산)
+
+    Returns:
+        (유효 행 DataFrame, 오류 행 DataFrame(사유 포함))
+    """
+    df = raw_df.rename(columns=lambda c: IMPORT_COLUMN_ALIASES.get(str(c).strip().lower(), str(c).strip()))
+    missing = [c for c in ("platform", "sns_id") if c not in df.columns]
+    if missing:
+        raise ValueError(f"필수 컬럼이 없습니다: {', '.join(missing)}")
+
+    df = df[[c for c in df.columns if c in set(IMPORT_COLUMN_ALIASES.values())]].copy()
+    df["row_number"] = range(2, len(df) + 2)  # 엑셀 기준 행 번호 (헤더 다음 행부터)
+
+    platform = df["platform"].fillna("").astype(str).str.strip().str.lower()
+    df["platform"] = platform.replace(PLATFORM_ALIASES)
+    # SNS ID 정규화: 단건 등록/중복체크와 동일하게 @ 제거 및 공백 제거
+    df["sns_id"] = df["sns_id"].fillna("").astype(str).str.replace("@", "", regex=False).str.strip()
+    df["sns_url"] = df["sns_url"].fillna("").astype(str).str.strip() if "sns_url" in df.columns else ""
+
+    # 카테고리/별칭 기본값은 신규 등록 행에만 적용하므로(_row_to_influencer) 여기서는 파일 값만 정리
+    # (알 수 없는 카테고리는 빈 값으로 두어 기존 인플루언서 업데이트 시 덮어쓰지 않음)
+    if "content_category" in df.columns:
+        category = df["content_category"].fillna("").astype(str).str.strip()
+        df["content_category"] = category.where(category.isin(CATEGORY_OPTIONS), "")
+    if "influencer_name" in df.columns:
+        df["influencer_name"] = df["influencer_name"].fillna("").astype(str).str.strip()
+
+    for column in NUMERIC_COLUMNS:
+        if column in df.columns:
+            df[column] = pd.to_numeric(df[column], errors="coerce")
+
+    errors = pd.Series("", index=df.index)
+    errors = errors.mask(~df["platform"].isin(PLATFORM_OPTIONS), "지원하지 않는 플랫폼")
+    errors = errors.mask((errors == "") & (df["sns_id"] == ""), "SNS ID 없음")
+    errors = errors.mask((errors == "") & (df["sns_url"] == ""), "SNS URL 없음")
+
+    invalid = df[errors != ""].assign(error=errors[errors != ""])
+    return df[errors == ""], invalid
+
+
+def _row_to_influencer(row, columns):
+    """정규화된 행 → (Influencer 모델, 파일에 값이 있는 필드 집합)
+
+    모델에는 신규 등록용 기본값(카테고리 DEFAULT_CATEGORY, 별칭 sns_id)을 채우고,
+    기존 인플루언서 업데이트에는 파일에 값이 있는 필드만 사용하도록 필드 집합을 함께 반환
+    """
+    data = {}
+    for column in columns:
+        value = row[column]
+        if value is None or (not isinstance(value, str) and pd.isna(value)):
+            continue
+        if column in ("followers_count", "post_count"):
+            value = int(value)
+        elif column == "price_krw":
+            value = float(value)
+        elif isinstance(value, str):
+            value = value.strip()
+            if not value:
+                continue
+        else:
+            value = str(value)
+        data[column] = value
+    provided = set(data)
+    data.setdefault("content_category", DEFAULT_CATEGORY)
+    data.setdefault("influencer_name", data["sns_id"])
+    return Influencer(**data), provided
+
+
+def render_influencer_bulk_import():
+    """인플루언서 일괄 등록 (CSV/XLSX 업로드)"""
+    st.markdown("### 📤 인플루언서 일괄 등록")
+    st.caption(
+        "platform, sns_id, sns_url 컬럼이 필요합니다. 별칭/카테고리/팔로워 수/게시물 수/가격/연락처/태그/등록자 "
+        "컬럼은 선택 사항이며 한글 헤더(플랫폼, SNS ID, 별칭, 카테고리 등)도 인식합니다."
+    )
+
+    uploaded_file = st.file_uploader("인플루언서 목록 파일", type=["csv", "xlsx"], key="influencer_import_file")
+    if not uploaded_file:
+        return
+
+    try:
+        if uploaded_file.name.lower().endswith(".xlsx"):
+            raw_df = pd.read_excel(uploaded_file, dtype=object)
+        else:
+            raw_df = pd.read_csv(uploaded_file, dtype=object, encoding="utf-8-sig")
+        valid, invalid = normalize_influencer_frame(raw_df)
+    except Exception as e:
+        st.error(f"❌ 파일 처리 중 오류가 발생했습니다: {str(e)}")
+        return
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("등록 가능", f"{len(valid):,}건")
+    with col2:
+        st.metric("검증 오류", f"{len(invalid):,}건")
+
+    if not invalid.empty:
+        with st.expander(f"❌ 검증 오류 ({len(invalid)}건)", expanded=False):
+            st.dataframe(
+                invalid[["row_number", "platform", "sns_id", "error"]].rename(
+                    columns={"row_number": "행", "platform": "플랫폼", "sns_id": "SNS ID", "error": "오류"}
+                ),
+                width='stretch', hide_index=True
+            )
+
+    if valid.empty:
+        st.info("등록할 데이터가 없습니다.")
+        return
+
+    update_existing = st.checkbox(
+        "이미 등록된 인플루언서는 파일 값으로 업데이트",
+        value=False,
+        key="influencer_import_update_existing",
+        help="선택하지 않으면 이미 등록된 (플랫폼, SNS ID)는 중복으로 표시하고 건너뜁니다"
+    )
+
+    if st.button(f"📤 {len(valid):,}건 일괄 등록", type="primary", key="influencer_import_submit"):
+        columns = [c for c in valid.columns if c != "row_number"]
+        with st.spinner("인플루언서를 등록하는 중..."):
+            converted = [_row_to_influencer(row, columns) for row in valid.to_dict("records")]
+            result = db_manager.bulk_import_influencers(
+                [influencer for influencer, _ in converted],
+                update_existing=update_existing,
+                update_columns=[provided for _, provided in converted]
+            )
+
+        if not result.get("results"):
+            st.error(f"❌ 일괄 등록 실패: {result.get('message', '')}")
+            return
+
+        if result["failed"]:
+            st.warning(f"⚠️ {result['message']}")
+        else:
+            st.success(f"✅ {result['message']}")
+
+        report_df = pd.DataFrame({
+            "행": valid["row_number"].values,
+            "플랫폼": valid["platform"].values,
+            "SNS ID": valid["sns_id"].values,
+            "결과": [STATUS_LABELS.get(r["status"], r["status"]) for r in result["results"]],
+            "메시지": [r.get("message", "") for r in result["results"]],
+        })
+        st.dataframe(report_df, width='stretch', hide_index=True)
@@ -811,10 +811,8 @@ def match_influencers(required_count: int):
                 st.error("데이터베이스 연결 실패")
                 return
             
-            # 전체 인플루언서 조회 (새 테이블 사용)
-            query = client.table("ai_influencer_analyses_new").select("*")
-            response = query.limit(10000).execute()
-            all_candidates = response.data if response.data else []
+            # 전체 인플루언서 조회 (인플루언서별 최신 분석 1건씩)
+            all_candidates = simple_client.get_latest_ai_analyses()
             
             if not all_candidates:
                 st.warning("⚠️ 분석된 인플루언서 데이터가 없습니다.")
@@ -1221,9 +1219,16 @@ def display_matched_influencers_list_for_matching():
         if 'generated_proposal' in st.session_state:
             del st.session_state.generated_proposal
         st.rerun()
-    
+
+    # 매칭 결과를 선택한 캠페인에 바로 추가
+    matching_campaign = st.session_state.get('matching_selected_campaign')
+    if matching_campaign:
+        from .campaign_participation_add_components import render_matched_bulk_add
+        with st.expander(f"📥 매칭 결과를 '{matching_campaign.get('campaign_name', '')}' 캠페인에 추가", expanded=False):
+            render_matched_bulk_add(matching_campaign, matched, key_prefix="matching_bulk_add")
+
     st.markdown("---")
-    
+
     # 인플루언서 선택 드롭다운
     influencer_options = {}
     for idx, inf in enumerate(matched):
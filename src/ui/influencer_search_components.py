@@ -12,7 +12,8 @@ from ..constants.categories import (
 )
 from .common_functions import (
     search_single_influencer, 
-    search_single_influencer_by_platform
+    search_single_influencer_by_platform,
+    render_search_index_matches
 )
 
 
@@ -113,78 +114,9 @@ def render_influencer_search_and_filter():
                     3. SNS ID에 오타가 없는지 확인하세요
                     """)
                 
-                # 모든 인플루언서 목록 표시
-                with st.expander("🔍 모든 인플루언서 목록", expanded=True):
-                    try:
-                        all_influencers = db_manager.get_influencers()
-                        st.write(f"**총 {len(all_influencers)}명의 인플루언서가 등록되어 있습니다:**")
-                        
-                        # 검색어와 정확히 일치하는 인플루언서 찾기
-                        exact_matches = []
-                        partial_matches = []
-                        clean_search_term = search_term.replace('@', '').strip().lower()
-                        
-                        for inf in all_influencers:
-                            sns_id = inf.get('sns_id', '').lower()
-                            name = (inf.get('influencer_name', '') or '').lower()
-                            clean_sns_id = sns_id.replace('@', '').strip()
-                            
-                            # 정확한 매칭
-                            if (search_term.lower() == sns_id or 
-                                search_term.lower() == name or
-                                clean_search_term == clean_sns_id or
-                                clean_search_term == name):
-                                exact_matches.append(inf)
-                            
-                            # 부분 매칭
-                            elif (clean_search_term in clean_sns_id or 
-                                  clean_search_term in name or
-                                  search_term.lower() in sns_id or
-                                  search_term.lower() in name):
-                                partial_matches.append(inf)
-                        
-                        # 정확한 매칭 결과
-                        if exact_matches:
-                            st.success(f"**✅ 정확한 매칭 ({len(exact_matches)}명):**")
-                            for inf in exact_matches:
-                                active_status = "활성" if inf.get('active', True) else "비활성"
-                                st.write(f"- {inf.get('sns_id')} ({inf.get('platform')}) - {inf.get('influencer_name') or '이름 없음'} [{active_status}]")
-                        
-                        # 부분 매칭 결과
-                        if partial_matches:
-                            st.info(f"**🔍 부분 매칭 ({len(partial_matches)}명):**")
-                            for inf in partial_matches[:5]:  # 최대 5명만 표시
-                                active_status = "활성" if inf.get('active', True) else "비활성"
-                                st.write(f"- {inf.get('sns_id')} ({inf.get('platform')}) - {inf.get('influencer_name') or '이름 없음'} [{active_status}]")
-                            if len(partial_matches) > 5:
-                                st.write(f"... 외 {len(partial_matches) - 5}명 더")
-                        
-                        # 매칭이 없으면 전체 목록 표시
-                        if not exact_matches and not partial_matches:
-                            st.warning("**❌ 검색어와 일치하는 인플루언서가 없습니다.**")
-                            
-                            # 플랫폼별로 그룹화
-                            platform_groups = {}
-                            for inf in all_influencers:
-                                platform = inf.get('platform', 'unknown')
-                                if platform not in platform_groups:
-                                    platform_groups[platform] = []
-                                platform_groups[platform].append(inf)
-                            
-                            st.write("**전체 인플루언서 목록:**")
-                            for platform, influencers in platform_groups.items():
-                                st.write(f"**{platform.upper()} ({len(influencers)}명):**")
-                                for inf in influencers[:10]:  # 각 플랫폼당 최대 10명 표시
-                                    active_status = "활성" if inf.get('active', True) else "비활성"
-                                    st.write(f"- {inf.get('sns_id')} ({inf.get('influencer_name') or '이름 없음'}) [{active_status}]")
-                                if len(influencers) > 10:
-                                    st.write(f"... 외 {len(influencers) - 10}명 더")
-                                st.write("")
-                            
-                    except Exception as e:
-                        st.error(f"인플루언서 목록 조회 중 오류: {e}")
-                        import traceback
-                        st.code(traceback.format_exc())
+                # 검색 인덱스 기반 후보 표시 (전체 테이블 조회 없음)
+                with st.expander("🔍 비슷한 인플루언서 찾기", expanded=True):
+                    render_search_index_matches(search_term)
     
     # 필터링 기능
     st.markdown("### 🎯 필터링")
@@ -220,6 +152,9 @@ def render_influencer_search_and_filter():
     with col2:
         max_followers = st.number_input("최대 팔로워 수", min_value=0, value=10000000, key="max_followers")
     
+    # SNS ID / 이름 부분 검색
+    filter_search_term = st.text_input("SNS ID 또는 이름 포함", placeholder="검색어 (선택)", key="influencer_filter_search_term")
+    
     # 필터 적용 버튼
     if st.button("🔄 필터 적용", help="선택한 필터 조건으로 인플루언서를 조회합니다", key="apply_filter"):
         # 필터 조건을 세션에 저장
@@ -227,14 +162,13 @@ def render_influencer_search_and_filter():
             "platform": platform_filter if platform_filter != "전체" else None,
             "content_category": content_category_filter if content_category_filter != "전체" else None,
             "min_followers": min_followers,
-            "max_followers": max_followers
+            "max_followers": max_followers,
+            "search_term": filter_search_term.strip() or None
         }
-        # 페이지 초기화
+        # 페이지/커서/현재 페이지 캐시 초기화
         st.session_state.influencer_current_page = 0
-        # 필터링된 데이터 캐시 초기화
-        for key in list(st.session_state.keys()):
-            if key.startswith("filtered_influencers_"):
-                del st.session_state[key]
+        for key in ("influencer_page_cursors", "influencer_page_cache", "influencer_total_count"):
+            st.session_state.pop(key, None)
         st.success("필터가 적용되었습니다!")
         st.session_state.filter_applied = True  # 필터 적용 완료 플래그
         # 리렌더링 없이 상태 기반 UI 업데이트
@@ -243,7 +177,7 @@ def render_influencer_search_and_filter():
     render_influencer_list_with_pagination()
 
 def render_influencer_list_with_pagination():
-    """페이징이 적용된 인플루언서 목록 표시"""
+    """페이징이 적용된 인플루언서 목록 표시 (서버 필터 + keyset 페이지네이션, 현재 페이지만 보관)"""
     st.markdown("### 📊 인플루언서 목록")
     
     # 필터 조건 확인
@@ -253,66 +187,52 @@ def render_influencer_list_with_pagination():
         st.info("필터 조건을 설정하고 '필터 적용' 버튼을 클릭해주세요.")
         return
     
-    # 필터링된 인플루언서 조회
-    cache_key = f"filtered_influencers_{hash(str(filter_conditions))}"
-    
-    if cache_key not in st.session_state:
-        with st.spinner("필터링된 인플루언서를 불러오는 중..."):
-            all_influencers = db_manager.get_influencers()
-            
-            # 필터링 적용
-            filtered_influencers = all_influencers.copy()
-            
-            # 플랫폼 필터
-            if filter_conditions.get("platform"):
-                filtered_influencers = [inf for inf in filtered_influencers if inf['platform'] == filter_conditions["platform"]]
-            
-            # 콘텐츠 카테고리 필터 (LIKE 검색)
-            if filter_conditions.get("content_category"):
-                content_category = filter_conditions["content_category"]
-                filtered_influencers = [
-                    inf for inf in filtered_influencers 
-                    if inf.get('content_category') and content_category.lower() in inf.get('content_category', '').lower()
-                ]
-            
-            # 팔로워 수 필터
-            min_followers = filter_conditions.get("min_followers", 0)
-            max_followers = filter_conditions.get("max_followers", 10000000)
-            filtered_influencers = [
-                inf for inf in filtered_influencers 
-                if min_followers <= inf.get('followers_count', 0) <= max_followers
-            ]
-            
-            st.session_state[cache_key] = filtered_influencers
+    items_per_page = 10
+    exact_count = st.checkbox("정확한 전체 개수 표시", value=False, key="influencer_exact_count",
+                              help="선택하지 않으면 대략적인 개수(추정치)를 표시합니다")
+    count_mode = "exact" if exact_count else "estimated"
     
-    filtered_influencers = st.session_state[cache_key]
+    # 페이지별 시작 커서 (0페이지는 None) - 이전 페이지로 돌아갈 때 사용
+    cursors = st.session_state.setdefault('influencer_page_cursors', [None])
+    current_page = min(st.session_state.get('influencer_current_page', 0), len(cursors) - 1)
     
-    # 페이징 설정
-    items_per_page = 10
-    total_pages = (len(filtered_influencers) - 1) // items_per_page + 1
-    current_page = st.session_state.get('influencer_current_page', 0)
+    page_cache_key = (str(filter_conditions), current_page, count_mode)
+    page_cache = st.session_state.get('influencer_page_cache')
+    if not page_cache or page_cache['key'] != page_cache_key:
+        with st.spinner("인플루언서를 불러오는 중..."):
+            result = db_manager.get_influencers_page(
+                filter_conditions,
+                after=cursors[current_page],
+                page_size=items_per_page,
+                count=count_mode if current_page == 0 else None
+            )
+        if result.get('total_count') is not None:
+            st.session_state.influencer_total_count = result['total_count']
+        page_cache = {'key': page_cache_key, 'data': result['data'], 'next_cursor': result['next_cursor']}
+        st.session_state.influencer_page_cache = page_cache
     
-    # 페이지 선택
-    if total_pages > 1:
-        page_options = list(range(total_pages))
-        selected_page = st.selectbox(
-            f"페이지 선택 (총 {total_pages}페이지, {len(filtered_influencers)}명)",
-            page_options,
-            index=current_page,
-            key="page_selector"
-        )
-        
-        if selected_page != current_page:
-            st.session_state.influencer_current_page = selected_page
-            st.session_state.page_changed = True  # 페이지 변경 플래그
-            # 리렌더링 없이 상태 기반 UI 업데이트
+    page_influencers = page_cache['data']
+    next_cursor = page_cache['next_cursor']
+    total_count = st.session_state.get('influencer_total_count')
     
-    # 현재 페이지의 인플루언서 표시
-    start_idx = current_page * items_per_page
-    end_idx = min(start_idx + items_per_page, len(filtered_influencers))
-    page_influencers = filtered_influencers[start_idx:end_idx]
+    if next_cursor and len(cursors) == current_page + 1:
+        cursors.append(next_cursor)
     
-    st.caption(f"페이지 {current_page + 1}/{total_pages} (총 {len(filtered_influencers)}명)")
+    # 페이지 이동
+    col_prev, col_info, col_next = st.columns([1, 3, 1])
+    with col_prev:
+        if st.button("◀ 이전", key="influencer_prev_page", disabled=current_page == 0):
+            st.session_state.influencer_current_page = current_page - 1
+            st.rerun()
+    with col_info:
+        count_text = ""
+        if total_count is not None:
+            count_text = f" (총 {'' if exact_count else '약 '}{total_count:,}명)"
+        st.caption(f"페이지 {current_page + 1}{count_text}")
+    with col_next:
+        if st.button("다음 ▶", key="influencer_next_page", disabled=not next_cursor):
+            st.session_state.influencer_current_page = current_page + 1
+            st.rerun()
     
     if page_influencers:
         # 인플루언서 목록 표시
@@ -408,9 +328,7 @@ def render_influencer_list_item(influencer, index):
                             del st.session_state[key]
                 
                 # 캐시 초기화
-                for key in list(st.session_state.keys()):
-                    if key.startswith("filtered_influencers_"):
-                        del st.session_state[key]
+                st.session_state.pop("influencer_page_cache", None)
                 st.session_state.influencer_deleted_from_search = True  # 검색에서 인플루언서 삭제 완료 플래그
                 # 리렌더링 없이 상태 기반 UI 업데이트
             else:
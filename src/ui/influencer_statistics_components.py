@@ -7,14 +7,25 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
-from ..db.database import db_manager
+from .influencer_statistics_snapshot import (
+    get_influencer_snapshot,
+    get_snapshot_frame,
+    get_group_stats,
+    summarize_groups,
+    render_snapshot_controls,
+    render_snapshot_caption
+)
 
 def render_influencer_statistics():
     """인플루언서 통계 메인 컴포넌트"""
     st.subheader("📊 인플루언서 통계")
     st.markdown("인플루언서 데이터 분석 및 통계 정보를 제공합니다.")
     
+    # 네 섹션이 공유하는 인플루언서 스냅샷 (세션당 한 번 조회)
+    # (행 데이터는 필요한 섹션에서 처음 조회, 서버 집계 섹션은 집계 결과만 조회)
+    use_server_aggregates, caption_slot = render_snapshot_controls("influencer_statistics")
+    snapshot = get_influencer_snapshot()
+    
     # 통계 탭으로 분리
     tab1, tab2, tab3, tab4 = st.tabs([
         "📈 전체 통계", 
@@ -24,43 +35,41 @@ def render_influencer_statistics():
     ])
     
     with tab1:
-        render_overall_statistics()
+        render_overall_statistics(snapshot)
     
     with tab2:
-        render_category_analysis()
+        render_category_analysis(snapshot, use_server_aggregates)
     
     with tab3:
-        render_platform_analysis()
+        render_platform_analysis(snapshot, use_server_aggregates)
     
     with tab4:
-        render_rating_analysis()
+        render_rating_analysis(snapshot)
+    
+    render_snapshot_caption(caption_slot)
 
-def render_overall_statistics():
+def render_overall_statistics(snapshot=None):
     """전체 통계 탭"""
     st.subheader("📈 전체 통계")
     
     try:
-        # 인플루언서 데이터 가져오기
-        influencers = db_manager.get_influencers()
+        # 공유 인플루언서 스냅샷 (네 섹션이 같은 조회 결과를 재사용)
+        influencers = get_snapshot_frame(snapshot or get_influencer_snapshot())
         
-        if not influencers:
+        if influencers.empty:
             st.warning("등록된 인플루언서가 없습니다.")
             return
         
         # 기본 통계 계산
         total_influencers = len(influencers)
-        active_influencers = len([inf for inf in influencers if inf.get('active', True)])
+        active_influencers = int(influencers['active'].sum())
         inactive_influencers = total_influencers - active_influencers
         
-        # 팔로워 수 통계
-        followers_data = [inf.get('followers_count', 0) or 0 for inf in influencers if inf.get('followers_count')]
-        total_followers = sum(followers_data)
-        avg_followers = total_followers / len(followers_data) if followers_data else 0
-        
-        # 가격 통계
-        price_data = [inf.get('price_krw', 0) or 0 for inf in influencers if inf.get('price_krw')]
-        total_price = sum(price_data)
-        avg_price = total_price / len(price_data) if price_data else 0
+        # 팔로워 수 통계 (팔로워 수가 있는 인플루언서 기준)
+        followers = influencers['followers_count']
+        followers = followers[followers > 0]
+        total_followers = int(followers.sum())
+        avg_followers = followers.mean() if not followers.empty else 0
         
         # 메트릭 표시
         col1, col2, col3, col4 = st.columns(4)
@@ -98,20 +107,16 @@ def render_overall_statistics():
         st.markdown("### 📊 시각화")
         
         # 팔로워 수 분포 차트
-        if followers_data:
+        if not followers.empty:
             col1, col2 = st.columns(2)
             
             with col1:
                 st.markdown("#### 팔로워 수 분포")
                 # 팔로워 수 구간별 분포
-                followers_df = pd.DataFrame({'팔로워수': followers_data})
-                
-                # 구간 설정
                 bins = [0, 1000, 5000, 10000, 50000, 100000, 500000, float('inf')]
                 labels = ['1K 미만', '1K-5K', '5K-10K', '10K-50K', '50K-100K', '100K-500K', '500K+']
                 
-                followers_df['구간'] = pd.cut(followers_df['팔로워수'], bins=bins, labels=labels, right=False)
-                followers_dist = followers_df['구간'].value_counts().sort_index()
+                followers_dist = pd.cut(followers, bins=bins, labels=labels, right=False).value_counts().sort_index()
                 
                 fig = px.bar(
                     x=followers_dist.index, 
@@ -125,7 +130,7 @@ def render_overall_statistics():
             with col2:
                 st.markdown("#### 팔로워 수 히스토그램")
                 # 100만 이하만 필터링
-                followers_df_filtered = followers_df[followers_df['팔로워수'] <= 1000000]
+                followers_df_filtered = pd.DataFrame({'팔로워수': followers[followers <= 1000000]})
                 fig = px.histogram(
                     followers_df_filtered, 
                     x='팔로워수',
@@ -137,31 +142,10 @@ def render_overall_statistics():
         
         # 등록일별 추이
         st.markdown("#### 등록일별 인플루언서 추가 추이")
-        registration_data = []
-        for inf in influencers:
-            if inf.get('created_at'):
-                try:
-                    # 날짜 파싱 (다양한 형식 지원)
-                    created_at = inf['created_at']
-                    if isinstance(created_at, str):
-                        # ISO 형식 또는 다른 형식 처리
-                        if 'T' in created_at:
-                            date_obj = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                        else:
-                            date_obj = datetime.strptime(created_at[:10], '%Y-%m-%d')
-                    else:
-                        date_obj = created_at
-                    
-                    registration_data.append({
-                        'date': date_obj.date(),
-                        'count': 1
-                    })
-                except:
-                    continue
-        
-        if registration_data:
-            reg_df = pd.DataFrame(registration_data)
-            reg_df = reg_df.groupby('date').sum().reset_index()
+        created_dates = influencers['created_at'].dropna().dt.date
+        
+        if not created_dates.empty:
+            reg_df = created_dates.value_counts().sort_index().rename_axis('date').reset_index(name='count')
             reg_df['cumulative'] = reg_df['count'].cumsum()
             
             fig = make_subplots(specs=[[{"secondary_y": True}]])
@@ -190,57 +174,31 @@ def render_overall_statistics():
     except Exception as e:
         st.error(f"통계 데이터를 불러오는 중 오류가 발생했습니다: {str(e)}")
 
-def render_category_analysis():
+def render_category_analysis(snapshot=None, use_server_aggregates: bool = False):
     """카테고리별 분석 탭"""
     st.subheader("🏷️ 카테고리별 분석")
     
     try:
-        influencers = db_manager.get_influencers()
+        group_stats = get_group_stats(snapshot or get_influencer_snapshot(), use_server_aggregates)
         
-        if not influencers:
+        if group_stats.empty:
             st.warning("등록된 인플루언서가 없습니다.")
             return
         
-        # 카테고리별 통계
-        category_stats = {}
-        for inf in influencers:
-            category = inf.get('content_category', '기타')
-            if category not in category_stats:
-                category_stats[category] = {
-                    'count': 0,
-                    'total_followers': 0,
-                    'total_price': 0,
-                    'active_count': 0,
-                    'ratings': []
-                }
-            
-            category_stats[category]['count'] += 1
-            if inf.get('active', True):
-                category_stats[category]['active_count'] += 1
-            
-            followers = inf.get('followers_count', 0) or 0
-            category_stats[category]['total_followers'] += followers
-            
-            price = inf.get('price_krw', 0) or 0
-            category_stats[category]['total_price'] += price
-            
-            if inf.get('manager_rating'):
-                category_stats[category]['ratings'].append(inf['manager_rating'])
+        # 카테고리별 통계 (플랫폼 × 카테고리 집계를 카테고리 기준으로 합산)
+        category_stats = summarize_groups(group_stats, 'content_category')
         
         # 데이터프레임 생성
-        category_df = pd.DataFrame([
-            {
-                '카테고리': cat,
-                '인플루언서 수': stats['count'],
-                '활성 수': stats['active_count'],
-                '총 팔로워 수': stats['total_followers'],
-                '평균 팔로워 수': stats['total_followers'] / stats['count'] if stats['count'] > 0 else 0,
-                '총 예산': stats['total_price'],
-                '평균 예산': stats['total_price'] / stats['count'] if stats['count'] > 0 else 0,
-                '평균 평점': sum(stats['ratings']) / len(stats['ratings']) if stats['ratings'] else 0
-            }
-            for cat, stats in category_stats.items()
-        ])
+        category_df = pd.DataFrame({
+            '카테고리': category_stats['content_category'],
+            '인플루언서 수': category_stats['influencer_count'].astype(int),
+            '활성 수': category_stats['active_count'].astype(int),
+            '총 팔로워 수': category_stats['total_followers'],
+            '평균 팔로워 수': category_stats['avg_followers'],
+            '총 예산': category_stats['total_price'],
+            '평균 예산': category_stats['avg_price'],
+            '평균 평점': category_stats['avg_rating']
+        })
         
         # 카테고리별 인플루언서 수 차트
         col1, col2 = st.columns(2)
@@ -286,58 +244,30 @@ def render_category_analysis():
     except Exception as e:
         st.error(f"카테고리 분석 중 오류가 발생했습니다: {str(e)}")
 
-def render_platform_analysis():
+def render_platform_analysis(snapshot=None, use_server_aggregates: bool = False):
     """플랫폼별 분석 탭"""
     st.subheader("📱 플랫폼별 분석")
     
     try:
-        influencers = db_manager.get_influencers()
+        group_stats = get_group_stats(snapshot or get_influencer_snapshot(), use_server_aggregates)
         
-        if not influencers:
+        if group_stats.empty:
             st.warning("등록된 인플루언서가 없습니다.")
             return
         
-        # 플랫폼별 통계
-        platform_stats = {}
-        for inf in influencers:
-            platform = inf.get('platform', 'unknown')
-            if platform not in platform_stats:
-                platform_stats[platform] = {
-                    'count': 0,
-                    'total_followers': 0,
-                    'total_price': 0,
-                    'active_count': 0,
-                    'categories': {}
-                }
-            
-            platform_stats[platform]['count'] += 1
-            if inf.get('active', True):
-                platform_stats[platform]['active_count'] += 1
-            
-            followers = inf.get('followers_count', 0) or 0
-            platform_stats[platform]['total_followers'] += followers
-            
-            price = inf.get('price_krw', 0) or 0
-            platform_stats[platform]['total_price'] += price
-            
-            category = inf.get('content_category', '기타')
-            if category not in platform_stats[platform]['categories']:
-                platform_stats[platform]['categories'][category] = 0
-            platform_stats[platform]['categories'][category] += 1
+        # 플랫폼별 통계 (플랫폼 × 카테고리 집계를 플랫폼 기준으로 합산)
+        platform_stats = summarize_groups(group_stats, 'platform')
         
         # 데이터프레임 생성
-        platform_df = pd.DataFrame([
-            {
-                '플랫폼': platform,
-                '인플루언서 수': stats['count'],
-                '활성 수': stats['active_count'],
-                '총 팔로워 수': stats['total_followers'],
-                '평균 팔로워 수': stats['total_followers'] / stats['count'] if stats['count'] > 0 else 0,
-                '총 예산': stats['total_price'],
-                '평균 예산': stats['total_price'] / stats['count'] if stats['count'] > 0 else 0
-            }
-            for platform, stats in platform_stats.items()
-        ])
+        platform_df = pd.DataFrame({
+            '플랫폼': platform_stats['platform'],
+            '인플루언서 수': platform_stats['influencer_count'].astype(int),
+            '활성 수': platform_stats['active_count'].astype(int),
+            '총 팔로워 수': platform_stats['total_followers'],
+            '평균 팔로워 수': platform_stats['avg_followers'],
+            '총 예산': platform_stats['total_price'],
+            '평균 예산': platform_stats['avg_price']
+        })
         
         # 플랫폼 아이콘 매핑
         platform_icons = {
@@ -377,18 +307,13 @@ def render_platform_analysis():
         # 플랫폼별 카테고리 분포
         st.markdown("#### 플랫폼별 카테고리 분포")
         
-        # 플랫폼-카테고리 매트릭스 생성
-        platform_category_data = []
-        for platform, stats in platform_stats.items():
-            for category, count in stats['categories'].items():
-                platform_category_data.append({
-                    '플랫폼': platform_icons.get(platform, platform),
-                    '카테고리': category,
-                    '인플루언서 수': count
-                })
-        
-        if platform_category_data:
-            pc_df = pd.DataFrame(platform_category_data)
+        # 플랫폼-카테고리 매트릭스 (집계 결과 그대로 사용)
+        if not group_stats.empty:
+            pc_df = pd.DataFrame({
+                '플랫폼': group_stats['platform'].map(platform_icons).fillna(group_stats['platform']),
+                '카테고리': group_stats['content_category'],
+                '인플루언서 수': group_stats['influencer_count'].astype(int)
+            })
             fig = px.bar(
                 pc_df,
                 x='플랫폼',
@@ -422,22 +347,26 @@ def render_platform_analysis():
     except Exception as e:
         st.error(f"플랫폼 분석 중 오류가 발생했습니다: {str(e)}")
 
-def render_rating_analysis():
+def _format_rating(value):
+    """평점 표시 (없으면 N/A)"""
+    return int(value) if pd.notna(value) else 'N/A'
+
+def render_rating_analysis(snapshot=None):
     """평점 분석 탭"""
     st.subheader("⭐ 평점 분석")
     
     try:
-        influencers = db_manager.get_influencers()
+        influencers = get_snapshot_frame(snapshot or get_influencer_snapshot())
         
-        if not influencers:
+        if influencers.empty:
             st.warning("등록된 인플루언서가 없습니다.")
             return
         
-        # 평점 데이터 수집 (None 값 제외)
-        manager_ratings = [inf.get('manager_rating') for inf in influencers if inf.get('manager_rating') is not None]
-        content_ratings = [inf.get('content_rating') for inf in influencers if inf.get('content_rating') is not None]
+        # 평점 데이터 수집 (결측값 제외)
+        manager_ratings = influencers['manager_rating'].dropna()
+        content_ratings = influencers['content_rating'].dropna()
         
-        if not manager_ratings and not content_ratings:
+        if manager_ratings.empty and content_ratings.empty:
             st.warning("평점 데이터가 없습니다.")
             return
         
@@ -445,10 +374,9 @@ def render_rating_analysis():
         col1, col2 = st.columns(2)
         
         with col1:
-            if manager_ratings:
+            if not manager_ratings.empty:
                 st.markdown("#### 매니저 평점 분포")
-                rating_df = pd.DataFrame({'평점': manager_ratings})
-                rating_dist = rating_df['평점'].value_counts().sort_index()
+                rating_dist = manager_ratings.astype(int).value_counts().sort_index()
                 
                 fig = px.bar(
                     x=rating_dist.index,
@@ -462,10 +390,9 @@ def render_rating_analysis():
                 st.info("매니저 평점 데이터가 없습니다.")
         
         with col2:
-            if content_ratings:
+            if not content_ratings.empty:
                 st.markdown("#### 콘텐츠 평점 분포")
-                rating_df = pd.DataFrame({'평점': content_ratings})
-                rating_dist = rating_df['평점'].value_counts().sort_index()
+                rating_dist = content_ratings.astype(int).value_counts().sort_index()
                 
                 fig = px.bar(
                     x=rating_dist.index,
@@ -479,73 +406,50 @@ def render_rating_analysis():
                 st.info("콘텐츠 평점 데이터가 없습니다.")
         
         # 평점 통계
-        if manager_ratings or content_ratings:
-            st.markdown("#### 평점 통계")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                if manager_ratings:
-                    st.markdown("**매니저 평점 통계**")
-                    avg_manager = sum(manager_ratings) / len(manager_ratings)
-                    st.metric("평균 평점", f"{avg_manager:.2f}/5")
-                    st.metric("최고 평점", f"{max(manager_ratings)}/5")
-                    st.metric("최저 평점", f"{min(manager_ratings)}/5")
-                    st.metric("평점 개수", f"{len(manager_ratings)}개")
-            
-            with col2:
-                if content_ratings:
-                    st.markdown("**콘텐츠 평점 통계**")
-                    avg_content = sum(content_ratings) / len(content_ratings)
-                    st.metric("평균 평점", f"{avg_content:.2f}/5")
-                    st.metric("최고 평점", f"{max(content_ratings)}/5")
-                    st.metric("최저 평점", f"{min(content_ratings)}/5")
-                    st.metric("평점 개수", f"{len(content_ratings)}개")
+        st.markdown("#### 평점 통계")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            if not manager_ratings.empty:
+                st.markdown("**매니저 평점 통계**")
+                st.metric("평균 평점", f"{manager_ratings.mean():.2f}/5")
+                st.metric("최고 평점", f"{int(manager_ratings.max())}/5")
+                st.metric("최저 평점", f"{int(manager_ratings.min())}/5")
+                st.metric("평점 개수", f"{len(manager_ratings)}개")
+        
+        with col2:
+            if not content_ratings.empty:
+                st.markdown("**콘텐츠 평점 통계**")
+                st.metric("평균 평점", f"{content_ratings.mean():.2f}/5")
+                st.metric("최고 평점", f"{int(content_ratings.max())}/5")
+                st.metric("최저 평점", f"{int(content_ratings.min())}/5")
+                st.metric("평점 개수", f"{len(content_ratings)}개")
         
         # 평점별 인플루언서 목록
-        if manager_ratings or content_ratings:
-            st.markdown("#### 평점별 인플루언서 목록")
-            
-            # 평점이 있는 인플루언서 필터링 (None 값 제외)
-            rated_influencers = [
-                inf for inf in influencers 
-                if inf.get('manager_rating') is not None or inf.get('content_rating') is not None
-            ]
-            
-            if rated_influencers:
-                # 평점별로 정렬 (None 값 처리)
-                def get_avg_rating(inf):
-                    manager_rating = inf.get('manager_rating') or 0
-                    content_rating = inf.get('content_rating') or 0
-                    if manager_rating and content_rating:
-                        return (manager_rating + content_rating) / 2
-                    elif manager_rating:
-                        return manager_rating
-                    elif content_rating:
-                        return content_rating
-                    else:
-                        return 0
-                
-                rated_influencers.sort(key=get_avg_rating, reverse=True)
-                
-                # 표시용 데이터 준비
-                display_data = []
-                for inf in rated_influencers:
-                    display_data.append({
-                        'SNS ID': inf.get('sns_id', 'N/A'),
-                        '이름': inf.get('influencer_name', 'N/A'),
-                        '플랫폼': inf.get('platform', 'N/A'),
-                        '매니저 평점': inf.get('manager_rating') if inf.get('manager_rating') is not None else 'N/A',
-                        '콘텐츠 평점': inf.get('content_rating') if inf.get('content_rating') is not None else 'N/A',
-                        '팔로워 수': f"{inf.get('followers_count', 0):,}" if inf.get('followers_count') else 'N/A',
-                        '가격': f"{inf.get('price_krw', 0):,.0f}원" if inf.get('price_krw') else 'N/A'
-                    })
-                
-                st.dataframe(
-                    pd.DataFrame(display_data),
-                    width='stretch',
-                    hide_index=True
-                )
+        st.markdown("#### 평점별 인플루언서 목록")
+        
+        # 평점이 있는 인플루언서만, 두 평점의 평균(하나만 있으면 그 값) 내림차순
+        rated = influencers[influencers['manager_rating'].notna() | influencers['content_rating'].notna()]
+        avg_rating = rated[['manager_rating', 'content_rating']].mean(axis=1)
+        rated = rated.loc[avg_rating.sort_values(ascending=False, kind='mergesort').index]
+        
+        # 표시용 데이터 준비
+        display_df = pd.DataFrame({
+            'SNS ID': rated['sns_id'].fillna('N/A'),
+            '이름': rated['influencer_name'].fillna('N/A'),
+            '플랫폼': rated['platform'],
+            '매니저 평점': rated['manager_rating'].map(_format_rating),
+            '콘텐츠 평점': rated['content_rating'].map(_format_rating),
+            '팔로워 수': rated['followers_count'].map(lambda x: f"{x:,.0f}" if x > 0 else 'N/A'),
+            '가격': rated['price_krw'].map(lambda x: f"{x:,.0f}원" if x > 0 else 'N/A')
+        })
+        
+        st.dataframe(
+            display_df,
+            width='stretch',
+            hide_index=True
+        )
         
     except Exception as e:
         st.error(f"평점 분석 중 오류가 발생했습니다: {str(e)}")
@@ -0,0 +1,149 @@
+"""
+인플루언서 통계 공유 스냅샷
+- 통계 화면의 네 섹션(전체/카테고리/플랫폼/평점)이 같은 스냅샷을 재사용하도록 세션당 한 번만 필요한 컬럼을 조회
+- 행 데이터는 필요한 섹션이 처음 요청할 때 조회 (서버 집계만 쓰는 섹션은 전체 조회 없음)
+- 숫자 필드는 열 단위(float, 결측은 NaN)로 변환해 두고 분포/집계는 pandas 벡터 연산으로 계산
+- 인플루언서 일괄 저장 시 세션 캐시 초기화(INFLUENCER_CACHE_KEYS)로 무효화되며, 다시 만들 때마다 버전 증가
+"""
+import time
+import streamlit as st
+import pandas as pd
+from typing import Dict, Any
+from ..db.database import db_manager
+
+SNAPSHOT_KEY = "influencer_stats_snapshot"
+SNAPSHOT_VERSION_KEY = "influencer_stats_snapshot_version"
+
+# 스냅샷 유지 시간(초) - 다른 사용자의 수정분은 이 간격으로 반영
+SNAPSHOT_TTL = 300
+
+SNAPSHOT_COLUMNS = [
+    "id", "sns_id", "influencer_name", "platform", "content_category",
+    "followers_count", "post_count", "price_krw", "manager_rating", "content_rating",
+    "active", "created_at",
+]
+NUMERIC_COLUMNS = ["followers_count", "post_count", "price_krw", "manager_rating", "content_rating"]
+
+# 플랫폼 × 카테고리 집계 컬럼 (get_influencer_group_stats RPC와 동일)
+GROUP_STAT_COLUMNS = [
+    "influencer_count", "active_count", "total_followers", "total_price", "rating_sum", "rating_count",
+]
+
+
+def get_influencer_snapshot(force: bool = False) -> Dict[str, Any]:
+    """세션 공유 인플루언서 스냅샷 조회 (없거나 만료되었거나 force=True면 새 스냅샷 생성)
+
+    인플루언서 행(frame)은 행 데이터가 필요한 섹션이 get_snapshot_frame()을 호출할 때 처음 조회하므로
+    서버 집계만 쓰는 섹션은 전체 조회 없이 group_stats만 사용합니다.
+
+    Returns:
+        {"version", "built_at", "frame": 인플루언서 DataFrame (조회 전 None), "group_stats": {source: 집계 DataFrame}}
+    """
+    snapshot = st.session_state.get(SNAPSHOT_KEY)
+    if not force and snapshot and time.time() - snapshot["built_at"] < SNAPSHOT_TTL:
+        return snapshot
+
+    version = st.session_state.get(SNAPSHOT_VERSION_KEY, 0) + 1
+    st.session_state[SNAPSHOT_VERSION_KEY] = version
+    snapshot = {"version": version, "built_at": time.time(), "frame": None, "group_stats": {}}
+    st.session_state[SNAPSHOT_KEY] = snapshot
+    return snapshot
+
+
+def get_snapshot_frame(snapshot: Dict[str, Any]) -> pd.DataFrame:
+    """스냅샷의 인플루언서 DataFrame (처음 호출할 때 필요한 컬럼만 전체 조회)"""
+    if snapshot["frame"] is not None:
+        return snapshot["frame"]
+
+    rows = db_manager.get_influencers(columns=", ".join(SNAPSHOT_COLUMNS))
+    frame = pd.DataFrame(rows, columns=SNAPSHOT_COLUMNS)
+    for column in NUMERIC_COLUMNS:
+        frame[column] = pd.to_numeric(frame[column], errors="coerce").astype(float)
+    frame["active"] = frame["active"].fillna(True).astype(bool)
+    frame["platform"] = frame["platform"].fillna("unknown")
+    frame["content_category"] = frame["content_category"].fillna("기타")
+    frame["created_at"] = pd.to_datetime(frame["created_at"], errors="coerce", utc=True)
+
+    snapshot["frame"] = frame
+    return frame
+
+
+def _local_group_stats(frame: pd.DataFrame) -> pd.DataFrame:
+    """스냅샷에서 플랫폼 × 카테고리 집계 (groupby 벡터 연산)"""
+    grouped = frame.groupby(["platform", "content_category"])
+    stats = pd.DataFrame({
+        "influencer_count": grouped.size(),
+        "active_count": grouped["active"].sum(),
+        "total_followers": grouped["followers_count"].sum(),
+        "total_price": grouped["price_krw"].sum(),
+        "rating_sum": grouped["manager_rating"].sum(),
+        "rating_count": grouped["manager_rating"].count(),
+    })
+    return stats.reset_index()
+
+
+def get_group_stats(snapshot: Dict[str, Any], use_server: bool = False) -> pd.DataFrame:
+    """플랫폼 × 카테고리별 인플루언서 수/활성 수/팔로워·가격 합계/매니저 평점 합계
+
+    use_server=True면 서버 집계 RPC 결과를 사용하고, RPC를 사용할 수 없으면 스냅샷에서 계산.
+    결과는 스냅샷 버전과 함께 캐시되어 카테고리/플랫폼 섹션이 공유
+    """
+    source = "server" if use_server else "snapshot"
+    cached = snapshot["group_stats"].get(source)
+    if cached is not None:
+        return cached
+
+    stats = None
+    if use_server:
+        rows = db_manager.get_influencer_group_stats()
+        if rows is not None:
+            stats = pd.DataFrame(rows, columns=["platform", "content_category"] + GROUP_STAT_COLUMNS)
+            for column in GROUP_STAT_COLUMNS:
+                stats[column] = pd.to_numeric(stats[column], errors="coerce").fillna(0)
+    if stats is None:
+        stats = _local_group_stats(get_snapshot_frame(snapshot))
+
+    snapshot["group_stats"][source] = stats
+    return stats
+
+
+def summarize_groups(stats: pd.DataFrame, by: str) -> pd.DataFrame:
+    """플랫폼 × 카테고리 집계를 한 축(platform 또는 content_category)으로 합산하고 평균 계산"""
+    summary = stats.groupby(by)[GROUP_STAT_COLUMNS].sum()
+    count = summary["influencer_count"]
+    summary["avg_followers"] = (summary["total_followers"] / count).where(count > 0, 0)
+    summary["avg_price"] = (summary["total_price"] / count).where(count > 0, 0)
+    summary["avg_rating"] = (summary["rating_sum"] / summary["rating_count"]).where(summary["rating_count"] > 0, 0)
+    return summary.reset_index()
+
+
+def render_snapshot_controls(key_prefix: str):
+    """새로고침 버튼 + 서버 집계 사용 여부 선택 (스냅샷 정보는 섹션 렌더링 후 render_snapshot_caption으로 표시)
+
+    Returns:
+        (카테고리/플랫폼 집계를 서버에서 계산할지 여부, 스냅샷 정보 표시 위치)
+    """
+    col1, col2, col3 = st.columns([3, 2, 1])
+    with col3:
+        if st.button("🔄 새로고침", key=f"{key_prefix}_snapshot_refresh"):
+            get_influencer_snapshot(force=True)
+    with col2:
+        use_server = st.checkbox(
+            "카테고리/플랫폼 집계 서버 계산",
+            value=False,
+            key=f"{key_prefix}_server_aggregates",
+            help="카테고리/플랫폼별 수치를 DB에서 집계합니다 (집계 RPC 미적용 시 스냅샷에서 계산)"
+        )
+    with col1:
+        caption_slot = st.empty()
+    return use_server, caption_slot
+
+
+def render_snapshot_caption(caption_slot):
+    """스냅샷 버전/생성 시각/조회 인원 표시 (행을 조회하지 않았으면 인원 생략)"""
+    snapshot = get_influencer_snapshot()
+    built_at = time.strftime("%H:%M:%S", time.localtime(snapshot["built_at"]))
+    caption = f"데이터 스냅샷 v{snapshot['version']} · {built_at} 기준"
+    if snapshot["frame"] is not None:
+        caption += f" · {len(snapshot['frame']):,}명"
+    caption_slot.caption(caption)
@@ -0,0 +1,266 @@
+"""
+콘텐츠 성과 일괄 가져오기 컴포넌트 (CSV/XLSX)
+- 파일의 content_url로 기존 콘텐츠/참여를 한 번에 매칭하고, 검증 후 일괄 저장
+"""
+import streamlit as st
+import pandas as pd
+from ..db.database import db_manager
+from .common_functions import format_campaign_type
+
+
+METRIC_COLUMNS = ["views", "likes", "comments", "shares", "clicks", "conversions"]
+
+# 업로드 파일 헤더 → 내부 컬럼명 (영문/한글 모두 허용)
+IMPORT_COLUMN_ALIASES = {
+    "content_url": "content_url", "콘텐츠 url": "content_url", "콘텐츠url": "content_url", "url": "content_url",
+    "views": "views", "조회수": "views",
+    "likes": "likes", "좋아요": "likes",
+    "comments": "comments", "댓글": "comments",
+    "shares": "shares", "공유": "shares",
+    "clicks": "clicks", "클릭": "clicks",
+    "conversions": "conversions", "전환": "conversions",
+    "posted_at": "posted_at", "업로드일": "posted_at", "게시일": "posted_at",
+    "sns_id": "sns_id", "sns id": "sns_id",
+}
+
+ACTION_LABELS = {"update": "업데이트", "insert": "신규 생성", "unmatched": "매칭 실패"}
+
+
+def _url_key(url):
+    """URL 매칭 키 (앞뒤 공백, 끝 슬래시 무시)"""
+    return str(url).strip().rstrip("/")
+
+
+def read_import_file(uploaded_file):
+    """업로드된 CSV/XLSX 파일을 DataFrame으로 읽기"""
+    if uploaded_file.name.lower().endswith((".xlsx", ".xls")):
+        return pd.read_excel(uploaded_file, dtype=object)
+    return pd.read_csv(uploaded_file, dtype=object, encoding="utf-8-sig")
+
+
+def normalize_import_frame(raw_df):
+    """헤더 정규화 + 한 번의 벡터 연산으로 행 검증
+
+    Returns:
+        (유효 행 DataFrame, 오류 행 DataFrame(사유 포함), 파일 내 중복 URL 수)
+    """
+    df = raw_df.rename(columns=lambda c: IMPORT_COLUMN_ALIASES.get(str(c).strip().lower(), str(c).strip()))
+    if "content_url" not in df.columns:
+        raise ValueError("content_url(콘텐츠 URL) 컬럼이 필요합니다.")
+
+    df = df[[c for c in df.columns if c in set(IMPORT_COLUMN_ALIASES.values())]].copy()
+    df["row_number"] = range(2, len(df) + 2)  # 엑셀 기준 행 번호 (헤더 다음 행부터)
+    df["content_url"] = df["content_url"].fillna("").astype(str).str.strip()
+
+    errors = pd.Series("", index=df.index)
+    errors = errors.mask(df["content_url"] == "", "URL 없음")
+    errors = errors.mask((errors == "") & ~df["content_url"].str.match(r"^https?://"), "URL 형식 오류")
+
+    metrics = [c for c in METRIC_COLUMNS if c in df.columns]
+    for metric in metrics:
+        raw = df[metric]
+        values = pd.to_numeric(raw, errors="coerce")
+        bad = (raw.notna() & values.isna()) | (values < 0)
+        errors = errors.mask((errors == "") & bad, f"{metric} 값 오류")
+        df[metric] = values
+
+    if "posted_at" in df.columns:
+        parsed = pd.to_datetime(df["posted_at"], errors="coerce", utc=True)
+        errors = errors.mask((errors == "") & df["posted_at"].notna() & parsed.isna(), "업로드일 형식 오류")
+        df["posted_at"] = parsed
+
+    invalid = df[errors != ""].assign(error=errors[errors != ""])
+    valid = df[errors == ""].copy()
+    valid["url_key"] = valid["content_url"].map(_url_key)
+
+    # 같은 URL이 여러 번 있으면 마지막 행 사용
+    duplicate_count = int(valid["url_key"].duplicated(keep="last").sum())
+    valid = valid.drop_duplicates("url_key", keep="last")
+    return valid, invalid, duplicate_count
+
+
+def match_import_rows(valid_df, campaign_id=None):
+    """content_url 기준으로 기존 콘텐츠/참여와 일괄 매칭
+
+    1) 기존 콘텐츠 URL 일치 → 업데이트
+    2) 참여의 content_links에 URL 등록 → 해당 참여에 신규 생성
+    3) 선택한 캠페인 + sns_id 일치 → 해당 참여에 신규 생성
+    나머지는 매칭 실패로 보고합니다.
+    """
+    matched = valid_df.copy()
+    matched["action"] = "unmatched"
+    matched["content_id"] = None
+    matched["participation_id"] = None
+    if matched.empty:
+        return matched
+
+    # URL 끝 슬래시 유무가 다르게 저장된 경우도 매칭되도록 두 형태 모두 조회
+    keys = matched["url_key"].tolist()
+    lookup_urls = list(dict.fromkeys(keys + [k + "/" for k in keys]))
+
+    existing = {}
+    for content in db_manager.get_contents_by_urls(lookup_urls):
+        existing.setdefault(_url_key(content.get("content_url", "")), content)
+    matched["existing"] = matched["url_key"].map(existing)
+    has_content = matched["existing"].notna()
+    matched.loc[has_content, "action"] = "update"
+    matched.loc[has_content, "content_id"] = matched.loc[has_content, "existing"].map(lambda c: c["id"])
+    matched.loc[has_content, "participation_id"] = matched.loc[has_content, "existing"].map(lambda c: c["participation_id"])
+
+    remaining = matched["action"] == "unmatched"
+    if remaining.any():
+        link_owner = {}
+        remaining_keys = matched.loc[remaining, "url_key"].tolist()
+        for participation in db_manager.get_participations_by_content_links(
+            list(dict.fromkeys(remaining_keys + [k + "/" for k in remaining_keys]))
+        ):
+            for link in participation.get("content_links") or []:
+                link_owner.setdefault(_url_key(link), participation["id"])
+        owners = matched.loc[remaining, "url_key"].map(link_owner)
+        found = owners.dropna().index
+        matched.loc[found, "participation_id"] = owners[found]
+        matched.loc[found, "action"] = "insert"
+
+    remaining = matched["action"] == "unmatched"
+    if remaining.any() and campaign_id and "sns_id" in matched.columns:
+        by_sns_id = {
+            str(p.get("sns_id", "")).strip().lstrip("@").lower(): p["id"]
+            for p in db_manager.get_participations_by_campaign_ids([campaign_id])
+        }
+        owners = matched.loc[remaining, "sns_id"].fillna("").astype(str).str.strip().str.lstrip("@").str.lower().map(by_sns_id)
+        found = owners.dropna().index
+        matched.loc[found, "participation_id"] = owners[found]
+        matched.loc[found, "action"] = "insert"
+
+    return matched
+
+
+def build_import_payloads(matched_df):
+    """매칭 결과 → 일괄 저장용 콘텐츠 행 목록
+
+    파일에 없는 지표 컬럼은 기존 값(업데이트) 또는 0(신규)을 사용합니다.
+    """
+    metrics = [c for c in METRIC_COLUMNS if c in matched_df.columns]
+    payloads = []
+    for row in matched_df[matched_df["action"] != "unmatched"].itertuples(index=False):
+        row = row._asdict()
+        existing = row.get("existing") if isinstance(row.get("existing"), dict) else {}
+        payload = {
+            "participation_id": row["participation_id"],
+            "content_url": existing.get("content_url") or row["content_url"],
+        }
+        for metric in METRIC_COLUMNS:
+            value = row.get(metric) if metric in metrics else None
+            payload[metric] = int(value) if value is not None and pd.notna(value) else int(existing.get(metric, 0) or 0)
+        posted_at = row.get("posted_at")
+        payload["posted_at"] = posted_at.isoformat() if posted_at is not None and pd.notna(posted_at) else existing.get("posted_at")
+        if row["action"] == "update":
+            payload["id"] = row["content_id"]
+        payloads.append(payload)
+    return payloads
+
+
+def render_performance_import_tab():
+    """콘텐츠 성과 일괄 가져오기 탭"""
+    st.markdown("#### 📥 콘텐츠 성과 일괄 가져오기")
+    st.caption(
+        "content_url과 조회수/좋아요/댓글/공유/클릭/전환, 업로드일 컬럼이 있는 CSV 또는 XLSX 파일을 업로드하세요. "
+        "기존 콘텐츠는 URL로 매칭하여 업데이트하고, 새 URL은 참여의 콘텐츠 링크 또는 선택한 캠페인의 sns_id로 매칭합니다."
+    )
+
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        uploaded_file = st.file_uploader("성과 파일", type=["csv", "xlsx"], key="performance_import_file")
+    with col2:
+        campaigns = db_manager.get_campaigns()
+        campaign_options = {"선택 안 함": None}
+        campaign_options.update({
+            f"{c['campaign_name']} ({format_campaign_type(c['campaign_type'])})": c["id"] for c in campaigns
+        })
+        campaign_label = st.selectbox(
+            "신규 URL 매칭 캠페인",
+            list(campaign_options.keys()),
+            key="performance_import_campaign",
+            help="파일에 sns_id 컬럼이 있으면 이 캠페인의 참여자와 매칭하여 새 콘텐츠로 등록합니다",
+        )
+
+    if not uploaded_file:
+        return
+
+    # 미리보기 (dry-run): 실제 저장 없이 매칭/검증 결과만 계산
+    if st.button("🔍 미리보기", key="performance_import_preview"):
+        try:
+            valid, invalid, duplicate_count = normalize_import_frame(read_import_file(uploaded_file))
+            matched = match_import_rows(valid, campaign_options[campaign_label])
+            st.session_state.performance_import_preview = {
+                "file_name": uploaded_file.name,
+                "matched": matched,
+                "invalid": invalid,
+                "duplicate_count": duplicate_count,
+            }
+        except Exception as e:
+            st.error(f"❌ 파일 처리 중 오류가 발생했습니다: {str(e)}")
+            return
+
+    preview = st.session_state.get("performance_import_preview")
+    if not preview or preview["file_name"] != uploaded_file.name:
+        return
+
+    matched = preview["matched"]
+    invalid = preview["invalid"]
+    counts = matched["action"].value_counts() if not matched.empty else pd.Series(dtype=int)
+
+    m1, m2, m3, m4 = st.columns(4)
+    with m1:
+        st.metric("업데이트", f"{int(counts.get('update', 0))}건")
+    with m2:
+        st.metric("신규 생성", f"{int(counts.get('insert', 0))}건")
+    with m3:
+        st.metric("매칭 실패", f"{int(counts.get('unmatched', 0))}건")
+    with m4:
+        st.metric("검증 오류", f"{len(invalid)}건")
+    if preview["duplicate_count"]:
+        st.caption(f"파일 내 중복 URL {preview['duplicate_count']}건은 마지막 행만 사용합니다.")
+
+    if not matched.empty:
+        display_columns = ["row_number", "content_url", "action"] + [c for c in METRIC_COLUMNS if c in matched.columns]
+        display_df = matched[display_columns].copy()
+        display_df["action"] = display_df["action"].map(ACTION_LABELS)
+        display_df = display_df.rename(columns={"row_number": "행", "content_url": "콘텐츠 URL", "action": "처리"})
+        st.dataframe(display_df, width='stretch', hide_index=True)
+
+    unmatched = matched[matched["action"] == "unmatched"] if not matched.empty else matched
+    if not unmatched.empty:
+        with st.expander(f"⚠️ 매칭되지 않은 URL ({len(unmatched)}건)", expanded=False):
+            st.dataframe(
+                unmatched[["row_number", "content_url"]].rename(columns={"row_number": "행", "content_url": "콘텐츠 URL"}),
+                width='stretch', hide_index=True
+            )
+    if not invalid.empty:
+        with st.expander(f"❌ 검증 오류 ({len(invalid)}건)", expanded=False):
+            st.dataframe(
+                invalid[["row_number", "content_url", "error"]].rename(
+                    columns={"row_number": "행", "content_url": "콘텐츠 URL", "error": "오류"}
+                ),
+                width='stretch', hide_index=True
+            )
+
+    payloads = build_import_payloads(matched) if not matched.empty else []
+    if not payloads:
+        st.info("저장할 데이터가 없습니다.")
+        return
+
+    if st.button(f"💾 {len(payloads)}건 저장", type="primary", key="performance_import_apply"):
+        result = db_manager.bulk_save_campaign_influencer_contents(payloads)
+        if result.get("saved"):
+            st.success(f"✅ {result['saved']}건의 콘텐츠 성과가 저장되었습니다.")
+        failed = [
+            (payload["content_url"], (r or {}).get("message", ""))
+            for payload, r in zip(payloads, result.get("results") or [])
+            if not (r and r.get("success"))
+        ]
+        if failed or not result.get("results"):
+            st.error(f"❌ {len(failed) or len(payloads)}건 저장에 실패했습니다. {result.get('message', '')}")
+            if failed:
+                st.dataframe(pd.DataFrame(failed, columns=["콘텐츠 URL", "오류"]), width='stretch', hide_index=True)
+        st.session_state.pop("performance_import_preview", None)
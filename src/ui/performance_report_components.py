@@ -8,26 +8,21 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from datetime import datetime, timedelta
 import io
-from ..db.database import db_manager
+import time
+from openpyxl import Workbook
+from ..db.database import db_manager, participations_cache, contents_cache
+from ..utils.entity_cache import group_by
 from .common_functions import format_campaign_type, get_date_range_options, calculate_date_range
 
 
-@st.cache_data(ttl=300)
 def _fetch_participations_by_campaign(campaign_ids):
-    """선택된 캠페인들의 참여 데이터를 한 번에 가져와 캐시합니다."""
-    result = {}
-    for cid in campaign_ids:
-        result[cid] = db_manager.get_all_campaign_participations(cid)
-    return result
+    """선택된 캠페인들의 참여 데이터 (캐시에 없는 캠페인만 일괄 조회)"""
+    return participations_cache.get_many(campaign_ids)
 
 
-@st.cache_data(ttl=300)
 def _fetch_contents_by_participation(participation_ids):
-    """선택된 참여 ID들의 콘텐츠를 한 번에 가져와 캐시합니다."""
-    result = {}
-    for pid in participation_ids:
-        result[pid] = db_manager.get_campaign_influencer_contents(pid)
-    return result
+    """선택된 참여 ID들의 콘텐츠 (캐시에 없는 참여만 일괄 조회)"""
+    return contents_cache.get_many(participation_ids)
 
 
 def _prefetch_selected_data(campaigns):
@@ -39,6 +34,339 @@ def _prefetch_selected_data(campaigns):
     return participations_by_campaign, contents_by_participation
 
 
+METRIC_COLUMNS = ["likes", "comments", "shares", "views", "clicks", "conversions"]
+
+# 팩트 테이블 컬럼 → 화면 표시용 한글 컬럼명
+REPORT_COLUMN_LABELS = {
+    "likes": "좋아요",
+    "comments": "댓글",
+    "shares": "공유",
+    "views": "조회수",
+    "clicks": "클릭",
+    "conversions": "전환",
+    "engagement_rate": "참여율",
+}
+
+FACT_COLUMNS = [
+    "campaign_id", "campaign_name", "campaign_type",
+    "participation_id", "influencer_id", "influencer_name", "platform", "followers_count",
+    "content_uploaded", "cost_krw",
+    "content_id", "content_url", "posted_at",
+] + METRIC_COLUMNS
+
+
+def build_report_fact_table(campaign_data, participations_by_campaign, contents_by_participation):
+    """캠페인 × 참여 × 콘텐츠를 콘텐츠 1건당 1행의 타입 지정 DataFrame으로 평면화합니다.
+
+    콘텐츠가 없는 참여는 content_id가 비어 있고 지표가 0인 1행으로 포함됩니다.
+    참여 단위 값(cost_krw, content_uploaded 등)은 콘텐츠 행마다 반복되므로
+    참여 기준 집계는 participation_frame()을 사용합니다.
+    """
+    participation_rows = []
+    for campaign in campaign_data:
+        for participation in participations_by_campaign.get(campaign["id"], []):
+            participation_rows.append({
+                "campaign_id": campaign["id"],
+                "campaign_name": campaign["campaign_name"],
+                "campaign_type": campaign.get("campaign_type"),
+                "participation_id": participation["id"],
+                "influencer_id": participation.get("influencer_id"),
+                "influencer_name": participation.get("influencer_name"),
+                "platform": participation.get("platform"),
+                "followers_count": participation.get("followers_count"),
+                "content_uploaded": participation.get("content_uploaded"),
+                "cost_krw": participation.get("cost_krw"),
+            })
+
+    content_rows = [
+        {
+            "participation_id": pid,
+            "content_id": content.get("id"),
+            "content_url": content.get("content_url"),
+            "posted_at": content.get("posted_at"),
+            **{m: content.get(m) for m in METRIC_COLUMNS},
+        }
+        for pid, contents in contents_by_participation.items()
+        for content in contents
+    ]
+
+    participations_df = pd.DataFrame(participation_rows, columns=FACT_COLUMNS[:10])
+    contents_df = pd.DataFrame(
+        content_rows, columns=["participation_id", "content_id", "content_url", "posted_at"] + METRIC_COLUMNS
+    )
+    facts = participations_df.merge(contents_df, on="participation_id", how="left")[FACT_COLUMNS]
+
+    # 타입 정리 (결측값은 기존 화면과 동일하게 "N/A" / 0으로 처리)
+    facts["influencer_name"] = facts["influencer_name"].fillna("N/A")
+    facts["platform"] = facts["platform"].fillna("N/A")
+    facts["followers_count"] = pd.to_numeric(facts["followers_count"], errors="coerce").fillna(0).astype("int64")
+    facts["content_uploaded"] = facts["content_uploaded"].astype("boolean").fillna(False).astype(bool)
+    facts["cost_krw"] = pd.to_numeric(facts["cost_krw"], errors="coerce").fillna(0.0).astype("float64")
+    for metric in METRIC_COLUMNS:
+        facts[metric] = pd.to_numeric(facts[metric], errors="coerce").fillna(0).astype("int64")
+    facts["posted_at"] = pd.to_datetime(facts["posted_at"], errors="coerce", utc=True).dt.tz_localize(None)
+    facts["has_content"] = facts["content_id"].notna()
+    return facts
+
+
+def participation_frame(facts):
+    """팩트 테이블에서 참여 1건당 1행만 남긴 DataFrame"""
+    return facts.drop_duplicates("participation_id")
+
+
+def content_frame(facts):
+    """팩트 테이블에서 실제 콘텐츠 행만 남긴 DataFrame"""
+    return facts[facts["has_content"]]
+
+
+def add_engagement_rate(df):
+    """(좋아요 + 댓글) / 조회수 × 100 참여율 컬럼을 벡터 연산으로 추가"""
+    interactions = df["likes"] + df["comments"]
+    views = df["views"].where(df["views"] > 0)
+    df["engagement_rate"] = (interactions / views * 100).round(2).fillna(0.0)
+    return df
+
+
+def _format_ratio(numerator, denominator):
+    """완료율 등 비율 Series를 "12.3%" 문자열로 변환 (분모 0이면 "0%")"""
+    ratio = (numerator / denominator.where(denominator > 0) * 100).map(lambda x: f"{x:.1f}%")
+    return ratio.where(denominator > 0, "0%")
+
+
+def _summarize_metrics(df, by):
+    """지표 합계 + 합계 기반 참여율((좋아요 + 댓글) / 조회수 × 100) 집계"""
+    summary = df.groupby(by)[["likes", "comments", "views"]].sum()
+    return add_engagement_rate(summary)
+
+
+def _campaign_cache_key(campaign_data):
+    """선택된 캠페인 집합의 캐시 키 (선택 순서와 무관)"""
+    return tuple(sorted((c["id"], c["campaign_name"], c.get("campaign_type")) for c in campaign_data))
+
+
+# 리포트 스냅샷 자동 증분 새로고침 주기(초)
+REPORT_REFRESH_TTL = 300
+
+PARTICIPATIONS_TABLE = "campaign_influencer_participations"
+CONTENTS_TABLE = "campaign_influencer_contents"
+
+
+def _max_updated_at(rows):
+    """행 목록의 최대 updated_at (없으면 None)"""
+    values = pd.to_datetime(
+        pd.Series([row.get("updated_at") for row in rows], dtype="object"), errors="coerce", utc=True
+    ).dropna()
+    return values.max() if not values.empty else None
+
+
+def _report_watermarks(participations_by_campaign, contents_by_participation):
+    """테이블별 증분 조회 기준 시각 (선택 캠페인 전체에서 가장 최근 updated_at)
+
+    캠페인별 최솟값을 쓰면 오래 수정되지 않은 캠페인 하나 때문에
+    매 새로고침마다 이미 반영된 행을 다시 받게 되므로 전역 최댓값 하나만 유지합니다.
+    """
+    participations = [p for plist in participations_by_campaign.values() for p in plist]
+    contents = [c for clist in contents_by_participation.values() for c in clist]
+    watermarks = {}
+    for table, rows in ((PARTICIPATIONS_TABLE, participations), (CONTENTS_TABLE, contents)):
+        latest = _max_updated_at(rows)
+        watermarks[table] = latest.isoformat() if latest is not None else None
+    return watermarks
+
+
+def _advance_watermark(current, rows):
+    """증분 조회 결과로 워터마크 전진 (뒤로 가지 않음)"""
+    latest = _max_updated_at(rows)
+    if latest is None:
+        return current
+    if current is None or latest > pd.Timestamp(current):
+        return latest.isoformat()
+    return current
+
+
+def _merge_by_id(rows, changed_rows):
+    """id 기준으로 변경 행을 기존 목록에 덮어쓰기/추가"""
+    merged = {row["id"]: row for row in rows}
+    for row in changed_rows:
+        merged[row["id"]] = row
+    return list(merged.values())
+
+
+def _build_report_snapshot(campaign_data):
+    """선택 캠페인 집합의 팩트 테이블과 테이블별 워터마크 생성"""
+    campaigns = [
+        {"id": cid, "campaign_name": name, "campaign_type": ctype}
+        for cid, name, ctype in _campaign_cache_key(campaign_data)
+    ]
+    participations_by_campaign, contents_by_participation = _prefetch_selected_data(campaigns)
+    return {
+        "key": _campaign_cache_key(campaign_data),
+        "campaigns": campaigns,
+        "facts": build_report_fact_table(campaigns, participations_by_campaign, contents_by_participation),
+        "watermarks": _report_watermarks(participations_by_campaign, contents_by_participation),
+        "refreshed_at": time.time(),
+    }
+
+
+def _snapshot_participations(facts, participation_ids):
+    """스냅샷 팩트 테이블에서 참여 행을 원래 행 형태로 복원 (참여 ID → 행)"""
+    rows = participation_frame(facts[facts["participation_id"].isin(participation_ids)])
+    return {
+        row["participation_id"]: {
+            "id": row["participation_id"],
+            "campaign_id": row["campaign_id"],
+            "influencer_id": row["influencer_id"],
+            "influencer_name": row["influencer_name"],
+            "platform": row["platform"],
+            "followers_count": row["followers_count"],
+            "content_uploaded": row["content_uploaded"],
+            "cost_krw": row["cost_krw"],
+        }
+        for row in rows.to_dict("records")
+    }
+
+
+def _snapshot_contents(facts, participation_ids):
+    """스냅샷 팩트 테이블에서 콘텐츠 행을 원래 행 형태로 복원"""
+    rows = content_frame(facts[facts["participation_id"].isin(participation_ids)])
+    return [
+        {
+            "id": row["content_id"],
+            "participation_id": row["participation_id"],
+            "content_url": row["content_url"],
+            "posted_at": row["posted_at"],
+            **{m: row[m] for m in METRIC_COLUMNS},
+        }
+        for row in rows.to_dict("records")
+    ]
+
+
+def refresh_report_snapshot(snapshot):
+    """워터마크 이후 변경된 참여/콘텐츠만 조회하여 스냅샷에 병합합니다.
+
+    변경된 행이 속한 참여만 기존 팩트 행 + 변경분으로 다시 만들어 교체하므로
+    새로고침 조회량은 전체 데이터 크기가 아니라 수정 건수에 비례합니다.
+    (ID 단위 캐시는 새로고침 주기와 같은 TTL로 만료되므로 사용하지 않고, 변경된 항목만 무효화)
+    삭제된 행은 워터마크로 감지되지 않으므로 전체 다시 불러오기로 반영합니다.
+    """
+    campaigns = snapshot["campaigns"]
+    campaign_ids = [c["id"] for c in campaigns]
+    watermarks = snapshot["watermarks"]
+
+    changed_participations = db_manager.get_participations_by_campaign_ids(
+        campaign_ids, updated_since=watermarks[PARTICIPATIONS_TABLE]
+    )
+    changed_contents = db_manager.get_contents_by_campaign_ids(
+        campaign_ids, updated_since=watermarks[CONTENTS_TABLE]
+    )
+
+    affected_ids = {p["id"] for p in changed_participations} | {c["participation_id"] for c in changed_contents}
+    if affected_ids:
+        facts = snapshot["facts"]
+
+        # 기존 팩트 행에 변경분을 id 기준으로 덮어써서 영향받은 참여/콘텐츠 복원
+        participations = _snapshot_participations(facts, affected_ids)
+        for participation in changed_participations:
+            participations[participation["id"]] = participation
+        contents = _merge_by_id(_snapshot_contents(facts, affected_ids), changed_contents)
+
+        rebuilt = build_report_fact_table(
+            campaigns,
+            group_by(participations.values(), "campaign_id"),
+            group_by(contents, "participation_id"),
+        )
+        snapshot["facts"] = pd.concat(
+            [facts[~facts["participation_id"].isin(affected_ids)], rebuilt], ignore_index=True
+        )
+
+        # 다음 선택 변경 시 오래된 캐시 항목이 쓰이지 않도록 변경된 항목만 무효화
+        participations_cache.invalidate({p["campaign_id"] for p in participations.values()})
+        contents_cache.invalidate(affected_ids)
+
+    snapshot["watermarks"] = {
+        PARTICIPATIONS_TABLE: _advance_watermark(watermarks[PARTICIPATIONS_TABLE], changed_participations),
+        CONTENTS_TABLE: _advance_watermark(watermarks[CONTENTS_TABLE], changed_contents),
+    }
+    snapshot["refreshed_at"] = time.time()
+    snapshot["changed_rows"] = len(changed_participations) + len(changed_contents)
+    return snapshot
+
+
+def get_report_fact_table(campaign_data, force_refresh=False):
+    """리포트 팩트 테이블 조회
+
+    선택 캠페인 집합별 스냅샷을 세션에 유지하고, 새로고침 요청 또는
+    REPORT_REFRESH_TTL 경과 시 워터마크 기반 증분 새로고침만 수행합니다.
+    """
+    key = _campaign_cache_key(campaign_data)
+    snapshot = st.session_state.get("report_fact_snapshot")
+    if not snapshot or snapshot["key"] != key:
+        snapshot = _build_report_snapshot(campaign_data)
+    elif force_refresh or time.time() - snapshot["refreshed_at"] >= REPORT_REFRESH_TTL:
+        snapshot = refresh_report_snapshot(snapshot)
+    st.session_state.report_fact_snapshot = snapshot
+    return snapshot["facts"]
+
+
+def reload_report_data(campaign_data):
+    """선택 캠페인의 캐시를 비우고 전체 다시 불러오기 (삭제 반영용)"""
+    participations_cache.invalidate([c["id"] for c in campaign_data])
+    snapshot = st.session_state.pop("report_fact_snapshot", None)
+    if snapshot:
+        contents_cache.invalidate(snapshot["facts"]["participation_id"].unique().tolist())
+
+
+ROLLUP_COLUMNS = [
+    "campaign_id", "platform", "participants", "uploaded", "content_count",
+] + METRIC_COLUMNS + ["cost_krw"]
+
+
+def rollup_frame_from_facts(facts):
+    """팩트 테이블로 캠페인 × 플랫폼 롤업 계산 (DB 롤업 테이블이 없을 때의 대체 경로)"""
+    participations = participation_frame(facts).groupby(["campaign_id", "platform"]).agg(
+        participants=("participation_id", "size"),
+        uploaded=("content_uploaded", "sum"),
+        cost_krw=("cost_krw", "sum"),
+    )
+    contents = content_frame(facts).groupby(["campaign_id", "platform"]).agg(
+        content_count=("content_id", "size"),
+        **{metric: (metric, "sum") for metric in METRIC_COLUMNS},
+    )
+    rollups = participations.join(contents).fillna(0).reset_index()
+    return rollups[ROLLUP_COLUMNS]
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_campaign_rollups(campaign_ids):
+    """DB 롤업 테이블 조회 (캠페인 ID 집합별 캐시, 트리거로 최신 상태 유지)"""
+    rows = db_manager.get_campaign_performance_rollups(list(campaign_ids))
+    return pd.DataFrame(rows, columns=ROLLUP_COLUMNS)
+
+
+def get_campaign_rollups(campaign_data):
+    """선택 캠페인의 캠페인 × 플랫폼 롤업 DataFrame
+
+    campaign_performance_rollups 테이블을 우선 사용하고, 롤업 행이 없으면
+    (마이그레이션 미적용 등) 팩트 테이블에서 같은 형태로 계산합니다.
+    """
+    rollups = _load_campaign_rollups(tuple(sorted(c["id"] for c in campaign_data)))
+    if rollups.empty:
+        rollups = rollup_frame_from_facts(get_report_fact_table(campaign_data))
+    rollups = rollups.copy()
+    rollups["platform"] = rollups["platform"].fillna("N/A")
+    numeric = ROLLUP_COLUMNS[2:]
+    rollups[numeric] = rollups[numeric].apply(pd.to_numeric, errors="coerce").fillna(0)
+    return rollups
+
+
+def _campaign_order(campaign_data):
+    """선택 순서를 유지한 캠페인 ID/이름/유형 DataFrame"""
+    return pd.DataFrame(
+        [(c["id"], c["campaign_name"], c.get("campaign_type")) for c in campaign_data],
+        columns=["campaign_id", "campaign_name", "campaign_type"],
+    )
+
+
 def render_performance_report_tab():
     """리포트 탭 - 종합적인 성과 분석 및 리포트 생성"""
     st.subheader("📋 성과 리포트")
@@ -77,6 +405,7 @@ def render_performance_report_tab():
     col_date1, col_date2 = st.columns(2)
     with col_date1:
         date_range_option = st.selectbox("날짜 범위", list(get_date_range_options().keys()), key="report_date_range")
+    start_date, end_date = None, None
     with col_date2:
         if date_range_option != "전체":
             start_date, end_date = calculate_date_range(get_date_range_options()[date_range_option])
@@ -95,50 +424,80 @@ def render_performance_report_tab():
                 campaign_data.append(campaign)
                 break
 
-    # 프리페치: 선택된 캠페인의 참여/콘텐츠를 캐시 기반으로 일괄 수집
-    participations_by_campaign, contents_by_participation = _prefetch_selected_data(campaign_data)
+    # 새로고침: 기본은 변경분만 병합, 삭제까지 반영하려면 전체 다시 불러오기
+    col_refresh, col_reload, col_caption = st.columns([1, 1, 3])
+    with col_refresh:
+        force_refresh = st.button("🔄 새로고침", key="report_refresh", help="마지막 조회 이후 변경된 데이터만 불러옵니다")
+    with col_reload:
+        if st.button("♻️ 전체 다시 불러오기", key="report_reload", help="선택한 캠페인 데이터를 처음부터 다시 불러옵니다"):
+            reload_report_data(campaign_data)
 
-    # 리포트 타입별 렌더링
+    # 종합 대시보드는 캠페인 × 플랫폼 롤업만으로 렌더링 (원본 행 조회 없음)
     if report_type == "📊 종합 대시보드":
-        render_comprehensive_dashboard(campaign_data, participations_by_campaign)
-    elif report_type == "📈 성과 지표 분석":
-        render_performance_metrics_analysis(campaign_data, participations_by_campaign, contents_by_participation)
+        if force_refresh:
+            _load_campaign_rollups.clear()
+        try:
+            rollups = get_campaign_rollups(campaign_data)
+        except Exception as e:
+            st.error(f"❌ 리포트 데이터 조회 중 오류가 발생했습니다: {str(e)}")
+            return
+        render_comprehensive_dashboard(campaign_data, rollups)
+        render_export_section(campaign_data, report_type)
+        return
+
+    # 트렌드는 선택 기간의 기간 버킷 롤업만 조회
+    if report_type == "📅 날짜별 트렌드":
+        if force_refresh:
+            _load_trend_rollups.clear()
+        render_trend_analysis(campaign_data, start_date, end_date)
+        render_export_section(campaign_data, report_type)
+        return
+
+    # 프리페치: 선택된 캠페인의 참여/콘텐츠를 하나의 팩트 테이블로 평면화 (선택 집합별 스냅샷)
+    try:
+        facts = get_report_fact_table(campaign_data, force_refresh=force_refresh)
+    except Exception as e:
+        st.error(f"❌ 리포트 데이터 조회 중 오류가 발생했습니다: {str(e)}")
+        return
+
+    with col_caption:
+        if force_refresh:
+            changed_rows = st.session_state.report_fact_snapshot.get("changed_rows", 0)
+            st.caption(f"변경된 데이터 {changed_rows}건을 반영했습니다.")
+
+    # 리포트 타입별 렌더링
+    if report_type == "📈 성과 지표 분석":
+        render_performance_metrics_analysis(campaign_data, facts)
     elif report_type == "👥 인플루언서별 분석":
-        render_influencer_analysis(campaign_data, participations_by_campaign, contents_by_participation)
-    elif report_type == "📅 날짜별 트렌드":
-        render_trend_analysis(campaign_data, participations_by_campaign, contents_by_participation)
+        render_influencer_analysis(campaign_data, facts)
     elif report_type == "💰 ROI 분석":
-        render_roi_analysis(campaign_data, participations_by_campaign, contents_by_participation)
+        render_roi_analysis(campaign_data, facts)
 
     # 리포트 내보내기 기능
     render_export_section(campaign_data, report_type)
 
 
-def render_comprehensive_dashboard(campaign_data, participations_by_campaign):
-    """종합 대시보드 렌더링"""
+def render_comprehensive_dashboard(campaign_data, rollups):
+    """종합 대시보드 렌더링 (캠페인 × 플랫폼 롤업 기반)"""
     st.markdown("#### 📊 종합 대시보드")
     
     # 기본 참여 통계
-    participation_counts = []
     try:
-        for campaign in campaign_data:
-            participations = participations_by_campaign.get(campaign["id"], [])
-            completed = len([p for p in participations if p.get("content_uploaded", False)])
-            participation_counts.append(
-                {
-                    "캠페인": campaign["campaign_name"],
-                    "유형": format_campaign_type(campaign["campaign_type"]),
-                    "참여 인플루언서 수": len(participations),
-                    "업로드 완료": completed,
-                    "완료율": f"{(completed / len(participations) * 100):.1f}%" if participations else "0%",
-                }
-            )
+        per_campaign = rollups.groupby("campaign_id")[["participants", "uploaded"]].sum()
+        per_campaign = _campaign_order(campaign_data).join(per_campaign, on="campaign_id")
+        per_campaign[["participants", "uploaded"]] = per_campaign[["participants", "uploaded"]].fillna(0).astype(int)
+        df_participations = pd.DataFrame({
+            "캠페인": per_campaign["campaign_name"],
+            "유형": per_campaign["campaign_type"].map(format_campaign_type),
+            "참여 인플루언서 수": per_campaign["participants"],
+            "업로드 완료": per_campaign["uploaded"],
+            "완료율": _format_ratio(per_campaign["uploaded"], per_campaign["participants"]),
+        })
     except Exception as e:
         st.error(f"❌ 참여 인플루언서 데이터 조회 중 오류가 발생했습니다: {str(e)}")
         return
 
-    if participation_counts:
-        df_participations = pd.DataFrame(participation_counts)
+    if not df_participations.empty:
         st.dataframe(df_participations, width='stretch', hide_index=True)
 
         colc1, colc2 = st.columns(2)
@@ -155,33 +514,19 @@ def render_comprehensive_dashboard(campaign_data, participations_by_campaign):
 
     # 플랫폼별 분석
     st.markdown("#### 📱 플랫폼별 분석")
-    platform_data = {}
     try:
-        for campaign in campaign_data:
-            participations = participations_by_campaign.get(campaign["id"], [])
-            for participation in participations:
-                platform = participation.get("platform", "N/A")
-                if platform not in platform_data:
-                    platform_data[platform] = {"참여 수": 0, "업로드 완료": 0}
-                platform_data[platform]["참여 수"] += 1
-                if participation.get("content_uploaded", False):
-                    platform_data[platform]["업로드 완료"] += 1
+        per_platform = rollups.groupby("platform", sort=False)[["participants", "uploaded"]].sum().reset_index()
     except Exception as e:
         st.error(f"❌ 플랫폼별 데이터 조회 중 오류가 발생했습니다: {str(e)}")
         return
 
-    if platform_data:
-        platform_df = pd.DataFrame(
-            [
-                {
-                    "플랫폼": platform,
-                    "참여 수": data["참여 수"],
-                    "업로드 완료": data["업로드 완료"],
-                    "완료율": f"{(data['업로드 완료'] / data['참여 수'] * 100):.1f}%" if data["참여 수"] > 0 else "0%",
-                }
-                for platform, data in platform_data.items()
-            ]
-        )
+    if not per_platform.empty:
+        platform_df = pd.DataFrame({
+            "플랫폼": per_platform["platform"],
+            "참여 수": per_platform["participants"].astype(int),
+            "업로드 완료": per_platform["uploaded"].astype(int),
+            "완료율": _format_ratio(per_platform["uploaded"], per_platform["participants"]),
+        })
         st.dataframe(platform_df, width='stretch', hide_index=True)
 
         colp1, colp2 = st.columns(2)
@@ -196,15 +541,9 @@ def render_comprehensive_dashboard(campaign_data, participations_by_campaign):
 
     # 요약 통계
     st.markdown("#### 📈 요약 통계")
-    try:
-        total_participations = sum(len(participations_by_campaign.get(c["id"], [])) for c in campaign_data)
-        total_completed = sum(
-            len([p for p in participations_by_campaign.get(c["id"], []) if p.get("content_uploaded", False)])
-            for c in campaign_data
-        )
-    except Exception as e:
-        st.error(f"❌ 요약 통계 계산 중 오류가 발생했습니다: {str(e)}")
-        return
+    totals = rollups[ROLLUP_COLUMNS[2:]].sum()
+    total_participations = int(totals["participants"])
+    total_completed = int(totals["uploaded"])
 
     s1, s2, s3, s4 = st.columns(4)
     with s1:
@@ -219,49 +558,33 @@ def render_comprehensive_dashboard(campaign_data, participations_by_campaign):
     with s4:
         st.metric("분석 캠페인 수", f"{len(campaign_data)}개")
 
+    m1, m2, m3, m4 = st.columns(4)
+    with m1:
+        st.metric("총 좋아요", f"{int(totals['likes']):,}")
+    with m2:
+        st.metric("총 조회수", f"{int(totals['views']):,}")
+    with m3:
+        st.metric("총 비용", f"{totals['cost_krw']:,.0f}원")
+    with m4:
+        engagement = (totals["likes"] + totals["comments"]) / totals["views"] * 100 if totals["views"] > 0 else 0
+        st.metric("평균 참여율", f"{engagement:.2f}%")
 
-def render_performance_metrics_analysis(campaign_data, participations_by_campaign, contents_by_participation):
+
+def render_performance_metrics_analysis(campaign_data, facts):
     """성과 지표 분석 렌더링"""
     st.markdown("#### 📈 성과 지표 분석")
     
-    # 성과 지표 데이터 수집
-    performance_data = []
+    # 성과 지표 데이터 (콘텐츠 행만)
     try:
-        for campaign in campaign_data:
-            participations = participations_by_campaign.get(campaign["id"], [])
-            for participation in participations:
-                contents = contents_by_participation.get(participation["id"], [])
-                for content in contents:
-                    likes = content.get("likes", 0)
-                    comments = content.get("comments", 0)
-                    shares = content.get("shares", 0)
-                    views = content.get("views", 0)
-                    
-                    # 참여율 계산: (좋아요 + 댓글 + 공유) / 조회수 × 100
-                    engagement_rate = 0
-                    if views > 0:
-                        engagement_rate = round((likes + comments + shares) / views * 100, 2)
-                    
-                    performance_data.append({
-                        "캠페인": campaign["campaign_name"],
-                        "인플루언서": participation.get("influencer_name", "N/A"),
-                        "플랫폼": participation.get("platform", "N/A"),
-                        "좋아요": likes,
-                        "댓글": comments,
-                        "조회수": views,
-                        "참여율": engagement_rate,
-                        "업로드일": content.get("posted_at", "N/A")
-                    })
+        contents = content_frame(facts)
     except Exception as e:
         st.error(f"❌ 성과 지표 데이터 조회 중 오류가 발생했습니다: {str(e)}")
         return
 
-    if not performance_data:
+    if contents.empty:
         st.info("성과 지표 데이터가 없습니다.")
         return
 
-    df_performance = pd.DataFrame(performance_data)
-    
     # 성과 지표 요약
     col_title, col_help = st.columns([4, 1])
     with col_title:
@@ -282,23 +605,9 @@ def render_performance_metrics_analysis(campaign_data, participations_by_campaig
         *참여율 = (좋아요 + 댓글) / 조회수 × 100*
         """)
     
-    # 캠페인별 총합 계산
-    summary_metrics = df_performance.groupby("캠페인").agg({
-        "좋아요": "sum",
-        "댓글": "sum", 
-        "조회수": "sum"
-    }).round(2)
-    
-    # 참여율을 총합 기반으로 재계산
-    summary_metrics["참여율"] = 0
-    for campaign in summary_metrics.index:
-        total_likes = summary_metrics.loc[campaign, "좋아요"]
-        total_comments = summary_metrics.loc[campaign, "댓글"]
-        total_views = summary_metrics.loc[campaign, "조회수"]
-        
-        if total_views > 0:
-            engagement_rate = round((total_likes + total_comments) / total_views * 100, 2)
-            summary_metrics.loc[campaign, "참여율"] = engagement_rate
+    # 캠페인별 총합 및 총합 기반 참여율 계산
+    summary_metrics = _summarize_metrics(contents, "campaign_name").rename(columns=REPORT_COLUMN_LABELS)
+    summary_metrics.index.name = "캠페인"
     
     # 참여율을 퍼센트 형식으로 표시
     summary_metrics_display = summary_metrics.copy()
@@ -346,23 +655,9 @@ def render_performance_metrics_analysis(campaign_data, participations_by_campaig
         *참여율 = (좋아요 + 댓글) / 조회수 × 100*
         """)
     
-    # 플랫폼별 총합 계산
-    platform_performance = df_performance.groupby("플랫폼").agg({
-        "좋아요": "sum",
-        "댓글": "sum",
-        "조회수": "sum"
-    }).round(2)
-    
-    # 참여율을 총합 기반으로 재계산
-    platform_performance["참여율"] = 0
-    for platform in platform_performance.index:
-        total_likes = platform_performance.loc[platform, "좋아요"]
-        total_comments = platform_performance.loc[platform, "댓글"]
-        total_views = platform_performance.loc[platform, "조회수"]
-        
-        if total_views > 0:
-            engagement_rate = round((total_likes + total_comments) / total_views * 100, 2)
-            platform_performance.loc[platform, "참여율"] = engagement_rate
+    # 플랫폼별 총합 및 총합 기반 참여율 계산
+    platform_performance = _summarize_metrics(contents, "platform").rename(columns=REPORT_COLUMN_LABELS)
+    platform_performance.index.name = "플랫폼"
     
     # 참여율을 퍼센트 형식으로 표시
     platform_performance_display = platform_performance.copy()
@@ -381,47 +676,46 @@ def render_performance_metrics_analysis(campaign_data, participations_by_campaig
     st.plotly_chart(fig_platform_metrics, width='stretch')
 
 
-def render_influencer_analysis(campaign_data, participations_by_campaign, contents_by_participation):
+def influencer_summary_frame(facts):
+    """참여(캠페인 × 인플루언서)별 콘텐츠 성과 합계 DataFrame (화면/내보내기 공용)"""
+    per_participation = facts.groupby("participation_id", sort=False).agg(
+        campaign_name=("campaign_name", "first"),
+        influencer_name=("influencer_name", "first"),
+        platform=("platform", "first"),
+        followers_count=("followers_count", "first"),
+        likes=("likes", "sum"),
+        comments=("comments", "sum"),
+        views=("views", "sum"),
+        content_count=("content_id", "count"),
+    )
+    per_participation = add_engagement_rate(per_participation)
+    return pd.DataFrame({
+        "캠페인": per_participation["campaign_name"],
+        "인플루언서": per_participation["influencer_name"],
+        "플랫폼": per_participation["platform"],
+        "팔로워": per_participation["followers_count"],
+        "총 좋아요": per_participation["likes"],
+        "총 댓글": per_participation["comments"],
+        "총 조회수": per_participation["views"],
+        "평균 참여율": per_participation["engagement_rate"],
+        "콘텐츠 수": per_participation["content_count"],
+    }).reset_index(drop=True)
+
+
+def render_influencer_analysis(campaign_data, facts):
     """인플루언서별 분석 렌더링"""
     st.markdown("#### 👥 인플루언서별 분석")
     
-    # 인플루언서별 성과 데이터 수집
-    influencer_data = []
+    # 인플루언서별 성과 데이터 집계
     try:
-        for campaign in campaign_data:
-            participations = participations_by_campaign.get(campaign["id"], [])
-            for participation in participations:
-                contents = contents_by_participation.get(participation["id"], [])
-                total_likes = sum(content.get("likes", 0) for content in contents)
-                total_comments = sum(content.get("comments", 0) for content in contents)
-                total_views = sum(content.get("views", 0) for content in contents)
-                total_shares = sum(content.get("shares", 0) for content in contents)
-                
-                # 참여율 계산: (총 좋아요 + 총 댓글) / 총 조회수 × 100
-                avg_engagement = 0
-                if total_views > 0:
-                    avg_engagement = round((total_likes + total_comments) / total_views * 100, 2)
-                
-                influencer_data.append({
-                    "캠페인": campaign["campaign_name"],
-                    "인플루언서": participation.get("influencer_name", "N/A"),
-                    "플랫폼": participation.get("platform", "N/A"),
-                    "팔로워": participation.get("followers_count", 0),
-                    "총 좋아요": total_likes,
-                    "총 댓글": total_comments,
-                    "총 조회수": total_views,
-                    "평균 참여율": avg_engagement,
-                    "콘텐츠 수": len(contents)
-                })
+        df_influencers = influencer_summary_frame(facts)
     except Exception as e:
         st.error(f"❌ 인플루언서 데이터 조회 중 오류가 발생했습니다: {str(e)}")
         return
 
-    if not influencer_data:
+    if df_influencers.empty:
         st.info("인플루언서 성과 데이터가 없습니다.")
         return
-
-    df_influencers = pd.DataFrame(influencer_data)
     
     # 인플루언서 성과 랭킹
     st.markdown("##### 🏆 인플루언서 성과 랭킹")
@@ -505,60 +799,89 @@ def render_influencer_analysis(campaign_data, participations_by_campaign, conten
     st.plotly_chart(fig_views, width='stretch')
 
 
-def render_trend_analysis(campaign_data, participations_by_campaign, contents_by_participation):
-    """날짜별 트렌드 분석 렌더링"""
+# 트렌드 버킷 (화면 라벨 → 집계 단위)
+TREND_BUCKETS = {"일별": "day", "주별": "week", "월별": "month"}
+_PANDAS_BUCKET_FREQ = {"day": "D", "week": "W", "month": "M"}
+
+TREND_COLUMNS = ["bucket_start", "campaign_id", "platform", "content_count"] + METRIC_COLUMNS
+
+
+def _trend_bounds(start_date, end_date):
+    """날짜 범위를 [시작, 종료) UTC 타임스탬프 문자열로 변환 (None이면 제한 없음)"""
+    start = pd.Timestamp(start_date).isoformat() + "+00:00" if start_date else None
+    end = (pd.Timestamp(end_date) + timedelta(days=1)).isoformat() + "+00:00" if end_date else None
+    return start, end
+
+
+def trend_frame_from_facts(facts, bucket, start_date=None, end_date=None):
+    """팩트 테이블로 기간 버킷 롤업 계산 (RPC 미적용 시 대체 경로, 결과 형태 동일)"""
+    contents = content_frame(facts)
+    contents = contents[contents["posted_at"].notna()]
+    if start_date:
+        contents = contents[contents["posted_at"] >= pd.Timestamp(start_date)]
+    if end_date:
+        contents = contents[contents["posted_at"] < pd.Timestamp(end_date) + timedelta(days=1)]
+    bucket_start = contents["posted_at"].dt.to_period(_PANDAS_BUCKET_FREQ[bucket]).dt.start_time
+    trend = contents.groupby([bucket_start.rename("bucket_start"), "campaign_id", "platform"]).agg(
+        content_count=("content_id", "size"),
+        **{metric: (metric, "sum") for metric in METRIC_COLUMNS},
+    ).reset_index()
+    return trend[TREND_COLUMNS]
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _load_trend_rollups(campaign_ids, bucket, start, end):
+    """서버 기간 버킷 집계 조회 (캠페인 집합/버킷/기간별 캐시, RPC 조회 실패 시 None)"""
+    rows = db_manager.get_content_metric_trend(list(campaign_ids), bucket=bucket, start=start, end=end)
+    if rows is None:
+        return None
+    trend = pd.DataFrame(rows, columns=TREND_COLUMNS)
+    trend["bucket_start"] = pd.to_datetime(trend["bucket_start"], errors="coerce")
+    return trend
+
+
+def get_trend_rollups(campaign_data, bucket, start_date=None, end_date=None):
+    """선택 캠페인의 캠페인 × 플랫폼 × 기간 버킷 롤업 (선택 기간만 조회)
+
+    get_content_metric_trend RPC 결과를 사용하고(빈 결과는 그대로 빈 트렌드),
+    RPC를 사용할 수 없을 때만 세션 스냅샷 팩트 테이블에서 같은 형태로 계산합니다.
+    """
+    start, end = _trend_bounds(start_date, end_date)
+    trend = _load_trend_rollups(tuple(sorted(c["id"] for c in campaign_data)), bucket, start, end)
+    if trend is None:
+        trend = trend_frame_from_facts(get_report_fact_table(campaign_data), bucket, start_date, end_date)
+    trend = trend.copy()
+    trend[TREND_COLUMNS[3:]] = trend[TREND_COLUMNS[3:]].apply(pd.to_numeric, errors="coerce").fillna(0)
+    return trend
+
+
+def render_trend_analysis(campaign_data, start_date=None, end_date=None):
+    """날짜별 트렌드 분석 렌더링 (선택 기간의 버킷 롤업만 조회)"""
     st.markdown("#### 📅 날짜별 트렌드 분석")
     
-    # 날짜별 성과 데이터 수집
-    trend_data = []
+    bucket_label = st.radio("집계 단위", list(TREND_BUCKETS.keys()), horizontal=True, key="report_trend_bucket")
+    
     try:
-        for campaign in campaign_data:
-            participations = participations_by_campaign.get(campaign["id"], [])
-            for participation in participations:
-                contents = contents_by_participation.get(participation["id"], [])
-                for content in contents:
-                    upload_date = content.get("posted_at")
-                    if upload_date:
-                        likes = content.get("likes", 0)
-                        comments = content.get("comments", 0)
-                        shares = content.get("shares", 0)
-                        views = content.get("views", 0)
-                        
-                        # 참여율 계산: (좋아요 + 댓글) / 조회수 × 100
-                        engagement_rate = 0
-                        if views > 0:
-                            engagement_rate = round((likes + comments) / views * 100, 2)
-                        
-                        trend_data.append({
-                            "날짜": pd.to_datetime(upload_date).date(),
-                            "캠페인": campaign["campaign_name"],
-                            "좋아요": likes,
-                            "댓글": comments,
-                            "조회수": views,
-                            "참여율": engagement_rate
-                        })
+        trend = get_trend_rollups(campaign_data, TREND_BUCKETS[bucket_label], start_date, end_date)
+        campaign_names = {c["id"]: c["campaign_name"] for c in campaign_data}
+        trend["날짜"] = trend["bucket_start"]
+        trend["캠페인"] = trend["campaign_id"].map(campaign_names)
     except Exception as e:
         st.error(f"❌ 트렌드 데이터 조회 중 오류가 발생했습니다: {str(e)}")
         return
 
-    if not trend_data:
+    if trend.empty:
         st.info("날짜별 성과 데이터가 없습니다.")
         return
 
-    df_trend = pd.DataFrame(trend_data)
-    df_trend["날짜"] = pd.to_datetime(df_trend["날짜"])
-    
-    # 일별 성과 트렌드
-    daily_trend = df_trend.groupby("날짜").agg({
-        "좋아요": "sum",
-        "댓글": "sum",
-        "조회수": "sum",
-        "참여율": "mean"
-    }).reset_index()
+    # 기간별 성과 트렌드 (지표 합계, 참여율은 합계 기준)
+    daily_trend = trend.groupby("날짜")[["likes", "comments", "views"]].sum()
+    daily_trend = add_engagement_rate(daily_trend).reset_index()
+    daily_trend.columns = ["날짜", "좋아요", "댓글", "조회수", "참여율"]
     
-    st.markdown("##### 📈 일별 성과 트렌드")
+    st.markdown(f"##### 📈 {bucket_label} 성과 트렌드")
     
-    # 일별 성과 데이터 테이블 표시
+    # 기간별 성과 데이터 테이블 표시
     daily_trend_display = daily_trend.copy()
     daily_trend_display["참여율"] = daily_trend_display["참여율"].apply(lambda x: f"{x:.2f}%")
     st.dataframe(daily_trend_display, width='stretch', hide_index=True)
@@ -572,7 +895,7 @@ def render_trend_analysis(campaign_data, participations_by_campaign, contents_by
             daily_trend, 
             x="날짜", 
             y="좋아요", 
-            title="일별 좋아요 수 트렌드",
+            title=f"{bucket_label} 좋아요 수 트렌드",
             markers=True,
             line_shape='spline'
         )
@@ -584,7 +907,7 @@ def render_trend_analysis(campaign_data, participations_by_campaign, contents_by
             daily_trend, 
             x="날짜", 
             y="댓글", 
-            title="일별 댓글 수 트렌드",
+            title=f"{bucket_label} 댓글 수 트렌드",
             markers=True,
             line_shape='spline'
         )
@@ -597,7 +920,7 @@ def render_trend_analysis(campaign_data, participations_by_campaign, contents_by
             daily_trend, 
             x="날짜", 
             y="조회수", 
-            title="일별 조회수 트렌드",
+            title=f"{bucket_label} 조회수 트렌드",
             markers=True,
             line_shape='spline'
         )
@@ -609,7 +932,7 @@ def render_trend_analysis(campaign_data, participations_by_campaign, contents_by
             daily_trend, 
             x="날짜", 
             y="참여율", 
-            title="일별 참여율 트렌드",
+            title=f"{bucket_label} 참여율 트렌드",
             markers=True,
             line_shape='spline'
         )
@@ -622,7 +945,7 @@ def render_trend_analysis(campaign_data, participations_by_campaign, contents_by
         daily_trend, 
         x="날짜", 
         y=["좋아요", "댓글", "조회수"],
-        title="일별 성과 지표 통합 트렌드",
+        title=f"{bucket_label} 성과 지표 통합 트렌드",
         markers=True,
         line_shape='spline'
     )
@@ -634,7 +957,8 @@ def render_trend_analysis(campaign_data, participations_by_campaign, contents_by
     
     # 캠페인별 트렌드 비교
     st.markdown("##### 📊 캠페인별 트렌드 비교")
-    campaign_trend = df_trend.groupby(["날짜", "캠페인"])["좋아요"].sum().reset_index()
+    campaign_trend = trend.groupby(["날짜", "캠페인"])["likes"].sum().reset_index()
+    campaign_trend.columns = ["날짜", "캠페인", "좋아요"]
     
     fig_campaign_trend = px.line(
         campaign_trend, 
@@ -646,67 +970,54 @@ def render_trend_analysis(campaign_data, participations_by_campaign, contents_by
     st.plotly_chart(fig_campaign_trend, width='stretch')
 
 
-def render_roi_analysis(campaign_data, participations_by_campaign, contents_by_participation):
+def render_roi_analysis(campaign_data, facts):
     """ROI 분석 렌더링"""
     st.markdown("#### 💰 ROI 분석")
     st.info("💡 ROI 분석: 인플루언서 비용과 성과 지표를 연계한 종합적인 투자 대비 수익률 분석을 제공합니다.")
     
-    # ROI 관련 데이터 수집
-    roi_data = []
+    # ROI 관련 데이터 집계 (비용은 참여 단위, 성과는 콘텐츠 단위)
     try:
-        for campaign in campaign_data:
-            participations = participations_by_campaign.get(campaign["id"], [])
-            total_likes = 0
-            total_comments = 0
-            total_views = 0
-            total_cost = 0
-            content_count = 0
-            
-            for participation in participations:
-                # 비용 데이터 수집
-                total_cost += float(participation.get("cost_krw", 0) or 0)
-                
-                contents = contents_by_participation.get(participation["id"], [])
-                for content in contents:
-                    total_likes += content.get("likes", 0)
-                    total_comments += content.get("comments", 0)
-                    total_views += content.get("views", 0)
-                    content_count += 1
-            
-            # 참여율 계산: (총 좋아요 + 총 댓글) / 총 조회수 × 100
-            avg_engagement = 0
-            if total_views > 0:
-                avg_engagement = round((total_likes + total_comments) / total_views * 100, 2)
-            
-            # ROI 지표 계산
-            cost_per_like = round(total_cost / total_likes, 2) if total_likes > 0 else 0
-            cost_per_view = round(total_cost / total_views, 2) if total_views > 0 else 0
-            cost_per_influencer = round(total_cost / len(participations), 2) if participations else 0
-            
-            roi_data.append({
-                "캠페인": campaign["campaign_name"],
-                "참여 인플루언서": len(participations),
-                "총 콘텐츠": content_count,
-                "총 비용": f"{total_cost:,.0f}원",
-                "총 좋아요": total_likes,
-                "총 댓글": total_comments,
-                "총 조회수": total_views,
-                "평균 참여율": avg_engagement,
-                "좋아요/인플루언서": round(total_likes / len(participations), 2) if participations else 0,
-                "조회수/인플루언서": round(total_views / len(participations), 2) if participations else 0,
-                "좋아요당 비용": f"{cost_per_like:,.0f}원",
-                "조회수당 비용": f"{cost_per_view:,.2f}원",
-                "인플루언서당 비용": f"{cost_per_influencer:,.0f}원"
-            })
+        cost_by_campaign = participation_frame(facts).groupby("campaign_id").agg(
+            participants=("participation_id", "size"),
+            total_cost=("cost_krw", "sum"),
+        )
+        metrics_by_campaign = content_frame(facts).groupby("campaign_id").agg(
+            content_count=("content_id", "size"),
+            likes=("likes", "sum"),
+            comments=("comments", "sum"),
+            views=("views", "sum"),
+        )
+        roi = _campaign_order(campaign_data).join(cost_by_campaign, on="campaign_id").join(metrics_by_campaign, on="campaign_id")
+        roi = roi.fillna({"participants": 0, "total_cost": 0.0, "content_count": 0, "likes": 0, "comments": 0, "views": 0})
+        roi = add_engagement_rate(roi)
+
+        participants = roi["participants"].where(roi["participants"] > 0)
+        cost_per_like = (roi["total_cost"] / roi["likes"].where(roi["likes"] > 0)).round(2).fillna(0)
+        cost_per_view = (roi["total_cost"] / roi["views"].where(roi["views"] > 0)).round(2).fillna(0)
+        cost_per_influencer = (roi["total_cost"] / participants).round(2).fillna(0)
     except Exception as e:
         st.error(f"❌ ROI 데이터 조회 중 오류가 발생했습니다: {str(e)}")
         return
 
-    if not roi_data:
+    if roi.empty:
         st.info("ROI 분석 데이터가 없습니다.")
         return
 
-    df_roi = pd.DataFrame(roi_data)
+    df_roi = pd.DataFrame({
+        "캠페인": roi["campaign_name"],
+        "참여 인플루언서": roi["participants"].astype(int),
+        "총 콘텐츠": roi["content_count"].astype(int),
+        "총 비용": roi["total_cost"].map(lambda x: f"{x:,.0f}원"),
+        "총 좋아요": roi["likes"].astype(int),
+        "총 댓글": roi["comments"].astype(int),
+        "총 조회수": roi["views"].astype(int),
+        "평균 참여율": roi["engagement_rate"],
+        "좋아요/인플루언서": (roi["likes"] / participants).round(2).fillna(0),
+        "조회수/인플루언서": (roi["views"] / participants).round(2).fillna(0),
+        "좋아요당 비용": cost_per_like.map(lambda x: f"{x:,.0f}원"),
+        "조회수당 비용": cost_per_view.map(lambda x: f"{x:,.2f}원"),
+        "인플루언서당 비용": cost_per_influencer.map(lambda x: f"{x:,.0f}원"),
+    })
     
     # ROI 지표 요약
     col_title, col_help = st.columns([4, 1])
@@ -761,12 +1072,12 @@ def render_roi_analysis(campaign_data, participations_by_campaign, contents_by_p
     # 비용 관련 시각화
     st.markdown("##### 💰 비용 효율성 분석")
     
-    # 비용 데이터를 숫자로 변환 (시각화용)
+    # 비용 데이터 숫자 컬럼 (시각화용)
     df_roi_viz = df_roi.copy()
-    df_roi_viz["총_비용_숫자"] = df_roi_viz["총 비용"].str.replace("원", "").str.replace(",", "").astype(float)
-    df_roi_viz["좋아요당_비용_숫자"] = df_roi_viz["좋아요당 비용"].str.replace("원", "").str.replace(",", "").astype(float)
-    df_roi_viz["조회수당_비용_숫자"] = df_roi_viz["조회수당 비용"].str.replace("원", "").str.replace(",", "").astype(float)
-    df_roi_viz["인플루언서당_비용_숫자"] = df_roi_viz["인플루언서당 비용"].str.replace("원", "").str.replace(",", "").astype(float)
+    df_roi_viz["총_비용_숫자"] = roi["total_cost"]
+    df_roi_viz["좋아요당_비용_숫자"] = cost_per_like
+    df_roi_viz["조회수당_비용_숫자"] = cost_per_view
+    df_roi_viz["인플루언서당_비용_숫자"] = cost_per_influencer
     
     col3, col4 = st.columns(2)
     with col3:
@@ -832,19 +1143,9 @@ def render_roi_analysis(campaign_data, participations_by_campaign, contents_by_p
     efficiency_data = df_roi_viz.copy()
     
     # 비용 효율성 점수 계산 (낮은 비용, 높은 성과 = 높은 점수)
-    efficiency_data["비용_효율성_점수"] = 0
-    for idx, row in efficiency_data.iterrows():
-        # 좋아요당 비용이 낮을수록, 참여율이 높을수록 좋은 점수
-        cost_efficiency = 0
-        if row["좋아요당_비용_숫자"] > 0:
-            # 좋아요당 비용의 역수 (낮은 비용일수록 높은 점수)
-            cost_efficiency = 1000 / row["좋아요당_비용_숫자"]  # 1000원당 좋아요 수
-        
-        engagement_score = row["평균 참여율"]
-        
-        # 종합 효율성 점수 (비용 효율성 40%, 참여율 60%)
-        efficiency_score = (cost_efficiency * 0.4 + engagement_score * 0.6)
-        efficiency_data.loc[idx, "비용_효율성_점수"] = round(efficiency_score, 2)
+    # 비용 효율성: 1000원당 좋아요 수 (좋아요당 비용의 역수), 종합 점수는 비용 효율성 40% + 참여율 60%
+    cost_efficiency = (1000 / efficiency_data["좋아요당_비용_숫자"].where(efficiency_data["좋아요당_비용_숫자"] > 0)).fillna(0)
+    efficiency_data["비용_효율성_점수"] = (cost_efficiency * 0.4 + efficiency_data["평균 참여율"] * 0.6).round(2)
     
     # 참여율을 퍼센트 형식으로 표시
     efficiency_display = efficiency_data[["캠페인", "비용_효율성_점수", "좋아요/인플루언서", "조회수/인플루언서", "평균 참여율", "좋아요당_비용_숫자"]].copy()
@@ -864,7 +1165,7 @@ def render_roi_analysis(campaign_data, participations_by_campaign, contents_by_p
 
 
 def render_export_section(campaign_data, report_type):
-    """리포트 내보내기 섹션 렌더링"""
+    """리포트 내보내기 섹션 렌더링 (내보내기 시점에 스냅샷 팩트 테이블 사용)"""
     st.markdown("---")
     st.markdown("#### 📤 리포트 내보내기")
     
@@ -872,32 +1173,31 @@ def render_export_section(campaign_data, report_type):
     
     with col1:
         if st.button("📊 CSV 다운로드", key="export_csv"):
-            export_to_csv(campaign_data, report_type)
+            export_to_csv(campaign_data, report_type, get_report_fact_table(campaign_data))
     
     with col2:
         if st.button("📈 Excel 다운로드", key="export_excel"):
-            export_to_excel(campaign_data, report_type)
+            export_to_excel(campaign_data, report_type, get_report_fact_table(campaign_data))
     
     with col3:
         if st.button("📋 요약 리포트", key="export_summary"):
-            export_summary_report(campaign_data, report_type)
+            export_summary_report(campaign_data, report_type, get_report_fact_table(campaign_data))
 
 
-def export_to_csv(campaign_data, report_type):
+def export_to_csv(campaign_data, report_type, facts):
     """CSV 형태로 리포트 내보내기"""
     try:
         # 리포트 타입에 따른 데이터 수집
         if report_type == "📊 종합 대시보드":
-            data = get_comprehensive_data(campaign_data)
+            df = get_comprehensive_data(campaign_data, facts)
         elif report_type == "📈 성과 지표 분석":
-            data = get_performance_metrics_data(campaign_data)
+            df = get_performance_metrics_data(campaign_data, facts)
         elif report_type == "👥 인플루언서별 분석":
-            data = get_influencer_analysis_data(campaign_data)
+            df = get_influencer_analysis_data(campaign_data, facts)
         else:
-            data = get_basic_campaign_data(campaign_data)
+            df = get_basic_campaign_data(campaign_data, facts)
         
-        if data:
-            df = pd.DataFrame(data)
+        if not df.empty:
             csv = df.to_csv(index=False, encoding='utf-8-sig')
             st.download_button(
                 label="CSV 파일 다운로드",
@@ -911,26 +1211,39 @@ def export_to_csv(campaign_data, report_type):
         st.error(f"CSV 내보내기 중 오류가 발생했습니다: {str(e)}")
 
 
-def export_to_excel(campaign_data, report_type):
-    """Excel 형태로 리포트 내보내기"""
+def _append_sheet(workbook, title, df):
+    """write-only 워크북에 DataFrame을 행 단위로 스트리밍 기록"""
+    sheet = workbook.create_sheet(title=title)
+    sheet.append(list(df.columns))
+    for row in df.itertuples(index=False, name=None):
+        # NaN/NaT는 빈 셀로 기록
+        sheet.append([None if pd.isna(value) else value for value in row])
+
+
+def export_to_excel(campaign_data, report_type, facts):
+    """Excel 형태로 리포트 내보내기
+
+    openpyxl write-only 모드로 시트를 행 단위로 기록하여
+    대량 내보내기에서도 전체 셀 객체를 메모리에 만들지 않습니다.
+    """
     try:
-        # 여러 시트로 구성된 Excel 파일 생성
+        # 여러 시트로 구성된 Excel 파일 생성 (프리페치된 팩트 테이블 재사용)
+        workbook = Workbook(write_only=True)
+        sheets = [
+            ("캠페인 요약", get_basic_campaign_data(campaign_data, facts)),
+            ("성과 지표", get_performance_metrics_data(campaign_data, facts)),
+            ("인플루언서 분석", get_influencer_analysis_data(campaign_data, facts)),
+        ]
+        for title, df in sheets:
+            if not df.empty:
+                _append_sheet(workbook, title, df)
+        
+        if not workbook.worksheets:
+            st.warning("내보낼 데이터가 없습니다.")
+            return
+        
         output = io.BytesIO()
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            # 기본 캠페인 데이터
-            basic_data = get_basic_campaign_data(campaign_data)
-            if basic_data:
-                pd.DataFrame(basic_data).to_excel(writer, sheet_name='캠페인 요약', index=False)
-            
-            # 성과 지표 데이터
-            performance_data = get_performance_metrics_data(campaign_data)
-            if performance_data:
-                pd.DataFrame(performance_data).to_excel(writer, sheet_name='성과 지표', index=False)
-            
-            # 인플루언서 분석 데이터
-            influencer_data = get_influencer_analysis_data(campaign_data)
-            if influencer_data:
-                pd.DataFrame(influencer_data).to_excel(writer, sheet_name='인플루언서 분석', index=False)
+        workbook.save(output)
         
         st.download_button(
             label="Excel 파일 다운로드",
@@ -942,10 +1255,10 @@ def export_to_excel(campaign_data, report_type):
         st.error(f"Excel 내보내기 중 오류가 발생했습니다: {str(e)}")
 
 
-def export_summary_report(campaign_data, report_type):
+def export_summary_report(campaign_data, report_type, facts):
     """요약 리포트 생성"""
     try:
-        summary = generate_summary_report(campaign_data, report_type)
+        summary = generate_summary_report(campaign_data, report_type, facts)
         st.markdown("#### 📋 요약 리포트")
         st.markdown(summary)
         
@@ -959,108 +1272,63 @@ def export_summary_report(campaign_data, report_type):
         st.error(f"요약 리포트 생성 중 오류가 발생했습니다: {str(e)}")
 
 
-def get_basic_campaign_data(campaign_data):
+def _participation_counts(campaign_data, facts):
+    """캠페인별 참여자 수 / 업로드 완료 수 (선택 순서 유지)"""
+    counts = participation_frame(facts).groupby("campaign_id").agg(
+        participants=("participation_id", "size"),
+        completed=("content_uploaded", "sum"),
+    )
+    counts = _campaign_order(campaign_data).join(counts, on="campaign_id")
+    counts[["participants", "completed"]] = counts[["participants", "completed"]].fillna(0).astype(int)
+    return counts
+
+
+def get_basic_campaign_data(campaign_data, facts):
     """기본 캠페인 데이터 수집"""
-    data = []
-    try:
-        for campaign in campaign_data:
-            participations = db_manager.get_all_campaign_participations(campaign["id"])
-            completed = len([p for p in participations if p.get("content_uploaded", False)])
-            data.append({
-                "캠페인명": campaign["campaign_name"],
-                "캠페인 유형": format_campaign_type(campaign["campaign_type"]),
-                "참여 인플루언서 수": len(participations),
-                "업로드 완료": completed,
-                "완료율": f"{(completed / len(participations) * 100):.1f}%" if participations else "0%",
-                "시작일": campaign.get("start_date", "N/A"),
-                "종료일": campaign.get("end_date", "N/A")
-            })
-    except Exception as e:
-        st.error(f"기본 데이터 수집 중 오류: {str(e)}")
-    return data
+    counts = _participation_counts(campaign_data, facts)
+    return pd.DataFrame({
+        "캠페인명": counts["campaign_name"],
+        "캠페인 유형": counts["campaign_type"].map(format_campaign_type),
+        "참여 인플루언서 수": counts["participants"],
+        "업로드 완료": counts["completed"],
+        "완료율": _format_ratio(counts["completed"], counts["participants"]),
+        "시작일": [c.get("start_date", "N/A") for c in campaign_data],
+        "종료일": [c.get("end_date", "N/A") for c in campaign_data],
+    })
 
 
-def get_performance_metrics_data(campaign_data):
-    """성과 지표 데이터 수집"""
-    data = []
-    try:
-        for campaign in campaign_data:
-            participations = db_manager.get_all_campaign_participations(campaign["id"])
-            for participation in participations:
-                contents = db_manager.get_campaign_influencer_contents(participation["id"])
-                for content in contents:
-                    likes = content.get("likes", 0)
-                    comments = content.get("comments", 0)
-                    shares = content.get("shares", 0)
-                    views = content.get("views", 0)
-                    
-                    # 참여율 계산: (좋아요 + 댓글) / 조회수 × 100
-                    engagement_rate = 0
-                    if views > 0:
-                        engagement_rate = round((likes + comments) / views * 100, 2)
-                    
-                    data.append({
-                        "캠페인": campaign["campaign_name"],
-                        "인플루언서": participation.get("influencer_name", "N/A"),
-                        "플랫폼": participation.get("platform", "N/A"),
-                        "좋아요": likes,
-                        "댓글": comments,
-                        "조회수": views,
-                        "참여율": engagement_rate,
-                        "업로드일": content.get("posted_at", "N/A")
-                    })
-    except Exception as e:
-        st.error(f"성과 지표 데이터 수집 중 오류: {str(e)}")
-    return data
+def get_performance_metrics_data(campaign_data, facts):
+    """성과 지표 데이터 수집 (콘텐츠 1건당 1행)"""
+    contents = add_engagement_rate(content_frame(facts).copy())
+    return pd.DataFrame({
+        "캠페인": contents["campaign_name"],
+        "인플루언서": contents["influencer_name"],
+        "플랫폼": contents["platform"],
+        "좋아요": contents["likes"],
+        "댓글": contents["comments"],
+        "조회수": contents["views"],
+        "참여율": contents["engagement_rate"],
+        "업로드일": contents["posted_at"].dt.strftime("%Y-%m-%d %H:%M:%S").fillna("N/A"),
+    }).reset_index(drop=True)
 
 
-def get_influencer_analysis_data(campaign_data):
+def get_influencer_analysis_data(campaign_data, facts):
     """인플루언서 분석 데이터 수집"""
-    data = []
-    try:
-        for campaign in campaign_data:
-            participations = db_manager.get_all_campaign_participations(campaign["id"])
-            for participation in participations:
-                contents = db_manager.get_campaign_influencer_contents(participation["id"])
-                total_likes = sum(content.get("likes", 0) for content in contents)
-                total_comments = sum(content.get("comments", 0) for content in contents)
-                total_views = sum(content.get("views", 0) for content in contents)
-                total_shares = sum(content.get("shares", 0) for content in contents)
-                
-                # 참여율 계산: (총 좋아요 + 총 댓글) / 총 조회수 × 100
-                avg_engagement = 0
-                if total_views > 0:
-                    avg_engagement = round((total_likes + total_comments) / total_views * 100, 2)
-                
-                data.append({
-                    "캠페인": campaign["campaign_name"],
-                    "인플루언서": participation.get("influencer_name", "N/A"),
-                    "플랫폼": participation.get("platform", "N/A"),
-                    "팔로워": participation.get("followers_count", 0),
-                    "총 좋아요": total_likes,
-                    "총 댓글": total_comments,
-                    "총 조회수": total_views,
-                    "평균 참여율": avg_engagement,
-                    "콘텐츠 수": len(contents)
-                })
-    except Exception as e:
-        st.error(f"인플루언서 분석 데이터 수집 중 오류: {str(e)}")
-    return data
+    return influencer_summary_frame(facts)
 
 
-def get_comprehensive_data(campaign_data):
+def get_comprehensive_data(campaign_data, facts):
     """종합 데이터 수집"""
-    return get_basic_campaign_data(campaign_data)
+    return get_basic_campaign_data(campaign_data, facts)
 
 
-def generate_summary_report(campaign_data, report_type):
-    """요약 리포트 생성"""
+def generate_summary_report(campaign_data, report_type, facts):
+    """요약 리포트 생성 (캠페인별 참여 집계 1회로 전체/캠페인 통계 계산)"""
     try:
-        total_participations = sum(len(db_manager.get_all_campaign_participations(c["id"])) for c in campaign_data)
-        total_completed = sum(
-            len([p for p in db_manager.get_all_campaign_participations(c["id"]) if p.get("content_uploaded", False)])
-            for c in campaign_data
-        )
+        counts = _participation_counts(campaign_data, facts)
+        total_participations = int(counts["participants"].sum())
+        total_completed = int(counts["completed"].sum())
+        total_rate = (total_completed / total_participations * 100) if total_participations else 0
         
         summary = f"""
 === 캠페인 성과 리포트 요약 ===
@@ -1071,15 +1339,14 @@ def generate_summary_report(campaign_data, report_type):
 - 분석 캠페인 수: {len(campaign_data)}개
 - 총 참여 인플루언서: {total_participations}명
 - 업로드 완료: {total_completed}명
-- 전체 완료율: {(total_completed / total_participations * 100):.1f}% (총 참여자 > 0인 경우)
+- 전체 완료율: {total_rate:.1f}%
 
 📈 캠페인별 요약:
 """
         
-        for campaign in campaign_data:
-            participations = db_manager.get_all_campaign_participations(campaign["id"])
-            completed = len([p for p in participations if p.get("content_uploaded", False)])
-            summary += f"- {campaign['campaign_name']}: {len(participations)}명 참여, {completed}명 완료 ({(completed / len(participations) * 100):.1f}%)\n"
+        for row in counts.itertuples(index=False):
+            rate = (row.completed / row.participants * 100) if row.participants else 0
+            summary += f"- {row.campaign_name}: {row.participants}명 참여, {row.completed}명 완료 ({rate:.1f}%)\n"
         
         summary += f"""
 📋 상세 분석은 웹 인터페이스에서 확인하실 수 있습니다.
@@ -3,6 +3,7 @@
 """
 import streamlit as st
 import pandas as pd
+import plotly.express as px
 from datetime import datetime
 from ..db.database import db_manager
 from .common_functions import format_campaign_type, format_participation_status
@@ -44,22 +45,19 @@ def render_performance_view_tab():
     # 모든 캠페인의 참여 인플루언서 모으기
     all_participations = []
     try:
-        for campaign in campaigns:
-            if not campaign or "id" not in campaign:
-                continue
+        # 전체 캠페인의 참여를 한 번에 끝까지 조회 (캠페인별 요청/100건 제한 없음)
+        campaigns_by_id = {campaign["id"]: campaign for campaign in campaigns if campaign and "id" in campaign}
+        participations = db_manager.get_participations_by_campaign_ids(list(campaigns_by_id.keys()))
 
-            participations = db_manager.get_all_campaign_participations(campaign["id"])
-            if not participations:
+        for participation in participations:
+            campaign = campaigns_by_id.get(participation.get("campaign_id")) if participation else None
+            if not campaign:
                 continue
 
-            for participation in participations:
-                if not participation:
-                    continue
-
-                safe_participation = dict(participation) if isinstance(participation, dict) else {}
-                safe_participation["campaign_name"] = campaign.get("campaign_name", "N/A")
-                safe_participation["campaign_type"] = campaign.get("campaign_type", "")
-                all_participations.append(safe_participation)
+            safe_participation = dict(participation)
+            safe_participation["campaign_name"] = campaign.get("campaign_name", "N/A")
+            safe_participation["campaign_type"] = campaign.get("campaign_type", "")
+            all_participations.append(safe_participation)
     except Exception as e:
         st.error(f"❌ 참여 인플루언서 데이터 조회 중 오류가 발생했습니다: {str(e)}")
         return
@@ -436,6 +434,8 @@ def render_performance_detail_modal():
         df_history = pd.DataFrame(history_data)
         st.dataframe(df_history, width='stretch', hide_index=True)
 
+    render_content_growth_curves(performance_data)
+
     if st.button("❌ 닫기", key=f"close_performance_detail_{influencer['id']}"):
         st.session_state.pop("viewing_performance", None)
         st.session_state.performance_detail_closed = True  # 성과 상세보기 닫기 플래그
@@ -444,6 +444,38 @@ def render_performance_detail_modal():
 
 
 
+def render_content_growth_curves(performance_data):
+    """콘텐츠별 지표 성장 곡선 (지표 스냅샷 이력을 한 번에 조회)"""
+    content_labels = {content["id"]: f"콘텐츠 {i+1}" for i, content in enumerate(performance_data) if content.get("id")}
+    if not content_labels:
+        return
+
+    history = db_manager.get_content_metric_history(list(content_labels.keys()), bucket="day")
+    df_growth = pd.DataFrame(history)
+    if df_growth.empty or df_growth["measured_at"].nunique() < 2:
+        return
+
+    st.markdown("#### 📈 성과 성장 추이")
+    metric_labels = {"views": "조회수", "likes": "좋아요", "comments": "댓글"}
+    metric_label = st.radio(
+        "지표", list(metric_labels.values()), horizontal=True, key="performance_growth_metric"
+    )
+    metric = next(key for key, label in metric_labels.items() if label == metric_label)
+
+    df_growth["측정일"] = pd.to_datetime(df_growth["measured_at"], errors="coerce", utc=True)
+    df_growth["콘텐츠"] = df_growth["content_id"].map(content_labels)
+    fig_growth = px.line(
+        df_growth.sort_values("측정일"),
+        x="측정일",
+        y=metric,
+        color="콘텐츠",
+        markers=True,
+        title=f"콘텐츠별 {metric_label} 성장 추이",
+        labels={metric: metric_label},
+    )
+    st.plotly_chart(fig_growth, width='stretch')
+
+
 def safe_int_conversion(value, default=0):
     """안전한 정수 변환 함수"""
     try:
@@ -486,17 +518,49 @@ def safe_rels_conversion(value):
     except (ValueError, TypeError):
         return 0
 
+# 성과 데이터 편집기에서 수정 가능한 컬럼
+PERFORMANCE_EDITABLE_COLUMNS = ['조회수', '좋아요', '댓글', '콘텐츠 URL', '컨텐츠내용', '업로드일', '릴스여부']
+
+
+def diff_performance_changes(original_df, edited_df):
+    """편집 전/후 DataFrame을 한 번에 비교하여 변경된 행의 컬럼별 변경 여부 반환
+
+    양쪽 모두 빈 값인 셀은 변경되지 않은 것으로 봅니다.
+    Returns:
+        변경된 행만 담은 bool DataFrame (index: 편집기 행 인덱스, columns: 편집 가능 컬럼)
+    """
+    columns = [c for c in PERFORMANCE_EDITABLE_COLUMNS if c in original_df.columns and c in edited_df.columns]
+    original = original_df[columns].reindex(edited_df.index)
+    edited = edited_df[columns]
+    both_missing = original.isna() & edited.isna()
+    changed = (original != edited) & ~both_missing
+    return changed[changed.any(axis=1)]
+
+
+def _describe_changes(original_df, edited_df, changed):
+    """변경된 행별 "컬럼: 이전 → 이후" 요약 목록"""
+    items = []
+    for idx, changed_row in changed.iterrows():
+        fields = []
+        for col in changed.columns[changed_row.values]:
+            before = original_df.at[idx, col]
+            after = edited_df.at[idx, col]
+            before = "(빈값)" if pd.isna(before) else before
+            after = "(빈값)" if pd.isna(after) else after
+            fields.append(f"{col}: {before} → {after}")
+        items.append({
+            "인덱스": idx,
+            "캠페인": edited_df.at[idx, "캠페인"] if "캠페인" in edited_df.columns else "N/A",
+            "인플루언서": edited_df.at[idx, "인플루언서"] if "인플루언서" in edited_df.columns else "N/A",
+            "변경사항": " | ".join(fields)
+        })
+    return items
+
+
 def check_performance_changes(original_df, edited_df):
     """변경사항이 있는지 확인"""
     try:
-        # 편집 가능한 필드들만 확인
-        editable_columns = ['조회수', '좋아요', '댓글', '콘텐츠 URL', '컨텐츠내용', '업로드일', '릴스여부']
-        
-        for col in editable_columns:
-            if col in original_df.columns and col in edited_df.columns:
-                if not original_df[col].equals(edited_df[col]):
-                    return True
-        return False
+        return not diff_performance_changes(original_df, edited_df).empty
     except Exception:
         return False
 
@@ -504,31 +568,7 @@ def check_performance_changes(original_df, edited_df):
 def preview_performance_changes(original_df, edited_df):
     """변경사항 미리보기"""
     try:
-        # 편집 가능한 필드들만 확인
-        editable_columns = ['조회수', '좋아요', '댓글', '콘텐츠 URL', '컨텐츠내용', '업로드일', '릴스여부']
-        changes = []
-        
-        for idx, row in edited_df.iterrows():
-            original_row = original_df.iloc[idx]
-            row_changes = []
-            
-            for col in editable_columns:
-                if col in original_df.columns and col in edited_df.columns:
-                    if not pd.isna(original_row[col]) and not pd.isna(row[col]):
-                        if original_row[col] != row[col]:
-                            row_changes.append(f"{col}: {original_row[col]} → {row[col]}")
-                    elif pd.isna(original_row[col]) and not pd.isna(row[col]):
-                        row_changes.append(f"{col}: (빈값) → {row[col]}")
-                    elif not pd.isna(original_row[col]) and pd.isna(row[col]):
-                        row_changes.append(f"{col}: {original_row[col]} → (빈값)")
-            
-            if row_changes:
-                changes.append({
-                    "인덱스": idx,
-                    "캠페인": row.get("캠페인", "N/A"),
-                    "인플루언서": row.get("인플루언서", "N/A"),
-                    "변경사항": " | ".join(row_changes)
-                })
+        changes = _describe_changes(original_df, edited_df, diff_performance_changes(original_df, edited_df))
         
         if changes:
             st.markdown("#### 📋 변경사항 미리보기")
@@ -542,118 +582,73 @@ def preview_performance_changes(original_df, edited_df):
         st.error(f"변경사항 미리보기 중 오류가 발생했습니다: {str(e)}")
 
 
+def _build_content_payload(row, participation_id, existing):
+    """편집된 행 → campaign_influencer_contents 저장 데이터 (기존 콘텐츠가 있으면 편집하지 않는 값은 유지)"""
+    existing = existing or {}
+    payload = {
+        "participation_id": participation_id,
+        "content_url": str(row['콘텐츠 URL']) if pd.notna(row['콘텐츠 URL']) else existing.get("content_url", ""),
+        "posted_at": row['업로드일'].isoformat() if pd.notna(row['업로드일']) else existing.get("posted_at", datetime.now().isoformat()),
+        "views": safe_int_conversion(row['조회수']),
+        "likes": safe_int_conversion(row['좋아요']),
+        "comments": safe_int_conversion(row['댓글']),
+        "shares": existing.get("shares", 0),
+        "clicks": existing.get("clicks", 0),
+        "conversions": existing.get("conversions", 0),
+        "caption": str(row['컨텐츠내용']) if pd.notna(row['컨텐츠내용']) else existing.get("caption", ""),
+        "qualitative_note": existing.get("qualitative_note", ""),
+        "is_rels": safe_rels_conversion(row['릴스여부']),
+    }
+    if existing.get("id"):
+        payload["id"] = existing["id"]
+    return payload
+
+
 def save_performance_changes(original_df, edited_df, participation_mapping):
-    """성과 데이터 변경사항을 데이터베이스에 저장"""
+    """성과 데이터 변경사항을 데이터베이스에 저장
+
+    변경된 행을 한 번에 계산하고, 대상 참여들의 콘텐츠를 in_() 1회로 조회한 뒤
+    업데이트/생성을 일괄 저장합니다 (행 수와 무관하게 요청 수 일정).
+    """
     try:
-        # 변경된 행 찾기
-        changes_made = False
-        success_count = 0
+        changed = diff_performance_changes(original_df, edited_df)
+        if changed.empty:
+            st.info("💡 변경된 데이터가 없습니다. 테이블에서 데이터를 편집한 후 다시 시도해주세요.")
+            return
+        
+        changed_items = _describe_changes(original_df, edited_df, changed)
         error_count = 0
-        changed_items = []
         
-        for idx, row in edited_df.iterrows():
-            original_row = original_df.iloc[idx]
-            
-            # 편집 가능한 필드들이 변경되었는지 확인
-            has_changes = False
-            changed_fields = []
-            
-            # 각 필드별로 변경사항 확인
-            if row['조회수'] != original_row['조회수']:
-                has_changes = True
-                changed_fields.append(f"조회수: {original_row['조회수']} → {row['조회수']}")
-            
-            if row['좋아요'] != original_row['좋아요']:
-                has_changes = True
-                changed_fields.append(f"좋아요: {original_row['좋아요']} → {row['좋아요']}")
-            
-            if row['댓글'] != original_row['댓글']:
-                has_changes = True
-                changed_fields.append(f"댓글: {original_row['댓글']} → {row['댓글']}")
-            
-            if row['콘텐츠 URL'] != original_row['콘텐츠 URL']:
-                has_changes = True
-                changed_fields.append(f"콘텐츠 URL: {original_row['콘텐츠 URL']} → {row['콘텐츠 URL']}")
-            
-            if row['컨텐츠내용'] != original_row['컨텐츠내용']:
-                has_changes = True
-                changed_fields.append(f"컨텐츠내용: {original_row['컨텐츠내용']} → {row['컨텐츠내용']}")
-            
-            if row['업로드일'] != original_row['업로드일']:
-                has_changes = True
-                changed_fields.append(f"업로드일: {original_row['업로드일']} → {row['업로드일']}")
-            
-            if row['릴스여부'] != original_row['릴스여부']:
-                has_changes = True
-                changed_fields.append(f"릴스여부: {original_row['릴스여부']} → {row['릴스여부']}")
-            
-            if has_changes:
-                changes_made = True
-                participation_id = participation_mapping.get(idx)
-                
-                if not participation_id:
-                    st.error(f"인덱스 {idx}에 대한 참여 ID를 찾을 수 없습니다.")
-                    error_count += 1
-                    continue
-                
-                changed_items.append({
-                    "인덱스": idx,
-                    "캠페인": row.get("캠페인", "N/A"),
-                    "인플루언서": row.get("인플루언서", "N/A"),
-                    "변경사항": " | ".join(changed_fields)
-                })
-                
-                try:
-                    # 해당 참여의 모든 콘텐츠 조회
-                    content_data = db_manager.get_performance_data_by_participation(participation_id)
-                    
-                    if not content_data:
-                        # 콘텐츠가 없으면 새로 생성
-                        new_content_data = {
-                            "participation_id": participation_id,
-                            "content_url": str(row['콘텐츠 URL']) if pd.notna(row['콘텐츠 URL']) else "",
-                            "posted_at": row['업로드일'].isoformat() if pd.notna(row['업로드일']) else datetime.now().isoformat(),
-                            "views": safe_int_conversion(row['조회수']),
-                            "likes": safe_int_conversion(row['좋아요']),
-                            "comments": safe_int_conversion(row['댓글']),
-                            "shares": 0,
-                            "clicks": 0,
-                            "conversions": 0,
-                            "caption": str(row['컨텐츠내용']) if pd.notna(row['컨텐츠내용']) else "",
-                            "qualitative_note": "",
-                            "is_rels": safe_rels_conversion(row['릴스여부']),
-                        }
-                        result = db_manager.create_campaign_influencer_content(new_content_data)
-                        if result.get('success'):
-                            success_count += 1
-                        else:
-                            st.error(f"새 콘텐츠 생성 실패: {result.get('message', '알 수 없는 오류')}")
-                            error_count += 1
-                    else:
-                        # 첫 번째 콘텐츠의 성과 데이터 업데이트
-                        first_content = content_data[0]
-                        update_data = {
-                            "content_url": str(row['콘텐츠 URL']) if pd.notna(row['콘텐츠 URL']) else first_content.get("content_url", ""),
-                            "posted_at": row['업로드일'].isoformat() if pd.notna(row['업로드일']) else first_content.get("posted_at", datetime.now().isoformat()),
-                            "views": safe_int_conversion(row['조회수']),
-                            "likes": safe_int_conversion(row['좋아요']),
-                            "comments": safe_int_conversion(row['댓글']),
-                            "shares": first_content.get("shares", 0),
-                            "clicks": first_content.get("clicks", 0),
-                            "conversions": first_content.get("conversions", 0),
-                            "caption": str(row['컨텐츠내용']) if pd.notna(row['컨텐츠내용']) else first_content.get("caption", ""),
-                            "qualitative_note": first_content.get("qualitative_note", ""),
-                            "is_rels": safe_rels_conversion(row['릴스여부']),
-                        }
-                        result = db_manager.update_campaign_influencer_content(first_content['id'], update_data)
-                        if result.get('success'):
-                            success_count += 1
-                        else:
-                            st.error(f"콘텐츠 업데이트 실패: {result.get('message', '알 수 없는 오류')}")
-                            error_count += 1
-                            
-                except Exception as e:
-                    st.error(f"인덱스 {idx} 데이터 저장 중 오류: {str(e)}")
+        # 참여 ID 매핑 확인
+        target_rows = []
+        for idx in changed.index:
+            participation_id = participation_mapping.get(idx)
+            if not participation_id:
+                st.error(f"인덱스 {idx}에 대한 참여 ID를 찾을 수 없습니다.")
+                error_count += 1
+                continue
+            target_rows.append((idx, participation_id))
+        
+        # 변경된 참여들의 콘텐츠를 한 번에 조회 (최근 생성 순 → 참여별 첫 콘텐츠가 편집 대상)
+        participation_ids = list(dict.fromkeys(pid for _, pid in target_rows))
+        first_content_by_participation = {}
+        for content in db_manager.get_contents_by_participation_ids(participation_ids):
+            first_content_by_participation.setdefault(content.get("participation_id"), content)
+        
+        payloads = [
+            _build_content_payload(edited_df.loc[idx], participation_id, first_content_by_participation.get(participation_id))
+            for idx, participation_id in target_rows
+        ]
+        
+        success_count = 0
+        if payloads:
+            result = db_manager.bulk_save_campaign_influencer_contents(payloads)
+            for (idx, _), row_result in zip(target_rows, result.get("results") or [{}] * len(target_rows)):
+                if row_result and row_result.get("success"):
+                    success_count += 1
+                else:
+                    message = (row_result or {}).get("message") or result.get("message", "알 수 없는 오류")
+                    st.error(f"인덱스 {idx} 데이터 저장 실패: {message}")
                     error_count += 1
         
         # 결과 표시
@@ -669,9 +664,6 @@ def save_performance_changes(original_df, edited_df, participation_mapping):
         if error_count > 0:
             st.error(f"❌ {error_count}개의 데이터 저장에 실패했습니다.")
         
-        if success_count == 0 and error_count == 0:
-            st.info("💡 변경된 데이터가 없습니다. 테이블에서 데이터를 편집한 후 다시 시도해주세요.")
-        
         if success_count > 0:
             # 캐시 클리어하여 최신 데이터 반영
             st.session_state.pop("campaigns_cache", None)
@@ -680,5 +672,3 @@ def save_performance_changes(original_df, edited_df, participation_mapping):
             
     except Exception as e:
         st.error(f"❌ 성과 데이터 저장 중 오류가 발생했습니다: {str(e)}")
-
-
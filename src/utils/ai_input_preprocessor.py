@@ -0,0 +1,255 @@
+"""
+AI 인플루언서 분석 입력 전처리 유틸리티
+- posts JSON 파싱, 중복 캡션/해시태그 제거, URL 및 상투 문구 제거
+- 로컬 토크나이저로 토큰 수를 측정하여 설정된 토큰 예산 안에서 최근/정보량 높은 게시물만 유지
+"""
+import streamlit as st
+import os
+import re
+import json
+import time
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+
+DEFAULT_INPUT_TOKEN_BUDGET = 12000
+
+# 게시물 dict에서 본문/날짜로 사용할 수 있는 키 (크롤러 버전에 따라 다름)
+TEXT_KEYS = ("caption", "text", "content", "description", "body")
+DATE_KEYS = ("posted_at", "date", "timestamp", "taken_at", "created_at")
+
+URL_PATTERN = re.compile(r"(https?://\S+|www\.\S+)", flags=re.I)
+HASHTAG_PATTERN = re.compile(r"#[^\s#]+")
+BOILERPLATE_PATTERNS = [
+    re.compile(p, flags=re.I) for p in (
+        r"\.\.\.\s*(더\s*보기|more)",
+        r"(번역\s*보기|see\s+translation|원문\s*보기)",
+        r"(프로필\s*링크|link\s+in\s+bio)",
+    )
+]
+
+_encoding = None
+_encoding_failed = False
+
+
+def _get_encoding():
+    """tiktoken 인코딩 (프로세스당 1회 로드, 인코딩 파일을 받을 수 없으면 None → 근사치 사용)"""
+    global _encoding, _encoding_failed
+    if _encoding is None and TIKTOKEN_AVAILABLE and not _encoding_failed:
+        for name in ("o200k_base", "cl100k_base"):
+            try:
+                _encoding = tiktoken.get_encoding(name)
+                break
+            except Exception:
+                continue
+        else:
+            # 오프라인 등으로 두 인코딩 모두 로드 실패 - 매 호출마다 다시 받지 않도록 기록
+            _encoding_failed = True
+    return _encoding
+
+
+def count_tokens(text: str) -> int:
+    """로컬 토크나이저로 토큰 수 계산 (tiktoken 미설치 시 UTF-8 바이트 기반 근사치)"""
+    if not text:
+        return 0
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    # 한글 1자 ≈ 3바이트 ≈ 1토큰, 영문 약 4자 ≈ 1토큰의 보수적 근사
+    return max(1, len(text.encode("utf-8")) // 3)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """텍스트를 max_tokens 토큰 이내로 자름 (tiktoken 미사용 시 count_tokens 근사치 기준)"""
+    if not text or max_tokens <= 0:
+        return ""
+    if count_tokens(text) <= max_tokens:
+        return text
+    encoding = _get_encoding()
+    if encoding is not None:
+        return encoding.decode(encoding.encode(text, disallowed_special=())[:max_tokens])
+    # 근사치(UTF-8 바이트 // 3)와 맞도록 바이트 단위로 자르고 깨진 마지막 글자는 버림
+    return text.encode("utf-8")[:max_tokens * 3].decode("utf-8", errors="ignore")
+
+
+def get_input_token_budget() -> int:
+    """posts 입력 토큰 예산 (환경변수 우선, 그 다음 secrets, 0 이하면 제한 없음)"""
+    budget = os.getenv("AI_INPUT_TOKEN_BUDGET")
+    if not budget:
+        try:
+            budget = st.secrets.get("AI_INPUT_TOKEN_BUDGET")
+        except Exception:
+            budget = None
+    try:
+        return int(budget) if budget is not None else DEFAULT_INPUT_TOKEN_BUDGET
+    except (ValueError, TypeError):
+        return DEFAULT_INPUT_TOKEN_BUDGET
+
+
+def clean_text(text: str) -> str:
+    """URL, 상투 문구, 중복 공백 제거"""
+    if not text:
+        return ""
+    text = URL_PATTERN.sub("", str(text))
+    for pattern in BOILERPLATE_PATTERNS:
+        text = pattern.sub("", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def _parse_posts(posts: str) -> Optional[List[Any]]:
+    """posts 문자열을 게시물 리스트로 파싱 (JSON이 아니면 None)"""
+    try:
+        parsed = json.loads(posts)
+    except (ValueError, TypeError):
+        return None
+    if isinstance(parsed, dict):
+        # {"posts": [...]} / {"data": [...]} 형태 지원
+        for key in ("posts", "data", "items"):
+            if isinstance(parsed.get(key), list):
+                return parsed[key]
+        return [parsed]
+    return parsed if isinstance(parsed, list) else None
+
+
+def _post_text(post: Any) -> Tuple[Optional[str], Any]:
+    """게시물에서 본문 키와 본문 값 추출"""
+    if isinstance(post, str):
+        return None, post
+    if isinstance(post, dict):
+        for key in TEXT_KEYS:
+            if isinstance(post.get(key), str):
+                return key, post[key]
+    return None, None
+
+
+def _post_date(post: Any) -> str:
+    """게시물 정렬용 날짜 문자열 (없으면 빈 문자열)"""
+    if isinstance(post, dict):
+        for key in DATE_KEYS:
+            if post.get(key):
+                return str(post[key])
+    return ""
+
+
+def _compact_post(post: Any, seen_captions: set, seen_hashtags: set) -> Optional[Any]:
+    """게시물 1개 정리 - 중복 캡션이면 None, 이미 등장한 해시태그는 제거"""
+    text_key, text = _post_text(post)
+    if text is None:
+        if isinstance(post, dict):
+            # 본문이 없는 게시물은 URL 필드만 제거하고 지표는 유지
+            return {k: v for k, v in post.items() if not (isinstance(v, str) and URL_PATTERN.fullmatch(v.strip()))}
+        return post
+
+    cleaned = clean_text(text)
+    caption_key = HASHTAG_PATTERN.sub("", cleaned).strip().lower()
+    if caption_key and caption_key in seen_captions:
+        return None
+    if caption_key:
+        seen_captions.add(caption_key)
+
+    def _dedupe_hashtag(match):
+        tag = match.group(0).lower()
+        if tag in seen_hashtags:
+            return ""
+        seen_hashtags.add(tag)
+        return match.group(0)
+
+    cleaned = re.sub(r"\s+", " ", HASHTAG_PATTERN.sub(_dedupe_hashtag, cleaned)).strip()
+
+    if text_key is None:
+        return cleaned
+    compacted = {
+        k: v for k, v in post.items()
+        if k != text_key and not (isinstance(v, str) and URL_PATTERN.fullmatch(v.strip()))
+    }
+    compacted[text_key] = cleaned
+    return compacted
+
+
+def _truncate_post(post: Any, token_budget: int) -> Any:
+    """게시물 본문을 (예산 - 본문 외 필드 토큰) 이내로 자름"""
+    text_key, text = _post_text(post)
+    if text is None:
+        return post
+    if text_key is None:
+        return truncate_to_tokens(text, token_budget - count_tokens('""'))
+    overhead = count_tokens(json.dumps({**post, text_key: ""}, ensure_ascii=False))
+    return {**post, text_key: truncate_to_tokens(text, token_budget - overhead)}
+
+
+def compact_ai_input(data: Dict[str, Any], token_budget: Optional[int] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """AI 분석 입력({"id", "description", "posts"})을 토큰 예산에 맞게 압축
+
+    Returns:
+        (압축된 입력, 측정 지표) - 지표는 원본/압축 토큰 수, 게시물 수, 처리 시간(ms)
+    """
+    started = time.perf_counter()
+    if token_budget is None:
+        token_budget = get_input_token_budget()
+
+    posts = data.get("posts", "") or ""
+    description = clean_text(data.get("description", "") or "")
+    original_tokens = count_tokens(data.get("description", "") or "") + count_tokens(posts)
+
+    parsed_posts = _parse_posts(posts)
+    posts_total = len(parsed_posts) if parsed_posts is not None else 0
+    duplicates_removed = 0
+
+    if parsed_posts is None:
+        # JSON이 아닌 posts는 텍스트 정리 후 예산 내로 잘라냄
+        compacted_posts = clean_text(posts)
+        if token_budget > 0:
+            compacted_posts = truncate_to_tokens(compacted_posts, token_budget)
+        posts_kept = 0
+    else:
+        seen_captions, seen_hashtags = set(), set()
+        # 날짜가 있으면 최신순, 없으면 크롤링 순서(최신 게시물 우선) 유지
+        if any(_post_date(p) for p in parsed_posts):
+            parsed_posts = sorted(parsed_posts, key=_post_date, reverse=True)
+
+        candidates = []
+        for post in parsed_posts:
+            compacted = _compact_post(post, seen_captions, seen_hashtags)
+            if compacted is None:
+                duplicates_removed += 1
+                continue
+            candidates.append(compacted)
+
+        kept = []
+        used_tokens = 0
+        for post in candidates:
+            post_tokens = count_tokens(json.dumps(post, ensure_ascii=False))
+            if token_budget > 0 and used_tokens + post_tokens > token_budget:
+                if kept:
+                    # 예산을 넘는 게시물은 건너뛰고, 더 짧은 게시물이 들어갈 수 있는지 계속 확인
+                    continue
+                # 첫 게시물 하나가 예산을 넘으면 본문을 남은 예산만큼 잘라서 유지
+                post = _truncate_post(post, token_budget)
+                post_tokens = count_tokens(json.dumps(post, ensure_ascii=False))
+                if post_tokens > token_budget:
+                    continue
+            kept.append(post)
+            used_tokens += post_tokens
+        compacted_posts = json.dumps(kept, ensure_ascii=False)
+        posts_kept = len(kept)
+
+    compacted_data = dict(data)
+    compacted_data["description"] = description
+    compacted_data["posts"] = compacted_posts
+
+    metrics = {
+        "token_budget": token_budget,
+        "original_tokens": original_tokens,
+        "compacted_tokens": count_tokens(description) + count_tokens(compacted_posts),
+        "posts_total": posts_total,
+        "posts_kept": posts_kept,
+        "duplicates_removed": duplicates_removed,
+        "tokenizer": "tiktoken" if _get_encoding() is not None else "approx",
+        "preprocess_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+    return compacted_data, metrics
@@ -0,0 +1,85 @@
+"""
+AI 분석 실행 비용/소요 시간 추정 유틸리티
+- 프로필별 입력 토큰 수와 과거 호출 지연 시간으로 총 토큰, 비용, 실행 시간을 추정
+"""
+import math
+import statistics
+from typing import Dict, Any, List, Optional
+
+
+DEFAULT_LATENCY_SECONDS = 30.0
+
+
+def _percentile(values: List[float], ratio: float) -> float:
+    """값 목록의 백분위수 (선형 보간 없이 nearest-rank)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(ratio * len(ordered)) - 1))
+    return ordered[index]
+
+
+def estimate_analysis_run(
+    input_tokens: List[int],
+    latencies_ms: List[float],
+    concurrency: int = 1,
+    rate_limit_per_minute: Optional[float] = None,
+    avg_output_tokens: int = 2000,
+    input_price_per_1m: float = 0.25,
+    output_price_per_1m: float = 2.0,
+    default_latency_seconds: float = DEFAULT_LATENCY_SECONDS
+) -> Dict[str, Any]:
+    """분석 실행 추정치 계산
+
+    Args:
+        input_tokens: 분석 대상 프로필별 입력 토큰 수
+        latencies_ms: 과거 실행에서 기록된 호출별 지연 시간(ms)
+        concurrency: 동시 호출 수
+        rate_limit_per_minute: 분당 최대 호출 수 (None이면 제한 없음)
+        avg_output_tokens: 호출당 평균 출력 토큰 수
+        input_price_per_1m / output_price_per_1m: 100만 토큰당 가격(USD)
+        default_latency_seconds: 과거 지연 기록이 없을 때 사용할 호출당 지연(초)
+    """
+    call_count = len(input_tokens)
+    total_input_tokens = sum(input_tokens)
+    total_output_tokens = call_count * avg_output_tokens
+
+    latencies_s = [l / 1000 for l in latencies_ms if l and l > 0]
+    if latencies_s:
+        mean_latency = statistics.mean(latencies_s)
+        p50_latency = _percentile(latencies_s, 0.5)
+        p90_latency = _percentile(latencies_s, 0.9)
+    else:
+        mean_latency = p50_latency = p90_latency = default_latency_seconds
+
+    concurrency = max(1, int(concurrency))
+
+    def _wall_seconds(latency: float) -> float:
+        if call_count == 0:
+            return 0.0
+        # 동시성 기준 처리량과 레이트 리밋 중 작은 쪽이 병목
+        calls_per_second = concurrency / latency if latency > 0 else float("inf")
+        if rate_limit_per_minute and rate_limit_per_minute > 0:
+            calls_per_second = min(calls_per_second, rate_limit_per_minute / 60)
+        # 마지막 호출은 처리량과 무관하게 최소 1회 지연만큼 걸림
+        return max(latency, call_count / calls_per_second)
+
+    input_cost = total_input_tokens / 1_000_000 * input_price_per_1m
+    output_cost = total_output_tokens / 1_000_000 * output_price_per_1m
+
+    return {
+        "call_count": call_count,
+        "total_input_tokens": total_input_tokens,
+        "total_output_tokens": total_output_tokens,
+        "avg_input_tokens": total_input_tokens / call_count if call_count else 0,
+        "max_input_tokens": max(input_tokens) if input_tokens else 0,
+        "estimated_cost_usd": input_cost + output_cost,
+        "input_cost_usd": input_cost,
+        "output_cost_usd": output_cost,
+        "latency_samples": len(latencies_s),
+        "mean_latency_seconds": mean_latency,
+        "p50_latency_seconds": p50_latency,
+        "p90_latency_seconds": p90_latency,
+        "wall_seconds": _wall_seconds(mean_latency),
+        "wall_seconds_p90": _wall_seconds(p90_latency),
+    }
@@ -0,0 +1,77 @@
+"""
+ID 단위 엔티티 캐시 유틸리티
+- 여러 ID를 요청하면 캐시에 없는(또는 만료된) ID만 모아 배치 로더를 1회 호출
+- 로더 결과를 ID별로 저장하여 선택 집합이 바뀌어도 변경분만 조회
+"""
+import time
+import threading
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional
+
+
+def group_by(rows: Iterable[Dict[str, Any]], key: str) -> Dict[Hashable, List[Dict[str, Any]]]:
+    """행 목록을 key 값별 리스트 dict로 묶습니다. (배치 로더 결과를 ID별로 나눌 때 사용)"""
+    grouped: Dict[Hashable, List[Dict[str, Any]]] = {}
+    for row in rows:
+        grouped.setdefault(row.get(key), []).append(row)
+    return grouped
+
+class BatchedEntityCache:
+    """ID별 메모와 배치 로더를 결합한 캐시
+
+    Args:
+        loader: 누락된 ID 목록을 받아 {id: value} dict를 반환하는 함수
+        ttl: 항목 유효 시간(초), None이면 만료 없음
+        default_factory: 로더 결과에 없는 ID에 저장할 기본값 생성 함수 (예: list)
+    """
+
+    def __init__(self, loader: Callable[[List[Hashable]], Dict[Hashable, Any]],
+                 ttl: Optional[float] = 300, default_factory: Optional[Callable[[], Any]] = None):
+        self.loader = loader
+        self.ttl = ttl
+        self.default_factory = default_factory
+        self._entries: Dict[Hashable, tuple] = {}
+        self._lock = threading.Lock()
+
+    def _is_fresh(self, stored_at: float, now: float) -> bool:
+        return self.ttl is None or now - stored_at < self.ttl
+
+    def missing_ids(self, ids: Iterable[Hashable]) -> List[Hashable]:
+        """캐시에 없거나 만료된 ID 목록 (입력 순서 유지, 중복 제거)"""
+        now = time.time()
+        with self._lock:
+            return [
+                entity_id for entity_id in dict.fromkeys(ids)
+                if entity_id not in self._entries or not self._is_fresh(self._entries[entity_id][1], now)
+            ]
+
+    def get_many(self, ids: Iterable[Hashable]) -> Dict[Hashable, Any]:
+        """ID 목록 조회 - 누락분만 로더로 한 번에 가져와 병합"""
+        ids = list(dict.fromkeys(ids))
+        missing = self.missing_ids(ids)
+        if missing:
+            loaded = self.loader(missing) or {}
+            self.set_many({
+                entity_id: loaded.get(entity_id, self.default_factory() if self.default_factory else None)
+                for entity_id in missing
+            })
+        with self._lock:
+            return {entity_id: self._entries[entity_id][0] for entity_id in ids if entity_id in self._entries}
+
+    def set_many(self, values: Dict[Hashable, Any]):
+        """ID별 값 저장"""
+        now = time.time()
+        with self._lock:
+            for entity_id, value in values.items():
+                self._entries[entity_id] = (value, now)
+
+    def invalidate(self, ids: Optional[Iterable[Hashable]] = None):
+        """지정 ID (또는 전체) 캐시 무효화"""
+        with self._lock:
+            if ids is None:
+                self._entries.clear()
+                return
+            for entity_id in ids:
+                self._entries.pop(entity_id, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
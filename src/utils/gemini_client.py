@@ -11,6 +11,7 @@ from src.constants.categories import (
     DEFAULT_CATEGORY,
     LEGACY_CATEGORY_KEYWORDS,
 )
+from src.utils.llm_replay import llm_replay
 
 try:
     import google.generativeai as genai
@@ -211,6 +212,7 @@ def get_openai_client():
         return None
 
 
+@llm_replay("analyze_campaign_with_gemini")
 def analyze_campaign_with_gemini(campaign_content: str) -> Optional[Dict[str, Any]]:
     """
     캠페인 내용을 OpenAI 프롬프트 ID를 사용하여 분석
@@ -355,6 +357,7 @@ def analyze_campaign_with_gemini(campaign_content: str) -> Optional[Dict[str, An
         return None
 
 
+@llm_replay("generate_proposal_with_openai")
 def generate_proposal_with_openai(
     campaign_analysis_result: Dict[str, Any],
     influencer_analysis: Dict[str, Any]
@@ -422,6 +425,7 @@ def generate_proposal_with_openai(
         return None
 
 
+@llm_replay("generate_proposal_with_gemini")
 def generate_proposal_with_gemini(
     campaign_info: Dict[str, Any],
     influencer_analysis: Dict[str, Any]
@@ -0,0 +1,184 @@
+"""
+인플루언서 검색용 인메모리 n-gram 인덱스
+- sns_id / influencer_name을 정규화(@·공백 제거, 소문자)한 뒤 트라이그램 역색인 구성
+- 부분 문자열 검색: 검색어 트라이그램의 포스팅 목록 교집합 후 실제 포함 여부 확인
+- 오타 허용 검색: 공유 트라이그램 비율(유사도)로 후보 순위화
+- updated_at 워터마크 이후 변경분만 로더로 가져와 증분 반영
+"""
+import time
+import threading
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+
+def normalize_search_text(text: Optional[str]) -> str:
+    """검색 정규화: @와 공백 제거, 소문자"""
+    if not text:
+        return ""
+    return "".join(str(text).replace("@", "").split()).lower()
+
+
+def _trigrams(text: str, padded: bool = True) -> Set[str]:
+    """트라이그램 집합 (padded=True면 단어 경계 표시를 위해 앞뒤 공백 포함)"""
+    if padded:
+        text = f"  {text} "
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class InfluencerSearchIndex:
+    """sns_id / influencer_name 트라이그램 역색인
+
+    Args:
+        loader: updated_since(ISO 문자열 또는 None)를 받아 변경된 인플루언서 행 목록을 반환하는 함수
+            (각 행은 id, platform, sns_id, influencer_name, updated_at 포함)
+        refresh_interval: 증분 새로고침 최소 간격(초)
+        rebuild_interval: 전체 재구성 간격(초) - 삭제된 행 정리용
+    """
+
+    FIELDS = ("sns_id", "influencer_name")
+
+    def __init__(self, loader: Callable[[Optional[str]], List[Dict[str, Any]]],
+                 refresh_interval: float = 30, rebuild_interval: float = 3600):
+        self.loader = loader
+        self.refresh_interval = refresh_interval
+        self.rebuild_interval = rebuild_interval
+        self._docs: Dict[str, Dict[str, Any]] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        self._watermark: Optional[str] = None
+        self._refreshed_at = 0.0
+        self._built_at = 0.0
+        self._lock = threading.Lock()
+
+    # 색인 관리
+    def _remove(self, doc_id: str):
+        doc = self._docs.pop(doc_id, None)
+        if not doc:
+            return
+        for gram in doc["grams"]:
+            posting = self._postings.get(gram)
+            if posting:
+                posting.discard(doc_id)
+                if not posting:
+                    del self._postings[gram]
+
+    def _add(self, row: Dict[str, Any]):
+        doc_id = str(row["id"])
+        self._remove(doc_id)
+        keys = {field: normalize_search_text(row.get(field)) for field in self.FIELDS}
+        key_grams = [_trigrams(key) for key in keys.values() if key]
+        grams = set().union(*key_grams)
+        self._docs[doc_id] = {"platform": row.get("platform"), "keys": keys, "key_grams": key_grams, "grams": grams}
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(doc_id)
+
+    def refresh(self, force: bool = False):
+        """변경분 반영 (refresh_interval 이내 재호출은 무시, rebuild_interval마다 전체 재구성)"""
+        now = time.time()
+        with self._lock:
+            if not force and now - self._refreshed_at < self.refresh_interval:
+                return
+            rebuild = force or not self._docs or now - self._built_at >= self.rebuild_interval
+            since = None if rebuild else self._watermark
+            rows = self.loader(since) or []
+            if rebuild:
+                self._docs.clear()
+                self._postings.clear()
+                self._watermark = None
+                self._built_at = now
+            for row in rows:
+                self._add(row)
+                updated_at = row.get("updated_at")
+                if updated_at and (self._watermark is None or updated_at > self._watermark):
+                    self._watermark = updated_at
+            self._refreshed_at = now
+
+    def mark_stale(self):
+        """다음 검색에서 refresh_interval과 관계없이 증분 새로고침"""
+        with self._lock:
+            self._refreshed_at = 0.0
+
+    def invalidate(self, ids: Optional[Iterable[str]] = None):
+        """지정 ID (또는 전체) 제거 - 전체 제거 시 다음 검색에서 재구성"""
+        with self._lock:
+            if ids is None:
+                self._docs.clear()
+                self._postings.clear()
+                self._watermark = None
+                self._refreshed_at = 0.0
+                return
+            for doc_id in ids:
+                self._remove(str(doc_id))
+
+    # 검색
+    def _candidates(self, platform: Optional[str]) -> Iterable[str]:
+        if not platform:
+            return self._docs.keys()
+        return (doc_id for doc_id, doc in self._docs.items() if doc["platform"] == platform)
+
+    def search(self, term: str, platform: Optional[str] = None, limit: int = 20,
+               fuzzy: bool = True, min_similarity: float = 0.3) -> List[Dict[str, Any]]:
+        """정확/부분 일치 우선, 이어서 오타 허용 유사도 순으로 ID 목록 반환
+
+        Returns:
+            [{"id", "match": exact|prefix|substring|fuzzy, "score"}] (점수 내림차순)
+        """
+        query = normalize_search_text(term)
+        if not query:
+            return []
+        self.refresh()
+
+        with self._lock:
+            results: Dict[str, tuple] = {}
+
+            # 부분 문자열: 트라이그램 포스팅 교집합 (짧은 검색어는 메모리 문서 순회)
+            inner = _trigrams(query, padded=False)
+            if inner:
+                postings = sorted((self._postings.get(gram, set()) for gram in inner), key=len)
+                candidate_ids = set.intersection(*postings) if postings and postings[0] else set()
+                if platform:
+                    candidate_ids = {d for d in candidate_ids if self._docs[d]["platform"] == platform}
+            else:
+                candidate_ids = self._candidates(platform)
+
+            for doc_id in candidate_ids:
+                keys = self._docs[doc_id]["keys"].values()
+                if query in keys:
+                    results[doc_id] = ("exact", 3.0)
+                elif any(key.startswith(query) for key in keys):
+                    results[doc_id] = ("prefix", 2.0 + len(query) / max(len(k) for k in keys))
+                elif any(query in key for key in keys):
+                    results[doc_id] = ("substring", 1.0 + len(query) / max(len(k) for k in keys))
+
+            # 오타 허용: 공유 트라이그램 수 기반 유사도 (pg_trgm similarity와 같은 정의)
+            if fuzzy and len(results) < limit:
+                query_grams = _trigrams(query)
+                shared = Counter()
+                for gram in query_grams:
+                    for doc_id in self._postings.get(gram, ()):
+                        shared[doc_id] += 1
+                # 유사도 >= t 이려면 공유 트라이그램 수가 t × |검색어 트라이그램| 이상이어야 함
+                min_shared = min_similarity * len(query_grams)
+                for doc_id, count in shared.items():
+                    if doc_id in results or count < min_shared:
+                        continue
+                    doc = self._docs[doc_id]
+                    if platform and doc["platform"] != platform:
+                        continue
+                    best = 0.0
+                    for key_grams in doc["key_grams"]:
+                        common = len(query_grams & key_grams)
+                        best = max(best, common / (len(query_grams) + len(key_grams) - common))
+                    if best >= min_similarity:
+                        results[doc_id] = ("fuzzy", best)
+
+        ranked = sorted(results.items(), key=lambda item: item[1][1], reverse=True)[:limit]
+        return [{"id": doc_id, "match": match, "score": round(score, 3)} for doc_id, (match, score) in ranked]
+
+    def platform_counts(self) -> Dict[str, int]:
+        """플랫폼별 색인된 인플루언서 수"""
+        self.refresh()
+        with self._lock:
+            return dict(Counter(doc["platform"] or "unknown" for doc in self._docs.values()))
+
+    def __len__(self) -> int:
+        return len(self._docs)
@@ -0,0 +1,184 @@
+"""
+LLM 호출 기록/재생(record/replay) 유틸리티
+- LLM_REPLAY_MODE=record: 실제 응답을 픽스처 파일로 저장
+- LLM_REPLAY_MODE=replay: 네트워크 없이 픽스처 응답을 결정적으로 재생 (합성 지연 시간 적용)
+  - LLM_REPLAY_STRICT=1: 기록되지 않은 입력은 None 대신 FixtureNotFoundError 발생
+- 미설정/off: 기존과 동일하게 실제 API 호출
+"""
+import os
+import json
+import time
+import random
+import hashlib
+import functools
+import threading
+from typing import Any, Callable, Dict, Optional
+
+
+DEFAULT_FIXTURE_DIR = os.path.join("samples", "data", "llm_fixtures")
+
+_write_lock = threading.Lock()
+
+_stats_lock = threading.Lock()
+_replay_stats: Dict[str, Dict[str, int]] = {}
+
+
+class FixtureNotFoundError(LookupError):
+    """재생 모드에서 기록되지 않은 입력으로 호출된 경우 (엄격 모드)"""
+
+    def __init__(self, name: str, key: str):
+        super().__init__(f"기록되지 않은 LLM 입력: {name}/{key}")
+        self.name = name
+        self.key = key
+
+
+def get_replay_mode() -> str:
+    """기록/재생 모드 (off, record, replay)"""
+    mode = (os.getenv("LLM_REPLAY_MODE") or "off").strip().lower()
+    return mode if mode in ("record", "replay") else "off"
+
+
+def is_strict_replay() -> bool:
+    """기록되지 않은 입력을 오류로 처리할지 여부"""
+    return (os.getenv("LLM_REPLAY_STRICT") or "").strip().lower() in ("1", "true", "yes")
+
+
+def _count_replay(name: str, outcome: str):
+    with _stats_lock:
+        stats = _replay_stats.setdefault(name, {"hits": 0, "misses": 0})
+        stats[outcome] += 1
+
+
+def get_replay_stats() -> Dict[str, Dict[str, int]]:
+    """함수별 재생 적중/미기록 호출 수 ({name: {"hits": n, "misses": n}})"""
+    with _stats_lock:
+        return {name: dict(stats) for name, stats in _replay_stats.items()}
+
+
+def reset_replay_stats():
+    """재생 적중/미기록 호출 수 초기화"""
+    with _stats_lock:
+        _replay_stats.clear()
+
+
+def get_fixture_dir() -> str:
+    """픽스처 저장 경로"""
+    return os.getenv("LLM_REPLAY_DIR") or DEFAULT_FIXTURE_DIR
+
+
+def make_fixture_key(name: str, args: tuple, kwargs: Dict[str, Any]) -> str:
+    """함수명과 입력 인자로부터 결정적인 픽스처 키 생성"""
+    payload = json.dumps(
+        {"name": name, "args": args, "kwargs": kwargs},
+        ensure_ascii=False,
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _fixture_path(name: str, key: str) -> str:
+    return os.path.join(get_fixture_dir(), name, f"{key}.json")
+
+
+def load_fixture(name: str, key: str) -> Optional[Dict[str, Any]]:
+    """픽스처 로드 (없으면 None)"""
+    path = _fixture_path(name, key)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_fixture(name: str, key: str, args: tuple, kwargs: Dict[str, Any], result: Any, latency_ms: float):
+    """픽스처 저장 (동시 기록 시에도 파일이 깨지지 않도록 임시 파일 후 교체)
+
+    입력 인자도 함께 저장하여 벤치마크 스크립트가 같은 호출을 다시 재생할 수 있도록 함
+    """
+    path = _fixture_path(name, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fixture = {
+        "name": name,
+        "key": key,
+        "latency_ms": round(latency_ms, 1),
+        "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "args": list(args),
+        "kwargs": kwargs,
+        "result": result,
+    }
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    with _write_lock:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(fixture, f, ensure_ascii=False, indent=2, default=str)
+        os.replace(tmp_path, path)
+
+
+def iter_fixtures(name: str):
+    """기록된 픽스처 목록 순회 (벤치마크용)"""
+    fixture_dir = os.path.join(get_fixture_dir(), name)
+    if not os.path.isdir(fixture_dir):
+        return
+    for filename in sorted(os.listdir(fixture_dir)):
+        if filename.endswith(".json"):
+            with open(os.path.join(fixture_dir, filename), "r", encoding="utf-8") as f:
+                yield json.load(f)
+
+
+def get_synthetic_latency(key: str, recorded_latency_ms: float) -> float:
+    """재생 시 적용할 지연 시간(초)
+
+    - LLM_REPLAY_LATENCY_MS: 고정 지연(ms), 미설정 시 기록된 실제 지연 사용
+    - LLM_REPLAY_LATENCY_SCALE: 지연 배율 (기본 1.0, 0이면 지연 없음)
+    - LLM_REPLAY_JITTER_MS: 키 기반 시드로 결정적인 ±지터(ms)
+    """
+    try:
+        base_ms = float(os.getenv("LLM_REPLAY_LATENCY_MS", recorded_latency_ms or 0))
+        scale = float(os.getenv("LLM_REPLAY_LATENCY_SCALE", 1.0))
+        jitter_ms = float(os.getenv("LLM_REPLAY_JITTER_MS", 0))
+    except ValueError:
+        base_ms, scale, jitter_ms = recorded_latency_ms or 0, 1.0, 0
+    if jitter_ms:
+        base_ms += random.Random(key).uniform(-jitter_ms, jitter_ms)
+    return max(0.0, base_ms * scale) / 1000
+
+
+def llm_replay(name: str) -> Callable:
+    """LLM 호출 함수에 기록/재생 계층을 씌우는 데코레이터
+
+    Args:
+        name: 픽스처 하위 폴더명 (보통 함수명)
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            mode = get_replay_mode()
+            if mode == "off":
+                return func(*args, **kwargs)
+
+            key = make_fixture_key(name, args, kwargs)
+
+            if mode == "replay":
+                fixture = load_fixture(name, key)
+                if fixture is None:
+                    # 기록되지 않은 입력은 실패한 호출과 동일하게 처리 (네트워크 호출 없음)
+                    # 성공한 재생과 구분할 수 있도록 미기록 호출 수를 따로 집계
+                    _count_replay(name, "misses")
+                    if is_strict_replay():
+                        raise FixtureNotFoundError(name, key)
+                    return None
+                _count_replay(name, "hits")
+                time.sleep(get_synthetic_latency(key, fixture.get("latency_ms", 0)))
+                return fixture.get("result")
+
+            started = time.perf_counter()
+            result = func(*args, **kwargs)
+            latency_ms = (time.perf_counter() - started) * 1000
+            if result is not None:
+                try:
+                    save_fixture(name, key, args, kwargs, result, latency_ms)
+                except Exception:
+                    # 기록 실패가 실제 분석 흐름을 막지 않도록 무시
+                    pass
+            return result
+        return wrapper
+    return decorator
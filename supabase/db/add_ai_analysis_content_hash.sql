@@ -0,0 +1,23 @@
+-- ai_analysis_status 테이블에 분석 입력 해시 컬럼 추가
+-- 마지막 AI 분석에 사용된 (description + posts)의 SHA-256 해시를 저장하여
+-- 크롤링 데이터가 변경되지 않은 프로필은 재분석(LLM 호출) 없이 상태만 갱신
+
+alter table public.ai_analysis_status
+add column if not exists content_hash character varying(64) null;
+
+-- 컬럼 코멘트 추가
+comment on column public.ai_analysis_status.content_hash is '마지막 AI 분석 입력(description + posts)의 SHA-256 해시';
+
+-- 기존 분석 결과의 notes에 기록된 해시로 초기화 (있는 경우)
+update public.ai_analysis_status s
+set content_hash = latest.content_hash
+from (
+  select distinct on (influencer_id)
+    influencer_id,
+    notes ->> 'content_hash' as content_hash
+  from public.ai_influencer_analyses_new
+  where notes ? 'content_hash'
+  order by influencer_id, analyzed_at desc
+) latest
+where s.id = latest.influencer_id
+  and s.content_hash is null;
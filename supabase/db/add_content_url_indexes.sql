@@ -0,0 +1,10 @@
+-- 콘텐츠 성과 일괄 가져오기용 인덱스
+-- 업로드 파일의 content_url로 기존 콘텐츠와 참여(content_links)를 한 번에 매칭
+
+-- 기존 uq_participation_url (participation_id, content_url)은 URL 단독 조회에 사용되지 않음
+create index if not exists idx_cic_content_url
+  on public.campaign_influencer_contents using btree (content_url);
+
+-- content_links 배열 겹침(&&) 조회
+create index if not exists cip_content_links_gin_idx
+  on public.campaign_influencer_participations using gin (content_links);
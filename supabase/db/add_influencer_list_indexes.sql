@@ -0,0 +1,13 @@
+-- 인플루언서 목록 keyset 페이지네이션용 인덱스
+-- 목록은 기존과 같이 등록일 최신순 (created_at desc, id desc) 순서로 이전 페이지 마지막 행 이후만 조회하므로
+-- 플랫폼 필터 유무와 관계없이 정렬 순서 그대로 인덱스를 읽고 한 페이지에서 멈추도록 함
+
+create index if not exists idx_influencers_created_at_id
+  on public.connecta_influencers using btree (created_at desc, id desc);
+
+create index if not exists idx_influencers_platform_created_at_id
+  on public.connecta_influencers using btree (platform, created_at desc, id desc);
+
+-- 팔로워 수 순서로 페이지를 나누던 이전 버전의 인덱스 정리
+drop index if exists public.idx_influencers_followers_id;
+drop index if exists public.idx_influencers_platform_followers_id;
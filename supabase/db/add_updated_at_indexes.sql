@@ -0,0 +1,12 @@
+-- 성과 리포트 증분 새로고침용 updated_at 인덱스
+-- 리포트는 테이블별로 마지막으로 본 최대 updated_at(워터마크) 이후 수정된 행만 조회하므로
+-- 캠페인/참여 필터와 함께 updated_at 범위 조회가 인덱스를 타도록 함
+
+create index if not exists cip_campaign_updated_at_idx
+  on public.campaign_influencer_participations using btree (campaign_id, updated_at);
+
+create index if not exists idx_cic_participation_updated_at
+  on public.campaign_influencer_contents using btree (participation_id, updated_at);
+
+create index if not exists idx_cic_updated_at
+  on public.campaign_influencer_contents using btree (updated_at);
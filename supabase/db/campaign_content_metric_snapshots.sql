@@ -0,0 +1,161 @@
+-- 콘텐츠 성과 지표 이력 (append-only 스냅샷)
+-- campaign_influencer_contents는 최신 지표만 보관하므로, 지표가 바뀔 때마다
+-- (content_id, measured_at) 키의 정수 스냅샷을 추가하여 게시물별 성장 곡선을 조회
+-- - 지표가 바뀌지 않은 수정은 기록하지 않음 (트리거 when 조건)
+-- - 오래된 이력은 콘텐츠별 하루 마지막 스냅샷만 남기도록 압축 가능
+
+create table if not exists public.campaign_content_metric_snapshots (
+  content_id uuid not null,
+  measured_at timestamp with time zone not null default now(),
+  likes integer not null default 0,
+  comments integer not null default 0,
+  shares integer not null default 0,
+  views integer not null default 0,
+  clicks integer not null default 0,
+  conversions integer not null default 0,
+  constraint campaign_content_metric_snapshots_pkey primary key (content_id, measured_at),
+  constraint campaign_content_metric_snapshots_content_id_fkey foreign key (content_id) references campaign_influencer_contents (id) on delete cascade
+) with (fillfactor = 100) tablespace pg_default;  -- 추가 전용이므로 페이지를 꽉 채움
+
+comment on table public.campaign_content_metric_snapshots is '콘텐츠 성과 지표 변경 이력 (추가 전용, 변경 없는 스냅샷 제외)';
+
+-- 콘텐츠 지표 스냅샷 기록 트리거 함수
+create or replace function _record_content_metric_snapshot()
+returns trigger
+language plpgsql
+security definer
+set search_path = public
+as $$
+begin
+  insert into public.campaign_content_metric_snapshots (
+    content_id, measured_at, likes, comments, shares, views, clicks, conversions
+  )
+  values (
+    new.id, now(), new.likes, new.comments, new.shares, new.views, new.clicks, new.conversions
+  )
+  on conflict (content_id, measured_at) do update set
+    likes = excluded.likes,
+    comments = excluded.comments,
+    shares = excluded.shares,
+    views = excluded.views,
+    clicks = excluded.clicks,
+    conversions = excluded.conversions;
+  return null;
+end;
+$$;
+
+drop trigger if exists trg_cic_metric_snapshot_insert on public.campaign_influencer_contents;
+create trigger trg_cic_metric_snapshot_insert
+after insert on public.campaign_influencer_contents
+for each row execute function _record_content_metric_snapshot();
+
+-- 지표 컬럼이 실제로 바뀐 경우에만 스냅샷 추가 (중복 스냅샷 방지)
+drop trigger if exists trg_cic_metric_snapshot_update on public.campaign_influencer_contents;
+create trigger trg_cic_metric_snapshot_update
+after update of likes, comments, shares, views, clicks, conversions on public.campaign_influencer_contents
+for each row
+when (
+  (old.likes, old.comments, old.shares, old.views, old.clicks, old.conversions)
+  is distinct from
+  (new.likes, new.comments, new.shares, new.views, new.clicks, new.conversions)
+)
+execute function _record_content_metric_snapshot();
+
+-- 여러 콘텐츠의 성장 곡선 조회 (버킷별 마지막 스냅샷으로 다운샘플링)
+-- p_bucket: 'raw' | 'hour' | 'day' | 'week' | 'month' (UTC 기준)
+create or replace function get_content_metric_history(
+  p_content_ids uuid[],
+  p_bucket text default 'day',
+  p_start timestamp with time zone default null,
+  p_end timestamp with time zone default null
+)
+returns table (
+  content_id uuid,
+  measured_at timestamp with time zone,
+  likes integer,
+  comments integer,
+  shares integer,
+  views integer,
+  clicks integer,
+  conversions integer
+)
+language sql
+stable
+as $$
+  select distinct on (
+    s.content_id,
+    case when p_bucket = 'raw' then s.measured_at
+         else date_trunc(
+           case when p_bucket in ('hour', 'day', 'week', 'month') then p_bucket else 'day' end,
+           s.measured_at at time zone 'UTC'
+         ) at time zone 'UTC'
+    end
+  )
+    s.content_id, s.measured_at, s.likes, s.comments, s.shares, s.views, s.clicks, s.conversions
+  from public.campaign_content_metric_snapshots s
+  where s.content_id = any (p_content_ids)
+    and (p_start is null or s.measured_at >= p_start)
+    and (p_end is null or s.measured_at < p_end)
+  order by
+    s.content_id,
+    case when p_bucket = 'raw' then s.measured_at
+         else date_trunc(
+           case when p_bucket in ('hour', 'day', 'week', 'month') then p_bucket else 'day' end,
+           s.measured_at at time zone 'UTC'
+         ) at time zone 'UTC'
+    end,
+    s.measured_at desc;
+$$;
+
+-- 오래된 이력 압축: p_older_than 이전 스냅샷은 콘텐츠별 하루 마지막 값만 유지
+create or replace function compact_content_metric_snapshots(p_older_than interval default interval '90 days')
+returns integer
+language plpgsql
+security definer
+set search_path = public
+as $$
+declare
+  deleted_count integer;
+begin
+  delete from public.campaign_content_metric_snapshots s
+  using (
+    select content_id, measured_at,
+      row_number() over (
+        partition by content_id, date_trunc('day', measured_at at time zone 'UTC')
+        order by measured_at desc
+      ) as rn
+    from public.campaign_content_metric_snapshots
+    where measured_at < now() - p_older_than
+  ) old_rows
+  where s.content_id = old_rows.content_id
+    and s.measured_at = old_rows.measured_at
+    and old_rows.rn > 1;
+  get diagnostics deleted_count = row_count;
+  return deleted_count;
+end;
+$$;
+
+-- security definer 삭제 함수이므로 API 역할에서 직접 호출하지 못하도록 제한 (관리자/스케줄러만 실행)
+revoke execute on function compact_content_metric_snapshots(interval) from public, anon, authenticated;
+
+-- RLS: 조회 권한은 원본 콘텐츠 접근 권한을 따름 (쓰기는 트리거만 수행)
+alter table public.campaign_content_metric_snapshots enable row level security;
+
+drop policy if exists "Users can view snapshots of accessible contents" on public.campaign_content_metric_snapshots;
+create policy "Users can view snapshots of accessible contents"
+  on public.campaign_content_metric_snapshots
+  for select
+  using (
+    exists (
+      select 1 from public.campaign_influencer_contents c
+      where c.id = campaign_content_metric_snapshots.content_id
+    )
+  );
+
+-- 기존 콘텐츠의 현재 지표를 첫 스냅샷으로 기록
+insert into public.campaign_content_metric_snapshots (
+  content_id, measured_at, likes, comments, shares, views, clicks, conversions
+)
+select id, updated_at, likes, comments, shares, views, clicks, conversions
+from public.campaign_influencer_contents
+on conflict (content_id, measured_at) do nothing;
@@ -0,0 +1,243 @@
+-- 캠페인 × 플랫폼별 성과 롤업 테이블
+-- 종합 대시보드/캠페인 목록이 원본 참여·콘텐츠 행 대신 캠페인당 수 개의 롤업 행만 읽도록
+-- 참여(campaign_influencer_participations) / 콘텐츠(campaign_influencer_contents) 변경 시
+-- 문장 단위 트리거로 영향받은 캠페인의 롤업만 다시 계산
+
+create table if not exists public.campaign_performance_rollups (
+  campaign_id uuid not null,
+  platform text not null,
+  participants integer not null default 0,
+  uploaded integer not null default 0,
+  content_count integer not null default 0,
+  likes bigint not null default 0,
+  comments bigint not null default 0,
+  shares bigint not null default 0,
+  views bigint not null default 0,
+  clicks bigint not null default 0,
+  conversions bigint not null default 0,
+  cost_krw numeric(16, 2) not null default 0,
+  -- 참여율: (좋아요 + 댓글) / 조회수 × 100
+  engagement_rate numeric(10, 2) generated always as (
+    case when views > 0 then round((likes + comments)::numeric / views * 100, 2) else 0 end
+  ) stored,
+  created_by uuid null,
+  updated_at timestamp with time zone not null default now(),
+  constraint campaign_performance_rollups_pkey primary key (campaign_id, platform),
+  constraint campaign_performance_rollups_campaign_id_fkey foreign key (campaign_id) references campaigns (id) on delete cascade
+) tablespace pg_default;
+
+comment on table public.campaign_performance_rollups is '캠페인 × 플랫폼별 참여/콘텐츠 성과 합계 (트리거로 유지)';
+
+-- 캠페인 1개의 롤업 재계산
+-- 같은 캠페인을 동시에 재계산하는 트랜잭션(동시 트리거 등)이 PK 충돌 없이 순서대로 반영되도록
+-- 캠페인 단위 트랜잭션 advisory lock을 잡고 upsert 후 더 이상 없는 플랫폼 행만 삭제
+create or replace function refresh_campaign_performance_rollup(p_campaign_id uuid)
+returns void
+language plpgsql
+security definer
+set search_path = public
+as $$
+begin
+  perform pg_advisory_xact_lock(hashtext(p_campaign_id::text));
+
+  insert into public.campaign_performance_rollups (
+    campaign_id, platform, participants, uploaded, content_count,
+    likes, comments, shares, views, clicks, conversions, cost_krw, created_by, updated_at
+  )
+  select
+    p.campaign_id,
+    i.platform::text,
+    count(*)::integer,
+    count(*) filter (where p.content_uploaded)::integer,
+    coalesce(sum(c.content_count), 0)::integer,
+    coalesce(sum(c.likes), 0),
+    coalesce(sum(c.comments), 0),
+    coalesce(sum(c.shares), 0),
+    coalesce(sum(c.views), 0),
+    coalesce(sum(c.clicks), 0),
+    coalesce(sum(c.conversions), 0),
+    coalesce(sum(p.cost_krw), 0),
+    max(cp.created_by::text)::uuid,
+    now()
+  from public.campaign_influencer_participations p
+  join public.connecta_influencers i on i.id = p.influencer_id
+  join public.campaigns cp on cp.id = p.campaign_id
+  -- 참여 단위로 콘텐츠를 먼저 합산해야 비용(cost_krw)이 콘텐츠 수만큼 중복되지 않음
+  left join (
+    select
+      participation_id,
+      count(*) as content_count,
+      sum(likes) as likes,
+      sum(comments) as comments,
+      sum(shares) as shares,
+      sum(views) as views,
+      sum(clicks) as clicks,
+      sum(conversions) as conversions
+    from public.campaign_influencer_contents
+    group by participation_id
+  ) c on c.participation_id = p.id
+  where p.campaign_id = p_campaign_id
+  group by p.campaign_id, i.platform
+  on conflict (campaign_id, platform) do update set
+    participants = excluded.participants,
+    uploaded = excluded.uploaded,
+    content_count = excluded.content_count,
+    likes = excluded.likes,
+    comments = excluded.comments,
+    shares = excluded.shares,
+    views = excluded.views,
+    clicks = excluded.clicks,
+    conversions = excluded.conversions,
+    cost_krw = excluded.cost_krw,
+    created_by = excluded.created_by,
+    updated_at = excluded.updated_at;
+
+  -- 참여가 모두 빠진 플랫폼 행 정리
+  delete from public.campaign_performance_rollups r
+  where r.campaign_id = p_campaign_id
+    and not exists (
+      select 1
+      from public.campaign_influencer_participations p
+      join public.connecta_influencers i on i.id = p.influencer_id
+      where p.campaign_id = p_campaign_id
+        and i.platform::text = r.platform
+    );
+end;
+$$;
+
+-- 전체 롤업 재계산 (최초 적용 / 인플루언서 플랫폼 변경 등 트리거 밖 변경 반영용)
+create or replace function refresh_all_campaign_performance_rollups()
+returns void
+language plpgsql
+security definer
+set search_path = public
+as $$
+declare
+  r record;
+begin
+  -- 캠페인 삭제 시 롤업은 FK cascade로 삭제되므로 캠페인별 재계산만 수행
+  for r in select id from public.campaigns loop
+    perform refresh_campaign_performance_rollup(r.id);
+  end loop;
+end;
+$$;
+
+-- 재계산 함수는 security definer이므로 API 역할에서 직접 호출하지 못하도록 제한
+-- (트리거 함수는 소유자 권한으로 실행되므로 영향 없음)
+revoke execute on function refresh_campaign_performance_rollup(uuid) from public, anon, authenticated;
+revoke execute on function refresh_all_campaign_performance_rollups() from public, anon, authenticated;
+
+-- 참여 변경 트리거: 변경된 행들의 캠페인만 재계산 (문장 단위, 대량 수정도 캠페인당 1회)
+create or replace function _rollup_on_participations_change()
+returns trigger
+language plpgsql
+security definer
+set search_path = public
+as $$
+declare
+  r record;
+begin
+  if tg_op = 'INSERT' then
+    for r in select distinct campaign_id from new_rows loop
+      perform refresh_campaign_performance_rollup(r.campaign_id);
+    end loop;
+  elsif tg_op = 'UPDATE' then
+    for r in select campaign_id from new_rows union select campaign_id from old_rows loop
+      perform refresh_campaign_performance_rollup(r.campaign_id);
+    end loop;
+  else
+    for r in select distinct campaign_id from old_rows loop
+      perform refresh_campaign_performance_rollup(r.campaign_id);
+    end loop;
+  end if;
+  return null;
+end;
+$$;
+
+-- 콘텐츠 변경 트리거: 콘텐츠가 속한 참여의 캠페인만 재계산
+create or replace function _rollup_on_contents_change()
+returns trigger
+language plpgsql
+security definer
+set search_path = public
+as $$
+declare
+  r record;
+begin
+  if tg_op = 'INSERT' then
+    for r in
+      select distinct p.campaign_id
+      from new_rows n join public.campaign_influencer_participations p on p.id = n.participation_id
+    loop
+      perform refresh_campaign_performance_rollup(r.campaign_id);
+    end loop;
+  elsif tg_op = 'UPDATE' then
+    for r in
+      select p.campaign_id
+      from (select participation_id from new_rows union select participation_id from old_rows) x
+      join public.campaign_influencer_participations p on p.id = x.participation_id
+      group by p.campaign_id
+    loop
+      perform refresh_campaign_performance_rollup(r.campaign_id);
+    end loop;
+  else
+    -- 참여 삭제에 따른 cascade 삭제면 참여 트리거에서 처리됨
+    for r in
+      select distinct p.campaign_id
+      from old_rows o join public.campaign_influencer_participations p on p.id = o.participation_id
+    loop
+      perform refresh_campaign_performance_rollup(r.campaign_id);
+    end loop;
+  end if;
+  return null;
+end;
+$$;
+
+-- 전이 테이블(transition table)은 트리거당 이벤트 1개만 허용되므로 이벤트별로 생성
+drop trigger if exists trg_cip_rollup_insert on public.campaign_influencer_participations;
+create trigger trg_cip_rollup_insert
+after insert on public.campaign_influencer_participations
+referencing new table as new_rows
+for each statement execute function _rollup_on_participations_change();
+
+drop trigger if exists trg_cip_rollup_update on public.campaign_influencer_participations;
+create trigger trg_cip_rollup_update
+after update on public.campaign_influencer_participations
+referencing new table as new_rows old table as old_rows
+for each statement execute function _rollup_on_participations_change();
+
+drop trigger if exists trg_cip_rollup_delete on public.campaign_influencer_participations;
+create trigger trg_cip_rollup_delete
+after delete on public.campaign_influencer_participations
+referencing old table as old_rows
+for each statement execute function _rollup_on_participations_change();
+
+drop trigger if exists trg_cic_rollup_insert on public.campaign_influencer_contents;
+create trigger trg_cic_rollup_insert
+after insert on public.campaign_influencer_contents
+referencing new table as new_rows
+for each statement execute function _rollup_on_contents_change();
+
+drop trigger if exists trg_cic_rollup_update on public.campaign_influencer_contents;
+create trigger trg_cic_rollup_update
+after update on public.campaign_influencer_contents
+referencing new table as new_rows old table as old_rows
+for each statement execute function _rollup_on_contents_change();
+
+drop trigger if exists trg_cic_rollup_delete on public.campaign_influencer_contents;
+create trigger trg_cic_rollup_delete
+after delete on public.campaign_influencer_contents
+referencing old table as old_rows
+for each statement execute function _rollup_on_contents_change();
+
+-- RLS: 캠페인 소유자만 조회 (쓰기는 security definer 트리거 함수만 수행)
+alter table public.campaign_performance_rollups enable row level security;
+
+drop policy if exists "Users can view their own campaign rollups" on public.campaign_performance_rollups;
+create policy "Users can view their own campaign rollups"
+  on public.campaign_performance_rollups
+  for select
+  using (created_by is null or created_by = auth.uid());
+
+-- 기존 데이터로 초기화
+select refresh_all_campaign_performance_rollups();
@@ -0,0 +1,63 @@
+-- 콘텐츠 성과 시계열 롤업 (일/주/월 버킷)
+-- 성과 리포트의 트렌드 차트가 콘텐츠 행 전체 대신 선택 기간의 버킷 합계만 조회하도록
+-- 캠페인 × 플랫폼 × 기간 버킷별로 서버에서 집계
+
+-- 기간 필터/버킷 집계용 인덱스
+create index if not exists idx_cic_posted_at
+  on public.campaign_influencer_contents using btree (posted_at);
+
+create index if not exists idx_cic_participation_posted_at
+  on public.campaign_influencer_contents using btree (participation_id, posted_at);
+
+-- p_bucket: 'day' | 'week' | 'month' (버킷 시작 시각은 UTC 기준)
+-- p_start / p_end: 업로드일(posted_at) 범위, null이면 제한 없음 (p_end는 미포함)
+create or replace function get_content_metric_trend(
+  p_campaign_ids uuid[],
+  p_bucket text default 'day',
+  p_start timestamp with time zone default null,
+  p_end timestamp with time zone default null
+)
+returns table (
+  bucket_start timestamp without time zone,
+  campaign_id uuid,
+  platform text,
+  content_count integer,
+  likes bigint,
+  comments bigint,
+  shares bigint,
+  views bigint,
+  clicks bigint,
+  conversions bigint
+)
+language sql
+stable
+-- security invoker: 호출한 사용자의 RLS 정책이 그대로 적용됨
+as $$
+  select
+    date_trunc(
+      case when p_bucket in ('day', 'week', 'month') then p_bucket else 'day' end,
+      c.posted_at at time zone 'UTC'
+    ) as bucket_start,
+    p.campaign_id,
+    i.platform::text as platform,
+    count(*)::integer as content_count,
+    sum(c.likes)::bigint as likes,
+    sum(c.comments)::bigint as comments,
+    sum(c.shares)::bigint as shares,
+    sum(c.views)::bigint as views,
+    sum(c.clicks)::bigint as clicks,
+    sum(c.conversions)::bigint as conversions
+  from public.campaign_influencer_contents c
+  join public.campaign_influencer_participations p on p.id = c.participation_id
+  join public.connecta_influencers i on i.id = p.influencer_id
+  where p.campaign_id = any (p_campaign_ids)
+    and c.posted_at is not null
+    and (p_start is null or c.posted_at >= p_start)
+    and (p_end is null or c.posted_at < p_end)
+  group by 1, p.campaign_id, i.platform
+  -- 클라이언트가 range()로 페이지 조회하므로 행 순서가 고정되도록 그룹 키 전체로 정렬
+  order by 1, p.campaign_id, i.platform;
+$$;
+
+comment on function get_content_metric_trend(uuid[], text, timestamp with time zone, timestamp with time zone)
+  is '캠페인 × 플랫폼 × 기간 버킷별 콘텐츠 성과 합계 (성과 리포트 트렌드 차트용)';
@@ -0,0 +1,34 @@
+-- 인플루언서 플랫폼 × 카테고리 집계
+-- 인플루언서 통계 화면의 카테고리/플랫폼별 분석이 전체 행 대신 그룹별 합계만 조회하도록 서버에서 집계
+-- (카테고리별/플랫폼별 값은 이 결과를 한 번 더 합산해서 계산)
+
+create or replace function get_influencer_group_stats()
+returns table (
+  platform text,
+  content_category text,
+  influencer_count integer,
+  active_count integer,
+  total_followers bigint,
+  total_price numeric,
+  rating_sum bigint,
+  rating_count integer
+)
+language sql
+stable
+-- security invoker: 호출한 사용자의 RLS 정책이 그대로 적용됨
+as $$
+  select
+    i.platform::text as platform,
+    i.content_category,
+    count(*)::integer as influencer_count,
+    count(*) filter (where i.active)::integer as active_count,
+    coalesce(sum(i.followers_count), 0)::bigint as total_followers,
+    coalesce(sum(i.price_krw), 0) as total_price,
+    coalesce(sum(i.manager_rating), 0)::bigint as rating_sum,
+    count(i.manager_rating)::integer as rating_count
+  from public.connecta_influencers i
+  group by i.platform, i.content_category;
+$$;
+
+comment on function get_influencer_group_stats()
+  is '플랫폼 × 카테고리별 인플루언서 수/활성 수/팔로워·가격 합계/매니저 평점 합계 (인플루언서 통계 화면용)';
@@ -0,0 +1,106 @@
+-- 인플루언서 검색 + 최신 AI 분석 서버 조인
+-- 인플루언서 검색 화면이 필터된 인플루언서와 AI 분석 전체를 따로 받아 Python에서 조인하던 것을
+-- (platform, sns_id = alias) 기준 최신 분석 1건을 서버에서 붙이고 점수 범위까지 SQL로 적용하여
+-- 조건에 맞는 행의 표시용 컬럼만 반환
+-- 최신 분석 기준은 latest_ai_analysis 뷰(latest_ai_analysis.sql)를 그대로 사용하므로 해당 뷰를 먼저 적용
+
+-- 인플루언서별 최신 분석 조회용 인덱스 (뷰의 distinct on 키와 같아 lateral 조인에서 한 행만 읽고 멈춤)
+create index if not exists idx_ai_analyses_new_platform_alias_analyzed_at
+  on public.ai_influencer_analyses_new using btree (platform, alias, analyzed_at desc);
+
+-- p_category: 콘텐츠 카테고리 (null이면 전체)
+-- p_tag_keywords: 태그 키워드 목록, 하나라도 포함되면 일치 (null/빈 배열이면 제한 없음)
+-- p_min_followers / p_max_followers: 팔로워 수 범위 (null이면 제한 없음)
+-- p_overall_min ~ p_growth_max: 총점/성장성 점수 범위 (0~10)
+--   분석 결과가 있으면 점수가 null이거나 범위 안인 경우만 포함
+--   분석 결과가 없으면 점수 범위가 기본값(0~10)일 때만 포함
+create or replace function search_influencers_with_analysis(
+  p_category text default null,
+  p_tag_keywords text[] default null,
+  p_min_followers bigint default null,
+  p_max_followers bigint default null,
+  p_overall_min numeric default 0,
+  p_overall_max numeric default 10,
+  p_growth_min numeric default 0,
+  p_growth_max numeric default 10,
+  p_limit integer default null
+)
+returns table (
+  id uuid,
+  sns_id text,
+  influencer_name text,
+  platform text,
+  content_category text,
+  followers_count bigint,
+  tags text,
+  price_krw numeric,
+  active boolean,
+  analysis_id uuid,
+  overall_score numeric,
+  growth_potential_score numeric,
+  engagement_score numeric,
+  activity_score numeric,
+  communication_score numeric,
+  analyzed_at timestamp with time zone
+)
+language sql
+stable
+-- security invoker: 호출한 사용자의 RLS 정책이 그대로 적용됨
+as $$
+  select
+    i.id,
+    i.sns_id,
+    i.influencer_name,
+    i.platform::text as platform,
+    i.content_category,
+    i.followers_count,
+    i.tags,
+    i.price_krw,
+    i.active,
+    a.id as analysis_id,
+    a.overall_score,
+    a.growth_potential_score,
+    a.engagement_score,
+    a.activity_score,
+    a.communication_score,
+    a.analyzed_at
+  from public.connecta_influencers i
+  left join lateral (
+    select
+      an.id,
+      an.overall_score,
+      an.growth_potential_score,
+      an.engagement_score,
+      an.activity_score,
+      an.communication_score,
+      an.analyzed_at
+    from public.latest_ai_analysis an
+    where an.platform = i.platform
+      and an.alias = i.sns_id
+  ) a on true
+  where (p_category is null or i.content_category = p_category)
+    and (p_min_followers is null or i.followers_count >= p_min_followers)
+    and (p_max_followers is null or i.followers_count <= p_max_followers)
+    and (
+      coalesce(cardinality(p_tag_keywords), 0) = 0
+      or exists (
+        select 1
+        from unnest(p_tag_keywords) as kw
+        where i.tags ilike '%' || kw || '%'
+      )
+    )
+    and (
+      case
+        when a.id is null then
+          p_overall_min <= 0 and p_overall_max >= 10 and p_growth_min <= 0 and p_growth_max >= 10
+        else
+          (a.overall_score is null or a.overall_score between p_overall_min and p_overall_max)
+          and (a.growth_potential_score is null or a.growth_potential_score between p_growth_min and p_growth_max)
+      end
+    )
+  order by i.followers_count desc, i.id
+  limit p_limit;
+$$;
+
+comment on function search_influencers_with_analysis(text, text[], bigint, bigint, numeric, numeric, numeric, numeric, integer)
+  is '인플루언서 검색 + (platform, alias) 기준 최신 AI 분석 조인 및 점수 범위 필터 (표시용 컬럼만 반환)';
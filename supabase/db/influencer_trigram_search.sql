@@ -0,0 +1,83 @@
+-- 인플루언서 SNS ID / 별칭 트라이그램 검색
+-- ilike '%검색어%' 부분 검색은 btree 인덱스를 사용할 수 없어 테이블 전체를 읽으므로
+-- pg_trgm GIN 인덱스로 부분 검색과 오타 허용(유사도) 검색을 모두 인덱스로 처리하고
+-- 정확 > 접두 > 부분 > 유사 일치 순으로 순위를 매겨 상위 p_limit 건만 반환
+
+create extension if not exists pg_trgm;
+
+-- 부분 검색(ilike)과 유사도 연산자(%)는 connecta_influencers.sql에 이미 있는 트라이그램 인덱스를 사용
+-- (idx_connecta_influencers_snsid_trgm, idx_connecta_influencers_name_trgm - 같은 컬럼에 중복 생성하지 않음)
+-- 캠페인 참여 목록의 SNS ID ilike 조인 필터도 idx_connecta_influencers_snsid_trgm을 사용
+
+-- p_term: 검색어 (@·공백 제거, 소문자로 정규화 / _ % 는 와일드카드가 아닌 문자로 취급)
+-- p_platform: 플랫폼 제한 (null이면 전체)
+-- p_min_similarity: 오타 허용 검색의 최소 유사도 (pg_trgm similarity 기준)
+-- p_fuzzy: false면 부분 문자열 일치만 반환
+-- p_sns_id_only: true면 SNS ID만 검색 (별칭 제외)
+-- p_campaign_id: 지정 시 해당 캠페인 참여 인플루언서로 제한
+create or replace function search_influencers(
+  p_term text,
+  p_platform text default null,
+  p_limit integer default 20,
+  p_min_similarity real default 0.3,
+  p_fuzzy boolean default true,
+  p_sns_id_only boolean default false,
+  p_campaign_id uuid default null
+)
+returns setof public.connecta_influencers
+language plpgsql
+stable
+-- security invoker: 호출한 사용자의 RLS 정책이 그대로 적용됨
+as $$
+declare
+  v_term text := lower(regexp_replace(replace(coalesce(p_term, ''), '@', ''), '\s', '', 'g'));
+  v_escaped text;
+begin
+  if v_term = '' then
+    return;
+  end if;
+
+  v_escaped := replace(replace(replace(v_term, '\', '\\'), '%', '\%'), '_', '\_');
+  -- % 연산자가 인덱스를 사용하면서 p_min_similarity를 기준으로 하도록 현재 트랜잭션에만 적용
+  perform set_config('pg_trgm.similarity_threshold', p_min_similarity::text, true);
+
+  return query
+  select i.*
+  from public.connecta_influencers i
+  cross join lateral (
+    select
+      lower(replace(i.sns_id, '@', '')) as sns_key,
+      case when p_sns_id_only then '' else lower(coalesce(i.influencer_name, '')) end as name_key
+  ) k
+  where (p_platform is null or i.platform::text = p_platform)
+    and (
+      p_campaign_id is null
+      or exists (
+        select 1
+        from public.campaign_influencer_participations p
+        where p.campaign_id = p_campaign_id
+          and p.influencer_id = i.id
+      )
+    )
+    and (
+      i.sns_id ilike '%' || v_escaped || '%'
+      or (not p_sns_id_only and i.influencer_name ilike '%' || v_escaped || '%')
+      or (p_fuzzy and i.sns_id % v_term)
+      or (p_fuzzy and not p_sns_id_only and i.influencer_name % v_term)
+    )
+  order by
+    case
+      when k.sns_key = v_term or k.name_key = v_term then 3
+      when k.sns_key like v_escaped || '%' or k.name_key like v_escaped || '%' then 2
+      when i.sns_id ilike '%' || v_escaped || '%' or (not p_sns_id_only and i.influencer_name ilike '%' || v_escaped || '%') then 1
+      else 0
+    end
+    + greatest(similarity(k.sns_key, v_term), similarity(k.name_key, v_term)) desc,
+    i.followers_count desc,
+    i.id
+  limit greatest(coalesce(p_limit, 20), 1);
+end;
+$$;
+
+comment on function search_influencers(text, text, integer, real, boolean, boolean, uuid)
+  is '인플루언서 SNS ID/별칭 트라이그램 검색 (정확 > 접두 > 부분 > 유사 일치 순, 상위 p_limit건)';
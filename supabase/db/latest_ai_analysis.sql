@@ -0,0 +1,24 @@
+-- 인플루언서별 최신 AI 분석 뷰
+-- ai_influencer_analyses_new는 인플루언서마다 분석일(analyzed_on)별로 여러 행이 쌓이므로
+-- 통계/매칭/상관관계 분석이 전체 행을 읽으면 조회량이 늘고 같은 인플루언서가 중복 집계됨
+-- (platform, alias)별 analyzed_at이 가장 최근인 1건만 노출
+-- 인플루언서 검색 RPC(search_influencers_with_analysis)도 이 뷰를 조인하므로 "최신 분석" 기준은 이 뷰 하나로 통일
+-- (influencer_id는 크롤링 ID라 여러 프로필이 'unknown'일 수 있어 키로 사용하지 않음)
+
+-- distinct on 정렬 순서 그대로 읽는 인덱스
+-- (influencer_search_with_analysis.sql과 같은 인덱스 - 어느 파일을 먼저 적용해도 한 번만 생성)
+create index if not exists idx_ai_analyses_new_platform_alias_analyzed_at
+  on public.ai_influencer_analyses_new using btree (platform, alias, analyzed_at desc);
+
+-- security_invoker: 뷰를 조회한 사용자의 RLS 정책이 원본 테이블에 그대로 적용됨
+-- 클라이언트는 offset 대신 (platform, alias) 키셋으로 페이지를 조회하여 매 페이지 앞부분을 다시 계산하지 않음
+create or replace view public.latest_ai_analysis
+with (security_invoker = true)
+as
+select distinct on (a.platform, a.alias)
+  a.*
+from public.ai_influencer_analyses_new a
+order by a.platform, a.alias, a.analyzed_at desc;
+
+comment on view public.latest_ai_analysis
+  is '인플루언서(platform, alias)별 최신 AI 분석 1건 (통계/매칭/검색용)';